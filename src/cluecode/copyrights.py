@@ -12,7 +12,10 @@ import os
 import re
 import string
 import sys
+from bisect import bisect_right
 from collections import deque
+from itertools import chain
+from itertools import islice
 from time import time
 
 import attr
@@ -25,6 +28,7 @@ from commoncode.text import toascii
 from commoncode.text import unixlinesep
 
 from cluecode import copyrights_hint
+from cluecode.copyrights_lexer import CopyrightLexer
 
 # Tracing flags
 TRACE = False or os.environ.get('SCANCODE_DEBUG_COPYRIGHT', False)
@@ -39,6 +43,15 @@ TRACE_TOK = False or os.environ.get('SCANCODE_DEBUG_COPYRIGHT_TOKEN', False)
 
 VALIDATE = False or os.environ.get('SCANCODE_DEBUG_COPYRIGHT_VALIDATE', False)
 
+# Set to False to prepare and check every line when selecting candidate lines
+# rather than only the lines with some candidate hints.
+USE_CANDIDATE_HINTS = True
+
+# Set to False to lex tokens with the plain pygmars Lexer that tries all the
+# patterns in sequence rather than only the patterns that can match the first
+# character of a token.
+USE_COPYRIGHT_LEXER = True
+
 
 # Tracing flags
 def logger_debug(*args):
@@ -129,6 +142,16 @@ def detect_copyrights(
 DETECTOR = None
 
 
+def get_detector():
+    """
+    Return the shared CopyrightDetector, built on first use.
+    """
+    global DETECTOR
+    if not DETECTOR:
+        DETECTOR = CopyrightDetector()
+    return DETECTOR
+
+
 def detect_copyrights_from_lines(
     numbered_lines,
     include_copyrights=True,
@@ -158,12 +181,7 @@ def detect_copyrights_from_lines(
     include_copyright_years = include_copyrights and include_copyright_years
     include_copyright_allrights = include_copyrights and include_copyright_allrights
 
-    global DETECTOR
-
-    if not DETECTOR:
-        DETECTOR = detector = CopyrightDetector()
-    else:
-        detector = DETECTOR
+    detector = get_detector()
 
     candidate_lines_groups = candidate_lines(numbered_lines)
 
@@ -214,7 +232,10 @@ class CopyrightDetector(object):
     """
 
     def __init__(self):
-        self.lexer = lex.Lexer(patterns)
+        if USE_COPYRIGHT_LEXER:
+            self.lexer = CopyrightLexer(patterns)
+        else:
+            self.lexer = lex.Lexer(patterns)
         self.parser = parse.Parser(grammar, trace=TRACE_DEEP, validate=VALIDATE)
 
     def detect(self,
@@ -3857,6 +3878,98 @@ def is_end_of_statement(chars_only_line):
 has_trailing_year = re.compile(r'(?:19\d\d|20[0-4]\d)+$').findall
 
 
+def build_candidate_hints_finder(markers=copyrights_hint.statement_markers):
+    """
+    Return a regex finditer callable that finds the hints that a lowercased
+    line of raw, unprepared text may be a candidate line or an end of statement.
+    Any ASCII line that is a candidate or an end of statement once prepared
+    contains a hint.
+    """
+    hints = [
+        # years
+        r'19[6-9][0-9]',
+        r'20[0-9][0-9]',
+        # the sources of a (c) copyright sign once prepared
+        re.escape('&copy'),
+        re.escape('\\a9'),
+        # removed without a space
+        re.escape('\\xc2'),
+        # debian-style <s></s> tags
+        re.escape('s>'),
+        # "rights reserved" end of statement, possibly with punctuations
+        '[^a-z0-9]*'.join('reserv'),
+    ]
+    for marker in markers:
+        if not marker.isascii():
+            continue
+        if marker.endswith(' '):
+            # a trailing space may be any character prepared as a space
+            hints.append(re.escape(marker.rstrip()) + '[^a-z0-9]')
+        else:
+            hints.append(re.escape(marker))
+
+    # all hints start with a literal such that the regex engine can skip
+    # quickly over the text that cannot start a hint
+    return re.compile('|'.join(hints)).finditer
+
+
+find_candidate_hints = build_candidate_hints_finder()
+
+# a non-ASCII character may become anything once transliterated to ASCII
+find_non_ascii = re.compile(r'[^\x00-\x7f]').finditer
+
+
+def get_hinted_line_indexes(lines):
+    """
+    Return a set of the indexes of the lines of a ``lines`` list of text lines
+    that contain some candidate hint or some non-ASCII character. Only these
+    lines can be candidate lines. The text of all the lines is scanned at once.
+    """
+    lines = [line.lower() for line in lines]
+
+    line_starts = []
+    line_starts_append = line_starts.append
+    start = 0
+    for line in lines:
+        line_starts_append(start)
+        # +1 for the joining new line
+        start += len(line) + 1
+
+    text = '\n'.join(lines)
+    hints = find_candidate_hints(text)
+    if not text.isascii():
+        hints = chain(hints, find_non_ascii(text))
+
+    hinted = set()
+    hinted_add = hinted.add
+    for hint in hints:
+        hinted_add(bisect_right(line_starts, hint.start()) - 1)
+    return hinted
+
+
+def get_hinted_numbered_lines(numbered_lines, batch_size=10000):
+    """
+    Yield tuples of ((line number, line text), has hint) given an iterable of
+    ``numbered_lines`` as tuples of (line number, line text) where has hint is
+    True if the line may be a candidate line. Process lazily the lines in
+    batches of ``batch_size`` lines.
+    """
+    numbered_lines = iter(numbered_lines)
+    while True:
+        batch = list(islice(numbered_lines, batch_size))
+        if not batch:
+            return
+
+        if not USE_CANDIDATE_HINTS:
+            for numbered_line in batch:
+                yield numbered_line, True
+            continue
+
+        hinted_line_indexes = get_hinted_line_indexes([line for _, line in batch])
+        for line_index, numbered_line in enumerate(batch):
+            yield numbered_line, line_index in hinted_line_indexes
+
+
 def candidate_lines(numbered_lines):
     """
     Yield groups of candidate line lists where each list element is a tuple of
@@ -3880,11 +3993,19 @@ def candidate_lines(numbered_lines):
 
     # the previous line (chars only)
     previous_chars = None
-    for numbered_line in numbered_lines:
+    for numbered_line, has_hint in get_hinted_numbered_lines(numbered_lines):
         if TRACE:
             logger_debug(
                 f'# candidate_lines: evaluating line: {numbered_line!r}')
 
+        if not in_copyright and not has_hint:
+            # this line cannot be a candidate: no need to prepare it
+            if candidates:
+                yield list(candidates)
+                candidates_clear()
+                previous_chars = None
+            continue
+
         _line_number, line = numbered_line
 
         # FIXME: we should get the prepared text from here and return
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import re
+
+from pygmars import lex
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    # Python 3.10 and older
+    import sre_constants
+    import sre_parse
+
+"""
+A faster pygmars Lexer for the many copyright lexer patterns.
+
+The pygmars Lexer tries each of its regex patterns in sequence until one matches
+a token value. Most patterns can only match a token that starts with a few
+characters, such as "[Cc]opyright" with "C" or "c". Here we compute the first
+characters that each pattern can match to only try the patterns that can match
+the first character of a token value, in the same sequence. This yields the same
+labels as the pygmars Lexer.
+"""
+
+ASCII_CHARS = frozenset(chr(i) for i in range(128))
+
+# The first characters of each regex category, in the ASCII range
+CATEGORY_CHARS = {
+    category: frozenset(ch for ch in ASCII_CHARS if re.match(regex, ch))
+    for category, regex in [
+        (sre_constants.CATEGORY_DIGIT, r'\d'),
+        (sre_constants.CATEGORY_NOT_DIGIT, r'\D'),
+        (sre_constants.CATEGORY_SPACE, r'\s'),
+        (sre_constants.CATEGORY_NOT_SPACE, r'\S'),
+        (sre_constants.CATEGORY_WORD, r'\w'),
+        (sre_constants.CATEGORY_NOT_WORD, r'\W'),
+    ]
+}
+
+
+def get_first_chars(pattern, re_flags=0):
+    """
+    Return a set of the ASCII characters that a string must start with to be
+    matched by a ``pattern`` regex string with re.match. This may contain more
+    characters than needed but never less. Strings that start with a non-ASCII
+    character are not considered and may be matched by any pattern.
+
+    For example:
+    >>> sorted(get_first_chars(r'^[Cc]opyright$'))
+    ['C', 'c']
+    >>> sorted(get_first_chars(r'^(?i:inc)\\.?$'))
+    ['I', 'i']
+    >>> sorted(get_first_chars(r'^\\(?[0-9]{4}'))
+    ['(', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    >>> get_first_chars(r'.*') == ASCII_CHARS
+    True
+    """
+    parsed = sre_parse.parse(pattern, re_flags)
+    chars, nullable = _get_first_chars(parsed, parsed.state.flags)
+    if nullable:
+        # a pattern that matches an empty string matches any string
+        return ASCII_CHARS
+    return frozenset(chars)
+
+
+def _get_first_chars(subpattern, flags):
+    """
+    Return a tuple of (set of first ASCII characters, nullable) for a parsed
+    ``subpattern`` sequence of (opcode, argument) with ``flags`` where nullable
+    is True if the subpattern can match an empty string.
+    """
+    chars = set()
+    for opcode, argument in subpattern:
+        op_chars, nullable = _get_op_first_chars(opcode, argument, flags)
+        chars.update(op_chars)
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _get_op_first_chars(opcode, argument, flags):
+    """
+    Return a tuple of (set of first ASCII characters, nullable) for an
+    ``opcode`` with an ``argument`` and ``flags``.
+    """
+    ignore_case = bool(flags & sre_constants.SRE_FLAG_IGNORECASE)
+
+    if opcode is sre_constants.LITERAL:
+        return _get_literal_chars([argument], ignore_case), False
+
+    if opcode is sre_constants.IN:
+        return _get_set_chars(argument, ignore_case), False
+
+    if opcode in (sre_constants.NOT_LITERAL, sre_constants.ANY):
+        return ASCII_CHARS, False
+
+    if opcode in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        # zero-width assertions
+        return set(), True
+
+    if opcode is sre_constants.SUBPATTERN:
+        _group, add_flags, del_flags, subpattern = argument
+        return _get_first_chars(subpattern, (flags | add_flags) & ~del_flags)
+
+    if opcode is sre_constants.BRANCH:
+        chars = set()
+        any_nullable = False
+        for subpattern in argument[1]:
+            branch_chars, nullable = _get_first_chars(subpattern, flags)
+            chars.update(branch_chars)
+            any_nullable = any_nullable or nullable
+        return chars, any_nullable
+
+    if opcode in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        min_repeat, _max_repeat, subpattern = argument
+        chars, nullable = _get_first_chars(subpattern, flags)
+        return chars, nullable or not min_repeat
+
+    # anything else such as group references can match anything
+    return ASCII_CHARS, True
+
+
+def _get_literal_chars(codes, ignore_case):
+    """
+    Return a set of ASCII characters for a list of character ``codes``.
+    """
+    if ignore_case and any(code > 127 for code in codes):
+        # some non-ASCII characters such as the Kelvin sign are equal to
+        # ASCII characters ignoring case
+        return ASCII_CHARS
+
+    chars = set(chr(code) for code in codes if code < 128)
+    if ignore_case:
+        chars.update([ch.swapcase() for ch in chars])
+    return chars
+
+
+def _get_set_chars(items, ignore_case):
+    """
+    Return a set of ASCII characters for a character set ``items`` list.
+    """
+    chars = set()
+    negated = False
+    codes = []
+    for opcode, argument in items:
+        if opcode is sre_constants.NEGATE:
+            negated = True
+        elif opcode is sre_constants.LITERAL:
+            codes.append(argument)
+        elif opcode is sre_constants.RANGE:
+            low, high = argument
+            if ignore_case and high > 127:
+                return ASCII_CHARS
+            codes.extend(range(low, min(high, 127) + 1))
+        elif opcode is sre_constants.CATEGORY and argument in CATEGORY_CHARS:
+            chars.update(CATEGORY_CHARS[argument])
+        else:
+            return ASCII_CHARS
+
+    chars.update(_get_literal_chars(codes, ignore_case))
+    if negated:
+        if ignore_case:
+            return ASCII_CHARS
+        return ASCII_CHARS.difference(chars)
+    return chars
+
+
+class CopyrightLexer(lex.Lexer):
+    """
+    A pygmars Lexer that only tries the matchers that can match the first
+    character of a token value. The labels of the first ``cache_size`` distinct
+    token values are also cached as these are mostly repeated values such as
+    "Copyright", "(c)", years or "Inc.".
+
+    For example:
+    >>> lexer = CopyrightLexer([(r'^[Cc]opyright$', 'COPY'), (r'^[0-9]{4}$', 'YR'), (r'.+', 'NN')])
+    >>> tokens = lexer.lex_strings(['Copyright', '2020', 'Acme', 'Copyright', '©'])
+    >>> [(t.value, t.label) for t in tokens]
+    [('Copyright', 'COPY'), ('2020', 'YR'), ('Acme', 'NN'), ('Copyright', 'COPY'), ('©', 'NN')]
+    >>> len(lexer.labels_by_value)
+    4
+    """
+
+    def __init__(self, matchers, re_flags=0, cache_size=10000):
+        matchers = list(matchers)
+        super().__init__(matchers, re_flags=re_flags)
+
+        first_chars = []
+        for matcher, _label in matchers:
+            if isinstance(matcher, str):
+                first_chars.append(get_first_chars(matcher, re_flags))
+            else:
+                first_chars.append(ASCII_CHARS)
+
+        # {first character: [(matcher, label), ...]} with the matchers that can
+        # match a token value that starts with this character, in sequence
+        self.matchers_by_char = {
+            ch: [
+                compiled
+                for compiled, chars in zip(self._matchers, first_chars)
+                if ch in chars
+            ]
+            for ch in ASCII_CHARS
+        }
+
+        self.labels_by_value = {}
+        self.cache_size = cache_size
+
+    def get_label(self, value):
+        """
+        Return the label of a token ``value`` string or None.
+        """
+        labels_by_value = self.labels_by_value
+        if value in labels_by_value:
+            return labels_by_value[value]
+
+        matchers = value and self.matchers_by_char.get(value[0]) or self._matchers
+        label = None
+        for matcher, matcher_label in matchers:
+            if matcher(value):
+                label = matcher_label
+                break
+
+        if len(labels_by_value) < self.cache_size:
+            labels_by_value[value] = label
+        return label
+
+    def lex_tokens(self, tokens, trace=False):
+        """
+        Return an iterable of pygmars.Token given a ``tokens`` Token iterable.
+        Assign a "label" to every token whose value is matched by one of regexp
+        rules of this lexer.
+        """
+        if trace:
+            yield from super().lex_tokens(tokens, trace=trace)
+            return
+
+        get_label = self.get_label
+        for token in tokens:
+            label = get_label(token.value)
+            if label is not None:
+                token.label = label
+            yield token
@@ -9,6 +9,7 @@
 
 import string
 import re
+from collections import deque
 
 import ipaddress
 import urlpy
@@ -46,6 +47,9 @@ Find patterns in text lines such as a emails and URLs.
 Optionally apply filters to pattern matches.
 """
 
+# Set to False to search the emails and URLs patterns in every line
+USE_LINE_HINTS = True
+
 
 def find(location, patterns):
     """
@@ -53,6 +57,10 @@ def find(location, patterns):
     tuple of (key, found text, text line). `patterns` is a list of tuples (key,
     compiled regex).
 
+    The lines of the file are read once for all the patterns. A pattern with a
+    key of HINTS_BY_KEY is only searched in the lines that have the hint of this
+    pattern and the lines without any such hint are skipped entirely.
+
     Note: the location can be a list of lines for testing convenience.
     """
     if TRACE:
@@ -60,8 +68,26 @@ def find(location, patterns):
         loc = pformat(location)
         logger_debug('find(location=%(loc)r,\n  patterns=%(patterns)r)' % locals())
 
-    for line_number, line in analysis.numbered_text_lines(location, demarkup=False):
-        for key, pattern in patterns:
+    numbered_lines = analysis.numbered_text_lines(location, demarkup=False)
+    yield from find_in_numbered_lines(numbered_lines, patterns)
+
+
+def find_in_numbered_lines(numbered_lines, patterns):
+    """
+    Yield match and matched lines for patterns found in a ``numbered_lines``
+    iterable of (line number, text line) as a tuple of (key, found text, text
+    line, line number). See ``find`` for details.
+    """
+    # list of (key, pattern, line hint function or None)
+    patterns = [
+        (key, pattern, USE_LINE_HINTS and HINTS_BY_KEY.get(key) or None)
+        for key, pattern in patterns
+    ]
+    for line_number, line in numbered_lines:
+        for key, pattern, has_hint in patterns:
+            if has_hint and not has_hint(line):
+                continue
+
             for match in pattern.findall(line):
 
                 if TRACE:
@@ -124,6 +150,19 @@ def emails_regex():
     return re.compile('\\b[A-Z0-9._%-]+@[A-Z0-9.-]+\\.[A-Z]{2,4}\\b', re.IGNORECASE)
 
 
+def has_email_hint(line):
+    """
+    Return True if a ``line`` string may contain an email.
+
+    For example:
+    >>> has_email_hint('Contact: joe@example.com')
+    True
+    >>> has_email_hint('Copyright (c) Example Inc.')
+    False
+    """
+    return '@' in line
+
+
 def find_emails(location, unique=True):
     """
     Yield an iterable of (email, line_number) found in file at ``location``.
@@ -137,12 +176,19 @@ def find_emails(location, unique=True):
         for r in matches:
             logger_debug('find_emails: match:', r)
 
+    matches = apply_filters(matches, *get_email_filters(unique))
+    for _key, email, _line, line_number in matches:
+        yield email, line_number
+
+
+def get_email_filters(unique=True):
+    """
+    Return a tuple of filters to apply to email matches.
+    """
     filters = (junk_email_domains_filter, uninteresting_emails_filter)
     if unique:
         filters += (unique_filter,)
-    matches = apply_filters(matches, *filters)
-    for _key, email, _line, line_number in matches:
-        yield email, line_number
+    return filters
 
 
 def junk_email_domains_filter(matches):
@@ -226,6 +272,29 @@ def urls_regex():
 INVALID_URLS_PATTERN = '((?:' + schemes + ')://([$%*/_])+)'
 
 
+def has_url_hint(line):
+    """
+    Return True if a ``line`` string may contain a URL: a line must contain
+    either "://", "www." or "ftp." ignoring case, or "@" for "git@" URLs.
+
+    For example:
+    >>> has_url_hint('See https://example.com')
+    True
+    >>> has_url_hint('See WWW.example.com')
+    True
+    >>> has_url_hint('git@github.com:nexB/scancode-toolkit.git')
+    True
+    >>> has_url_hint('See example.com')
+    False
+    """
+    if '://' in line or '@' in line:
+        return True
+    if '.' in line:
+        line = line.lower()
+        return 'www.' in line or 'ftp.' in line
+    return False
+
+
 def find_urls(location, unique=True):
     """
     Yield an iterable of (url, line_number) found in file at ``location``.
@@ -238,6 +307,19 @@ def find_urls(location, unique=True):
         matches = list(matches)
         for m in matches:
             logger_debug('url match:', m)
+
+    matches = apply_filters(matches, *get_url_filters(unique))
+    for _key, url, _line, line_number in matches:
+        if TRACE_URL:
+            logger_debug('find_urls: line_number:', line_number, '_line:', repr(_line),
+                         'type(url):', type(url), 'url:', repr(url))
+        yield str(url), line_number
+
+
+def get_url_filters(unique=True):
+    """
+    Return a tuple of filters to apply to URL matches.
+    """
     # the order of filters IS important
     filters = (
         verbatim_crlf_url_cleaner,
@@ -252,13 +334,82 @@ def find_urls(location, unique=True):
     )
     if unique:
         filters += (unique_filter,)
+    return filters
 
-    matches = apply_filters(matches, *filters)
-    for _key, url, _line, line_number in matches:
-        if TRACE_URL:
-            logger_debug('find_urls: line_number:', line_number, '_line:', repr(_line),
-                         'type(url):', type(url), 'url:', repr(url))
-        yield str(url), line_number
+
+def find_emails_and_urls(location, unique=True):
+    """
+    Return a tuple of (emails, urls) iterables of (email or url, line_number)
+    found in file at ``location`` in a single pass over its text lines. These
+    are the same as the find_emails() and find_urls() results. Only return
+    unique items if ``unique`` is True. `location` can be a list of strings for
+    testing.
+
+    Both iterables are lazy and read the text lines only as far as needed. Each
+    iterable can be consumed only once.
+    """
+    numbered_lines = analysis.numbered_text_lines(location, demarkup=False)
+    lines_by_key = split_numbered_lines(numbered_lines, keys=('emails', 'urls'))
+    email_matches = find_in_numbered_lines(
+        lines_by_key['emails'], [('emails', emails_regex(),)])
+    url_matches = find_in_numbered_lines(
+        lines_by_key['urls'], [('urls', urls_regex(),)])
+
+    emails = (
+        (email, line_number) for _key, email, _line, line_number
+        in apply_filters(email_matches, *get_email_filters(unique))
+    )
+    urls = (
+        (str(url), line_number) for _key, url, _line, line_number
+        in apply_filters(url_matches, *get_url_filters(unique))
+    )
+
+    return emails, urls
+
+
+def split_numbered_lines(numbered_lines, keys):
+    """
+    Return a mapping of {key: iterable of (line number, text line)} for each of
+    the HINTS_BY_KEY ``keys`` given a ``numbered_lines`` iterable of (line
+    number, text line). Each iterable contains only the lines with the hint of
+    its key. It consumes the ``numbered_lines`` only as far as needed and keeps
+    the lines for the other keys until these are consumed. The lines without
+    any hint are skipped.
+
+    For example:
+    >>> numbered_lines = [(1, 'a@b.com'), (2, 'none'), (3, 'http://b.com')]
+    >>> lines_by_key = split_numbered_lines(numbered_lines, keys=('emails', 'urls'))
+    >>> next(lines_by_key['urls'])
+    (1, 'a@b.com')
+    >>> list(lines_by_key['emails'])
+    [(1, 'a@b.com')]
+    >>> list(lines_by_key['urls'])
+    [(3, 'http://b.com')]
+    """
+    numbered_lines = iter(numbered_lines)
+    pending_by_key = {key: deque() for key in keys}
+    hints = [
+        (USE_LINE_HINTS and HINTS_BY_KEY[key] or None, pending_by_key[key])
+        for key in keys
+    ]
+
+    def numbered_lines_of(key):
+        pending = pending_by_key[key]
+        while True:
+            if pending:
+                yield pending.popleft()
+                continue
+
+            numbered_line = next(numbered_lines, None)
+            if numbered_line is None:
+                return
+
+            line = numbered_line[1]
+            for has_hint, key_pending in hints:
+                if not has_hint or has_hint(line):
+                    key_pending.append(numbered_line)
+
+    return {key: numbered_lines_of(key) for key in keys}
 
 
 EMPTY_URLS = set(['https', 'http', 'ftp', 'www', ])
@@ -582,6 +733,13 @@ def junk_urls_filter(matches):
         yield key, match, line, line_number
 
 
+# {pattern key: function returning True if a line may be matched by this pattern}
+HINTS_BY_KEY = {
+    'emails': has_email_hint,
+    'urls': has_url_hint,
+}
+
+
 def find_pattern(location, pattern, unique=False):
     """
     Find regex pattern in the text lines of file at location.
@@ -31,6 +31,9 @@ class CopyrightScanner(ScanPlugin):
     run_order = 6
     sort_order = 6
 
+    # results can be reused from the --scan-cache for identical files
+    is_content_only = True
+
     options = [
         PluggableCommandLineOption(('-c', '--copyright',),
             is_flag=True, default=False,
@@ -42,6 +45,14 @@ class CopyrightScanner(ScanPlugin):
     def is_enabled(self, copyright, **kwargs):  # NOQA
         return copyright
 
+    def setup(self, **kwargs):
+        """
+        This is a warmup such that child process inherit from the built
+        copyright lexer and parser.
+        """
+        from cluecode.copyrights import get_detector
+        get_detector()
+
     def get_scanner(self, **kwargs):
         from scancode.api import get_copyrights
         return get_copyrights
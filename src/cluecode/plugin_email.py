@@ -28,6 +28,9 @@ class EmailScanner(ScanPlugin):
     run_order = 7
     sort_order = 7
 
+    # results can be reused from the --scan-cache for identical files
+    is_content_only = True
+
     options = [
         PluggableCommandLineOption(('-e', '--email',),
             is_flag=True, default=False,
@@ -41,16 +44,58 @@ class EmailScanner(ScanPlugin):
             required_options=['email'],
             help='Report only up to INT emails found in a file. Use 0 for no limit.',
             help_group=SCAN_OPTIONS_GROUP),
+
     ]
 
     def is_enabled(self, email, **kwargs):
         return email
 
-    def get_scanner(self, max_email=50, test_slow_mode=False, test_error_mode=False, **kwargs):
+    def get_scanner(
+        self,
+        max_email=50,
+        test_slow_mode=False,
+        test_error_mode=False,
+        url=False,
+        max_url=50,
+        **kwargs,
+    ):
         from scancode.api import get_emails
         return partial(
             get_emails,
             threshold=max_email,
             test_slow_mode=test_slow_mode,
-            test_error_mode=test_error_mode
+            test_error_mode=test_error_mode,
+            # find the URLs in the same pass when these are also scanned
+            with_urls=url,
+            url_threshold=max_url,
         )
+
+
+@scan_impl
+class EmailCountScanner(ScanPlugin):
+    """
+    Count all the emails of a Resource.
+    """
+    resource_attributes = dict(emails_count=attr.ib(default=0, type=int))
+
+    run_order = 7
+    sort_order = 7
+
+    # results can be reused from the --scan-cache for identical files
+    is_content_only = True
+
+    options = [
+        PluggableCommandLineOption(('--email-count',),
+            is_flag=True, default=False,
+            required_options=['email'],
+            help='Also report the count of all the emails found in a file in '
+                 'an "emails_count" attribute, including the emails beyond --max-email.',
+            help_group=SCAN_OPTIONS_GROUP),
+    ]
+
+    def is_enabled(self, email_count, **kwargs):
+        return email_count
+
+    def get_scanner(self, **kwargs):
+        from scancode.api import get_emails_count
+        return get_emails_count
@@ -29,6 +29,9 @@ class UrlScanner(ScanPlugin):
     run_order = 8
     sort_order = 8
 
+    # results can be reused from the --scan-cache for identical files
+    is_content_only = True
+
     options = [
         PluggableCommandLineOption(('-u', '--url',),
             is_flag=True, default=False,
@@ -42,11 +45,49 @@ class UrlScanner(ScanPlugin):
             show_default=True,
             help='Report only up to INT urls found in a file. Use 0 for no limit.',
             help_group=SCAN_OPTIONS_GROUP),
+
     ]
 
     def is_enabled(self, url, **kwargs):
         return url
 
-    def get_scanner(self, max_url=50, **kwargs):
+    def get_scanner(self, max_url=50, email=False, max_email=50, **kwargs):
         from scancode.api import get_urls
-        return partial(get_urls, threshold=max_url)
+        return partial(
+            get_urls,
+            threshold=max_url,
+            # find the emails in the same pass when these are also scanned
+            with_emails=email,
+            email_threshold=max_email,
+        )
+
+
+@scan_impl
+class UrlCountScanner(ScanPlugin):
+    """
+    Count all the URLs of a Resource.
+    """
+
+    resource_attributes = dict(urls_count=attr.ib(default=0, type=int))
+
+    run_order = 8
+    sort_order = 8
+
+    # results can be reused from the --scan-cache for identical files
+    is_content_only = True
+
+    options = [
+        PluggableCommandLineOption(('--url-count',),
+            is_flag=True, default=False,
+            required_options=['url'],
+            help='Also report the count of all the urls found in a file in '
+                 'a "urls_count" attribute, including the urls beyond --max-url.',
+            help_group=SCAN_OPTIONS_GROUP),
+    ]
+
+    def is_enabled(self, url_count, **kwargs):
+        return url_count
+
+    def get_scanner(self, **kwargs):
+        from scancode.api import get_urls_count
+        return get_urls_count
@@ -0,0 +1,451 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import json
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from time import perf_counter
+
+import click
+
+from licensedcode.tokenize import query_lines
+from licensedcode.tokenize import query_tokenizer
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+"""
+A repeatable performance benchmark and regression harness for license
+detection.
+
+``LicenseIndex.match`` is run over a fixed corpus of files stratified by shape
+(short license headers, full license texts, near-duplicate licenses, long
+notices, SPDX identifiers-heavy sources, minified JavaScript, binaries with
+strings and huge generated files). Each subdirectory of the corpus directory is
+a stratum. An optional "strata.json" file in the corpus directory can specify a
+"repeat" count for a stratum: the files of this stratum are then concatenated
+this many times to generate large files at run time.
+
+For each stratum, we report the p50 and p95 latency of matching a file, the
+number of tokens matched per second and the peak RSS of the process. We also
+report the index load time and peak RSS after loading the index. These results
+and the detected license expressions are compared with a stored baseline such
+that performance regressions and changed detections are reported loudly.
+
+Run this for instance with::
+
+    python -m licensedcode.benchmark \
+        --corpus tests/licensedcode/data/benchmark/corpus \
+        --baseline tests/licensedcode/data/benchmark/baseline.json
+
+The license index should be built beforehand: otherwise the index build time is
+reported as the index load time.
+"""
+
+STRATA_FILENAME = 'strata.json'
+
+# default relative tolerance when comparing with a baseline
+DEFAULT_TOLERANCE = 0.25
+
+# Metrics compared with a baseline as {name: (higher is worse, absolute slack)}.
+# The absolute slack avoids reporting timing and memory noise on small values.
+STRATUM_METRICS = {
+    'p50': (True, 0.005),
+    'p95': (True, 0.01),
+    'tokens_per_sec': (False, 0),
+    'peak_rss': (True, 32 * 1024 * 1024),
+}
+
+INDEX_METRICS = {
+    'load_time': (True, 0.5),
+    'rss': (True, 64 * 1024 * 1024),
+}
+
+
+def get_peak_rss():
+    """
+    Return the peak resident set size in bytes of the current process or None
+    if this is not available on this OS.
+    """
+    if not resource:
+        return
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss
+    # this is in kilobytes on Linux
+    return peak_rss * 1024
+
+
+def percentile(values, pct):
+    """
+    Return the nearest-rank ``pct`` percentile of a non-empty list of
+    ``values``.
+
+    For example::
+    >>> percentile([3, 1, 2, 4], 50)
+    2
+    >>> percentile([3, 1, 2, 4], 95)
+    4
+    """
+    values = sorted(values)
+    rank = max(int(math.ceil(pct / 100 * len(values))) - 1, 0)
+    return values[rank]
+
+
+def get_strata(corpus_dir, work_dir):
+    """
+    Return a mapping of {stratum name: [list of file locations]} for the
+    ``corpus_dir`` corpus. The files of a stratum with a "repeat" count are
+    generated in the ``work_dir`` directory.
+    """
+    strata_file = os.path.join(corpus_dir, STRATA_FILENAME)
+    options_by_stratum = {}
+    if os.path.exists(strata_file):
+        with open(strata_file) as sf:
+            options_by_stratum = json.load(sf)
+
+    strata = {}
+    for name in sorted(os.listdir(corpus_dir)):
+        stratum_dir = os.path.join(corpus_dir, name)
+        if not os.path.isdir(stratum_dir):
+            continue
+
+        locations = [
+            os.path.join(stratum_dir, fn)
+            for fn in sorted(os.listdir(stratum_dir))
+        ]
+
+        repeat = options_by_stratum.get(name, {}).get('repeat')
+        if repeat:
+            locations = [
+                generate_file(location, work_dir, repeat)
+                for location in locations
+            ]
+        strata[name] = locations
+    return strata
+
+
+def generate_file(location, work_dir, repeat):
+    """
+    Return the location of a new file created in ``work_dir`` with the content
+    of the file at ``location`` repeated ``repeat`` times.
+    """
+    with open(location, 'rb') as inp:
+        content = inp.read()
+    generated = os.path.join(work_dir, os.path.basename(location))
+    with open(generated, 'wb') as out:
+        for _ in range(repeat):
+            out.write(content)
+    return generated
+
+
+def count_tokens(location):
+    """
+    Return the number of query tokens of the file at ``location``.
+    """
+    return sum(
+        len(list(query_tokenizer(line)))
+        for _line_num, line in query_lines(location)
+    )
+
+
+def benchmark_stratum(idx, locations, runs=3):
+    """
+    Return a mapping of benchmark results from matching ``runs`` times each of
+    the files at ``locations`` with the ``idx`` LicenseIndex.
+    """
+    durations = []
+    tokens = 0
+    detections = {}
+
+    if locations:
+        # warm up such that lazily loaded data are not part of the latency
+        idx.match(location=locations[0])
+
+    for location in locations:
+        file_tokens = count_tokens(location)
+        tokens += file_tokens
+        for _ in range(runs):
+            start = perf_counter()
+            matches = idx.match(location=location)
+            durations.append(perf_counter() - start)
+        detections[os.path.basename(location)] = [
+            m.rule.license_expression for m in matches]
+
+    total_duration = sum(durations)
+    tokens_per_sec = 0
+    if total_duration:
+        tokens_per_sec = tokens * runs / total_duration
+
+    return dict(
+        files=len(locations),
+        tokens=tokens,
+        p50=percentile(durations, 50),
+        p95=percentile(durations, 95),
+        tokens_per_sec=tokens_per_sec,
+        peak_rss=get_peak_rss(),
+        detections=detections,
+    )
+
+
+# the index of the benchmark shared with a forked stratum process
+_INDEX = None
+
+
+def _benchmark_stratum(locations, runs):
+    return benchmark_stratum(idx=_INDEX, locations=locations, runs=runs)
+
+
+def run_stratum(idx, locations, runs=3, isolate=True):
+    """
+    Return benchmark results for the ``locations`` files of a stratum. If
+    ``isolate`` is True and if possible, run in a forked process such that the
+    peak RSS is measured for this stratum alone.
+    """
+    if not (isolate and 'fork' in multiprocessing.get_all_start_methods()):
+        return benchmark_stratum(idx=idx, locations=locations, runs=runs)
+
+    global _INDEX
+    _INDEX = idx
+    try:
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            return pool.apply(_benchmark_stratum, (locations, runs))
+    finally:
+        _INDEX = None
+
+
+def run_benchmark(corpus_dir, idx=None, runs=3, isolate=True):
+    """
+    Return a mapping of benchmark results for the ``corpus_dir`` corpus,
+    matching each file ``runs`` times with the ``idx`` LicenseIndex. If ``idx``
+    is not provided, load the cached license index and report its load time
+    and memory.
+    """
+    results = dict(index=None, strata={})
+
+    if idx is None:
+        from licensedcode.cache import get_index
+        start = perf_counter()
+        idx = get_index()
+        results['index'] = dict(
+            load_time=perf_counter() - start,
+            rss=get_peak_rss(),
+        )
+
+    work_dir = tempfile.mkdtemp(prefix='scancode-license-benchmark-')
+    try:
+        strata = get_strata(corpus_dir=corpus_dir, work_dir=work_dir)
+        for name, locations in strata.items():
+            results['strata'][name] = run_stratum(
+                idx=idx,
+                locations=locations,
+                runs=runs,
+                isolate=isolate,
+            )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def check_metric(name, current, expected, higher_is_worse, slack, tolerance):
+    """
+    Return a regression message if the ``current`` value of the ``name`` metric
+    is worse than the ``expected`` baseline value beyond the relative
+    ``tolerance`` and the absolute ``slack``. Return None otherwise.
+    """
+    if current is None or expected is None:
+        return
+
+    if higher_is_worse:
+        limit = max(expected * (1 + tolerance), expected + slack)
+        if current > limit:
+            return f'{name}: {current:.6g} is above {limit:.6g} (baseline: {expected:.6g})'
+    else:
+        limit = expected / (1 + tolerance)
+        if current < limit:
+            return f'{name}: {current:.6g} is below {limit:.6g} (baseline: {expected:.6g})'
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Return a list of regression messages from comparing a ``results`` mapping
+    with a ``baseline`` mapping of benchmark results. Any change in the
+    detected license expressions is a regression.
+    """
+    regressions = []
+
+    current_index = results.get('index')
+    expected_index = baseline.get('index')
+    if current_index and expected_index:
+        for metric, (higher_is_worse, slack) in INDEX_METRICS.items():
+            message = check_metric(
+                name=f'index {metric}',
+                current=current_index.get(metric),
+                expected=expected_index.get(metric),
+                higher_is_worse=higher_is_worse,
+                slack=slack,
+                tolerance=tolerance,
+            )
+            if message:
+                regressions.append(message)
+
+    current_strata = results.get('strata', {})
+    for name, expected in baseline.get('strata', {}).items():
+        current = current_strata.get(name)
+        if not current:
+            regressions.append(f'{name}: missing stratum')
+            continue
+
+        for metric, (higher_is_worse, slack) in STRATUM_METRICS.items():
+            message = check_metric(
+                name=f'{name} {metric}',
+                current=current.get(metric),
+                expected=expected.get(metric),
+                higher_is_worse=higher_is_worse,
+                slack=slack,
+                tolerance=tolerance,
+            )
+            if message:
+                regressions.append(message)
+
+        expected_detections = expected.get('detections') or {}
+        current_detections = current.get('detections') or {}
+        for filename, expressions in expected_detections.items():
+            detected = current_detections.get(filename)
+            if detected != expressions:
+                regressions.append(
+                    f'{name} {filename}: detected {detected!r} '
+                    f'instead of {expressions!r}'
+                )
+
+    return regressions
+
+
+def format_results(results):
+    """
+    Return a text table of a ``results`` benchmark mapping.
+    """
+    megabyte = 1024 * 1024
+    lines = []
+
+    index = results.get('index')
+    if index:
+        rss = index['rss'] and index['rss'] / megabyte
+        lines.append(f'index: load time: {index["load_time"]:.3f}s, RSS: {rss or 0:.1f}MB')
+
+    lines.append(
+        f'{"stratum":<16} {"files":>5} {"tokens":>9} {"p50 ms":>9} '
+        f'{"p95 ms":>9} {"tokens/s":>10} {"RSS MB":>8}'
+    )
+    for name, res in results.get('strata', {}).items():
+        rss = res['peak_rss'] and res['peak_rss'] / megabyte
+        lines.append(
+            f'{name:<16} {res["files"]:>5} {res["tokens"]:>9} '
+            f'{res["p50"] * 1000:>9.2f} {res["p95"] * 1000:>9.2f} '
+            f'{res["tokens_per_sec"]:>10.0f} {rss or 0:>8.1f}'
+        )
+    return '\n'.join(lines)
+
+
+@click.command(name='scancode-benchmark-licenses')
+@click.option(
+    '--corpus',
+    type=click.Path(exists=True, readable=True, file_okay=False, path_type=str),
+    required=True,
+    metavar='DIR',
+    help='Benchmark corpus directory with one subdirectory per stratum.',
+)
+@click.option(
+    '--baseline',
+    type=click.Path(dir_okay=False, path_type=str),
+    metavar='FILE',
+    help='Compare the results with this baseline JSON file and exit with an '
+         'error on regressions.',
+)
+@click.option(
+    '--update-baseline',
+    is_flag=True,
+    help='Save the results as the new --baseline JSON file instead of '
+         'comparing with it.',
+)
+@click.option(
+    '--runs',
+    type=int,
+    default=3,
+    show_default=True,
+    help='Number of times each file is matched.',
+)
+@click.option(
+    '--tolerance',
+    type=float,
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help='Relative tolerance when comparing with the baseline.',
+)
+@click.option(
+    '--json',
+    'json_output',
+    type=click.Path(dir_okay=False, path_type=str),
+    metavar='FILE',
+    help='Save the results to this JSON file.',
+)
+@click.help_option('-h', '--help')
+def benchmark_licenses(
+    corpus,
+    baseline,
+    update_baseline,
+    runs,
+    tolerance,
+    json_output,
+    *args,
+    **kwargs,
+):
+    """Benchmark license detection on a corpus and check for regressions."""
+    results = run_benchmark(corpus_dir=corpus, runs=runs)
+    click.echo(format_results(results))
+
+    if json_output:
+        with open(json_output, 'w') as jo:
+            json.dump(results, jo, indent=2)
+
+    if not baseline:
+        return
+
+    if update_baseline:
+        with open(baseline, 'w') as bl:
+            json.dump(results, bl, indent=2)
+        click.echo(f'Baseline saved to: {baseline}')
+        return
+
+    with open(baseline) as bl:
+        expected = json.load(bl)
+
+    regressions = compare_to_baseline(
+        results=results,
+        baseline=expected,
+        tolerance=tolerance,
+    )
+    if regressions:
+        for regression in regressions:
+            click.secho(f'REGRESSION: {regression}', fg='red', err=True)
+        raise SystemExit(1)
+
+    click.echo('No regression.')
+
+
+if __name__ == '__main__':
+    benchmark_licenses()
@@ -14,6 +14,8 @@ from shutil import rmtree
 from commoncode.fileutils import create_dir
 
 from scancode_config import licensedcode_cache_dir
+from scancode_config import licensedcode_index_build_processes
+from scancode_config import licensedcode_index_mmap
 from scancode_config import scancode_cache_dir
 
 """
@@ -21,6 +23,19 @@ An on-disk persistent cache of LicenseIndex and related data structures such as
 the licenses database. The data are pickled and must be regenerated if there
 are any changes in the code or licenses text or rules. Loading and dumping the
 cached pickle is safe to use across multiple processes using lock files.
+
+Optionally, the largest LicenseIndex per-rule arrays are stored in a separate
+flat file that is memory-mapped read-only rather than pickled such that this
+memory is shared by all the processes using the index.
+
+The rules loaded from rule files to build an index are also cached such that
+rebuilding an index only loads again the modified rule files.
+
+When there are additional licenses and rules from an additional directory or
+from installed plugins, these are indexed in a small overlay LicenseIndex on top
+of a base LicenseIndex of the builtin licenses and rules. This base index is
+cached separately with a fingerprint of the builtin licenses and rules data and
+is reused when building an overlay index unless this data changed.
 """
 
 # This is the Pickle protocol we use, which was added in Python 3.4.
@@ -32,8 +47,11 @@ _LICENSE_CACHE = None
 LICENSE_INDEX_LOCK_TIMEOUT = 60 * 6
 LICENSE_INDEX_DIR = 'license_index'
 LICENSE_INDEX_FILENAME = 'index_cache'
+LICENSE_INDEX_ARRAYS_FILENAME = 'index_arrays'
+LICENSE_BASE_INDEX_FILENAME = 'base_index_cache'
 LICENSE_LOCKFILE_NAME = 'scancode_license_index_lockfile'
 LICENSE_CHECKSUM_FILE = 'scancode_license_index_tree_checksums'
+LICENSE_RULES_CACHE_FILENAME = 'rules_cache'
 
 
 class LicenseCache:
@@ -77,6 +95,8 @@ class LicenseCache:
         licenses_data_dir=None,
         rules_data_dir=None,
         additional_directory=None,
+        use_mmap=licensedcode_index_mmap,
+        processes=licensedcode_index_build_processes,
     ):
         """
         Load or build and save and return a LicenseCache object.
@@ -94,6 +114,16 @@ class LicenseCache:
         - ``additional_directory`` is an optional additional directory
           that contain additional licenses and rules in a /licenses and a /rules
           directories using the same format that we use for licenses and rules.
+        - If ``use_mmap`` is True, save the largest index arrays in a flat file
+          memory-mapped when loaded. A cache is loaded from a flat file if
+          such a file was saved when the cache was built.
+        - ``processes`` is the number of processes used to load rules when
+          building the index, using all the CPUs if 0.
+
+        The additional licenses and rules are indexed in an overlay index of a
+        base index of the builtin licenses and rules. A cached base index is
+        reused only if ``force`` is False and if the builtin licenses and rules
+        data did not change since it was built.
         """
         idx_cache_dir = os.path.join(licensedcode_cache_dir, LICENSE_INDEX_DIR)
         if only_builtin:
@@ -101,6 +131,7 @@ class LicenseCache:
 
         create_dir(idx_cache_dir)
         cache_file = os.path.join(idx_cache_dir, LICENSE_INDEX_FILENAME)
+        arrays_file = os.path.join(idx_cache_dir, LICENSE_INDEX_ARRAYS_FILENAME)
 
         has_cache = os.path.exists(cache_file) and os.path.getsize(cache_file)
 
@@ -109,7 +140,7 @@ class LicenseCache:
             try:
                 # save the list of additional directories included in the cache, or None if the cache does not
                 # include any additional directories
-                return load_cache_file(cache_file)
+                return load_cache_file(cache_file, arrays_file=arrays_file)
             except Exception as e:
                 # work around some rare Windows quirks
                 import traceback
@@ -123,6 +154,7 @@ class LicenseCache:
         from licensedcode.models import get_license_dirs
         from licensedcode.models import validate_additional_license_data
         from licensedcode.models import get_paths_to_installed_licenses_and_rules
+        from licensedcode.models import RuleFileCache
         from scancode import lockfile
 
         licenses_data_dir = licenses_data_dir or ldd
@@ -161,14 +193,62 @@ class LicenseCache:
                     builtin_license_data_dir=licenses_data_dir,
                 )
 
-                # create a single merged index containing license data from licenses_data_dir
-                # and data from additional directories
+                rule_cache_location = os.path.join(
+                    licensedcode_cache_dir,
+                    LICENSE_RULES_CACHE_FILENAME,
+                )
+                if force:
+                    # a forced rebuild loads all the rule files again
+                    RuleFileCache.delete(rule_cache_location)
+
+                has_additional_licenses = plugin_directories or any(
+                    not lic.is_builtin for lic in licenses_db.values())
+
+                base_index = None
+                base_fingerprint = None
+                save_base = False
+                if has_additional_licenses:
+                    # reuse the cached base index of the builtin licenses and
+                    # rules if possible or build it
+                    base_fingerprint = get_base_index_fingerprint(
+                        licenses_data_dir=licenses_data_dir,
+                        rules_data_dir=rules_data_dir,
+                        index_all_languages=index_all_languages,
+                    )
+                    if not force:
+                        base_index = load_base_index(
+                            cache_file=cache_file,
+                            arrays_file=arrays_file,
+                            fingerprint=base_fingerprint,
+                        )
+                    if not base_index:
+                        builtin_licenses_db = {
+                            key: lic for key, lic in licenses_db.items()
+                            if lic.is_builtin
+                        }
+                        base_index = build_index(
+                            licenses_db=builtin_licenses_db,
+                            licenses_data_dir=licenses_data_dir,
+                            rules_data_dir=rules_data_dir,
+                            index_all_languages=index_all_languages,
+                            additional_directories=[],
+                            processes=processes,
+                            rule_cache_location=rule_cache_location,
+                        )
+                        save_base = True
+
+                # create an index containing license data from licenses_data_dir
+                # and data from additional directories, eventually as an overlay
+                # of the base index
                 index = build_index(
                     licenses_db=licenses_db,
                     licenses_data_dir=licenses_data_dir,
                     rules_data_dir=rules_data_dir,
                     index_all_languages=index_all_languages,
                     additional_directories=plugin_directories,
+                    processes=processes,
+                    rule_cache_location=rule_cache_location,
+                    base_index=base_index,
                 )
 
                 spdx_symbols = build_spdx_symbols(licenses_db=licenses_db)
@@ -186,8 +266,14 @@ class LicenseCache:
                 )
 
                 # save the cache as pickle new tree checksum
-                with open(cache_file, 'wb') as fn:
-                    pickle.dump(license_cache, fn, protocol=PICKLE_PROTOCOL)
+                save_cache_file(
+                    license_cache=license_cache,
+                    cache_file=cache_file,
+                    arrays_file=arrays_file,
+                    use_mmap=use_mmap,
+                    save_base=save_base,
+                    base_fingerprint=base_fingerprint,
+                )
 
                 return license_cache
 
@@ -208,6 +294,9 @@ def build_index(
     rules_data_dir=None,
     index_all_languages=False,
     additional_directories=None,
+    processes=1,
+    rule_cache_location=None,
+    base_index=None,
 ):
     """
     Return an index built from rules and licenses directories
@@ -216,17 +305,30 @@ def build_index(
     Otherwise, only include the English license texts and rules (the default)
     If ``additional_directories`` is not None, we will include licenses and rules
     from these additional directories in the returned index.
+
+    If ``base_index`` is provided, it must be an index of the builtin licenses
+    and rules: only the additional licenses and rules are then indexed in an
+    overlay index of this ``base_index`` that is returned.
+
+    Rule files are loaded and tokenized using up to ``processes`` processes (or
+    all the CPUs if 0). If ``rule_cache_location`` is provided, the loaded rules
+    are cached at this location and only the modified rule files are loaded
+    again on the next build.
     """
     from licensedcode.index import LicenseIndex
     from licensedcode.models import get_license_dirs
     from licensedcode.models import get_rule_dirs
     from licensedcode.models import get_rules_from_multiple_dirs
+    from licensedcode.models import build_rules_from_licenses
+    from licensedcode.models import load_rules
+    from licensedcode.models import validate_rules
     from licensedcode.models import get_all_spdx_key_tokens
     from licensedcode.models import get_license_tokens
     from licensedcode.models import licenses_data_dir as ldd
     from licensedcode.models import rules_data_dir as rdd
     from licensedcode.models import load_licenses_from_multiple_dirs
     from licensedcode.models import validate_ignorable_clues
+    from licensedcode.models import RuleFileCache
     from licensedcode.legalese import common_license_words
 
     licenses_data_dir = licenses_data_dir or ldd
@@ -243,11 +345,39 @@ def build_index(
     additional_rule_dirs = get_rule_dirs(additional_dirs=additional_directories)
     validate_ignorable_clues(rule_directories=additional_rule_dirs, is_builtin=False)
     # then combine the rules in these additional directories with the rules in the original rules directory
-    rules = get_rules_from_multiple_dirs(
-        licenses_db=licenses_db,
-        additional_rules_data_dirs=additional_rule_dirs,
-        builtin_rule_data_dir=rules_data_dir,
-    )
+    rule_cache = None
+    if rule_cache_location:
+        rule_cache = RuleFileCache.load(rule_cache_location)
+
+    with_tokens = processes != 1 or rule_cache is not None
+    if base_index:
+        additional_licenses = {
+            key: lic for key, lic in licenses_db.items()
+            if not lic.is_builtin
+        }
+        rules = list(build_rules_from_licenses(additional_licenses))
+        for rules_dir in additional_rule_dirs:
+            rules.extend(load_rules(
+                rules_data_dir=rules_dir,
+                is_builtin=False,
+                with_tokens=with_tokens,
+                processes=processes,
+                rule_cache=rule_cache,
+            ))
+        validate_rules(rules=rules, licenses_by_key=licenses_db, thorough=False)
+    else:
+        rules = get_rules_from_multiple_dirs(
+            licenses_db=licenses_db,
+            additional_rules_data_dirs=additional_rule_dirs,
+            builtin_rule_data_dir=rules_data_dir,
+            with_tokens=with_tokens,
+            processes=processes,
+            rule_cache=rule_cache,
+        )
+
+    # save the cache before indexing as indexing updates the rules
+    if rule_cache:
+        rule_cache.save()
 
     legalese = common_license_words
     spdx_tokens = set(get_all_spdx_key_tokens(licenses_db))
@@ -263,6 +393,7 @@ def build_index(
         _spdx_tokens=spdx_tokens,
         _license_tokens=license_tokens,
         _all_languages=index_all_languages,
+        _base=base_index,
     )
 
 
@@ -429,14 +560,165 @@ def populate_cache(
     return _LICENSE_CACHE
 
 
-def load_cache_file(cache_file):
+def get_base_index_file(cache_file):
+    """
+    Return the location of the file of the base index of an overlay index saved
+    in ``cache_file``.
+    """
+    return os.path.join(os.path.dirname(cache_file), LICENSE_BASE_INDEX_FILENAME)
+
+
+def get_base_index_fingerprint(
+    licenses_data_dir,
+    rules_data_dir,
+    index_all_languages=False,
+):
+    """
+    Return a fingerprint string of a base index of the builtin licenses and
+    rules: this combines the ScanCode version, the ``index_all_languages`` flag
+    and a checksum of the licenses and rules data files in ``licenses_data_dir``
+    and ``rules_data_dir``.
+    """
+    from hashlib import sha1
+    from scancode_config import __version__ as scancode_version
+
+    checksum = sha1()
+    for data_dir in (licenses_data_dir, rules_data_dir):
+        for name in sorted(os.listdir(data_dir)):
+            location = os.path.join(data_dir, name)
+            if not os.path.isfile(location):
+                continue
+            with open(location, 'rb') as df:
+                content = df.read()
+            checksum.update(f'{name}\0{len(content)}\0'.encode('utf-8'))
+            checksum.update(content)
+
+    return f'{scancode_version}:{index_all_languages}:{checksum.hexdigest()}'
+
+
+def save_cache_file(
+    license_cache,
+    cache_file,
+    arrays_file,
+    use_mmap=False,
+    save_base=True,
+    base_fingerprint=None,
+):
+    """
+    Save the ``license_cache`` LicenseCache to ``cache_file``. If ``use_mmap``
+    is True, save the largest index arrays in the flat ``arrays_file`` instead of
+    the pickled ``cache_file``. Otherwise, remove any stale ``arrays_file``.
+
+    If the index is an overlay index, its base index is saved separately in a
+    base index file with its ``base_fingerprint`` (unless ``save_base`` is
+    False) and the largest arrays are those of this base index. The overlay
+    index is saved without its base index and base rules. Otherwise, remove any
+    stale base index file.
+    """
+    index = license_cache.index
+    base_index = index.base
+    base_index_file = get_base_index_file(cache_file)
+
+    if not base_index:
+        if os.path.exists(base_index_file):
+            os.remove(base_index_file)
+        _save_pickle(
+            obj=license_cache,
+            index=index,
+            location=cache_file,
+            arrays_file=arrays_file,
+            use_mmap=use_mmap,
+        )
+        return
+
+    if save_base:
+        _save_pickle(
+            obj=(base_fingerprint, base_index),
+            index=base_index,
+            location=base_index_file,
+            arrays_file=arrays_file,
+            use_mmap=use_mmap,
+        )
+
+    rules_by_id = index.rules_by_id
+    try:
+        # the base and its rules are loaded back from the base index file
+        index.base = LICENSE_BASE_INDEX_FILENAME
+        index.rules_by_id = rules_by_id.maps[0]
+        with open(cache_file, 'wb') as fn:
+            pickle.dump(license_cache, fn, protocol=PICKLE_PROTOCOL)
+    finally:
+        index.base = base_index
+        index.rules_by_id = rules_by_id
+
+
+def _save_pickle(obj, index, location, arrays_file, use_mmap=False):
+    """
+    Save the ``obj`` object that is or contains the ``index`` LicenseIndex as a
+    pickle to ``location``. If ``use_mmap`` is True, save the largest ``index``
+    arrays in the flat ``arrays_file`` instead. Otherwise, remove any stale
+    ``arrays_file``.
+    """
+    from licensedcode import mapped_index
+
+    # an index loaded from flat arrays cannot be pickled as-is
+    use_mmap = use_mmap or isinstance(index.tids_by_rid, mapped_index.MappedArrays)
+
+    if not use_mmap:
+        if os.path.exists(arrays_file):
+            os.remove(arrays_file)
+        with open(location, 'wb') as fn:
+            pickle.dump(obj, fn, protocol=PICKLE_PROTOCOL)
+        return
+
+    mapped_index.dump(index=index, location=arrays_file)
+
+    tids_by_rid = index.tids_by_rid
+    high_postings_by_rid = index.high_postings_by_rid
+    try:
+        # these are loaded back from the arrays_file
+        index.tids_by_rid = None
+        index.high_postings_by_rid = None
+        with open(location, 'wb') as fn:
+            pickle.dump(obj, fn, protocol=PICKLE_PROTOCOL)
+    finally:
+        index.tids_by_rid = tids_by_rid
+        index.high_postings_by_rid = high_postings_by_rid
+
+
+def _load_mapped_arrays(index, arrays_file):
     """
-    Return a LicenseCache loaded from ``cache_file``.
+    Load the largest arrays of the ``index`` LicenseIndex from the flat
+    ``arrays_file`` memory-mapped arrays if the index was saved with these.
+    """
+    if index.tids_by_rid is None:
+        from licensedcode import mapped_index
+        tids_by_rid, high_postings_by_rid = mapped_index.load(arrays_file)
+        index.tids_by_rid = tids_by_rid
+        index.high_postings_by_rid = high_postings_by_rid
+
+
+def load_cache_file(cache_file, arrays_file=None):
+    """
+    Return a LicenseCache loaded from ``cache_file`` and from the flat
+    ``arrays_file`` memory-mapped arrays if the cache was saved with these.
+    The base index of an overlay index is loaded from its base index file.
     """
     with open(cache_file, 'rb') as lfc:
         # Note: weird but read() + loads() is much (twice++???) faster than load()
         try:
-            return pickle.load(lfc)
+            license_cache = pickle.load(lfc)
+            index = license_cache.index
+            if index.base:
+                with open(get_base_index_file(cache_file), 'rb') as bif:
+                    _base_fingerprint, base_index = pickle.load(bif)
+                if len(base_index.rules_by_rid) != index.rid_offset:
+                    raise Exception('The base index does not match its overlay index.')
+                _load_mapped_arrays(index=base_index, arrays_file=arrays_file)
+                index.set_base(base_index)
+            else:
+                _load_mapped_arrays(index=index, arrays_file=arrays_file)
+            return license_cache
         except Exception as e:
             msg = (
                 'ERROR: Failed to load license cache (the file may be corrupted ?).\n'
@@ -447,6 +729,29 @@ def load_cache_file(cache_file):
             raise Exception(msg) from e
 
 
+def load_base_index(cache_file, arrays_file, fingerprint):
+    """
+    Return the base LicenseIndex of the builtin licenses and rules of an overlay
+    index cached in ``cache_file`` or None. Return None if this base index was
+    not built with the same ``fingerprint``.
+    """
+    base_index_file = get_base_index_file(cache_file)
+    if not os.path.exists(base_index_file):
+        return
+
+    try:
+        with open(base_index_file, 'rb') as bif:
+            base_fingerprint, base_index = pickle.load(bif)
+        if base_fingerprint != fingerprint:
+            return
+        _load_mapped_arrays(index=base_index, arrays_file=arrays_file)
+    except Exception:
+        # this is a cache: we rebuild a base index if we cannot load it
+        return
+
+    return base_index
+
+
 def get_index(
     only_builtin=False,
     force=False,
@@ -464,19 +464,6 @@ class LicenseDetection:
             license_expression = licensing.parse(match.license_expression)
             self.license_expression = str(license_expression)
 
-    def percentage_license_text_of_file(self, qspans):
-        """
-        Return the percentage of license text in the file where the
-        license was detected, from a list of `qspans`.
-
-        Here qspans is a list of all individual qspans corresponding
-        to the LicenseDetections for the file.
-        """
-
-        matched_tokens_length = len(Span().union(*qspans))
-        query_tokens_length = self.query.tokens_length(with_unknown=True)
-        return round((matched_tokens_length / query_tokens_length) * 100, 2)
-
     def to_dict(
         self,
         include_text=False,
@@ -1741,6 +1728,30 @@ def analyze_detection(license_matches, package_license=False):
         return DetectionCategory.PERFECT_DETECTION.value
 
 
+def get_percentage_license_text_of_file(license_matches):
+    """
+    Return the percentage of license text in a file given a list of all the
+    ``license_matches`` LicenseMatch of all the LicenseDetections of this file.
+
+    A large file is matched as a sequence of query windows and its matches then
+    point to the Query of their window: the percentage is computed on the
+    windows with matches.
+    """
+    qspans_by_query = {}
+    for license_match in license_matches:
+        qspans_by_query.setdefault(license_match.query, []).append(license_match.qspan)
+
+    matched_tokens_length = 0
+    query_tokens_length = 0
+    for query, qspans in qspans_by_query.items():
+        matched_tokens_length += len(Span().union(*qspans))
+        query_tokens_length += query.tokens_length(with_unknown=True)
+
+    if not query_tokens_length:
+        return 0
+    return round((matched_tokens_length / query_tokens_length) * 100, 2)
+
+
 def group_matches(license_matches, lines_threshold=LINES_THRESHOLD):
     """
     Given a list of ``license_matches`` LicenseMatch objects, yield lists of
@@ -9,6 +9,7 @@
 #
 
 from array import array
+from collections import ChainMap
 from collections import Counter
 from collections import defaultdict
 from functools import partial
@@ -29,8 +30,11 @@ from licensedcode import match_seq
 from licensedcode import match_set
 from licensedcode import match_spdx_lid
 from licensedcode import match_unknown
+from licensedcode.match_stats import get_current_stats
 from licensedcode.dmp import match_blocks as match_blocks_dmp
+from licensedcode.mapped_index import MappedPostings
 from licensedcode.seq import match_blocks as match_blocks_seq
+from licensedcode.seq_array import match_blocks as match_blocks_array
 from licensedcode import query
 from licensedcode import tokenize
 from licensedcode.spans import Span
@@ -104,6 +108,16 @@ USE_BIGRAM_MULTISETS = False
 # Enable using an bigrams for multisets/bags instead of tokens
 USE_DMP = False
 
+########## Use the array-backed sequence alignment for approx matching
+# Enable using the seq_array alignment on the unfiltered rule high postings
+# instead of the seq alignment. Both return the same matching blocks.
+USE_SEQ_ARRAY = True
+
+########## Skip matching texts that cannot match any rule
+# Enable a prefilter that checks the tokens of a Query before running the
+# matchers such that queries that cannot be matched return no match right away.
+USE_PREFILTER = True
+
 ############################## Feature SWITCHES ################################
 
 # Maximum number of unique tokens we can handle: 16 bits signed integers are up
@@ -140,6 +154,8 @@ class LicenseIndex(object):
         'sets_by_rid',
         'msets_by_rid',
 
+        'high_rids_by_tid',
+
         'rid_by_hash',
         'rules_automaton',
         'fragments_automaton',
@@ -150,8 +166,13 @@ class LicenseIndex(object):
         'false_positive_rids',
         'approx_matchable_rids',
 
+        'prefilter_rids_by_tid',
+
         'optimized',
         'all_languages',
+
+        'base',
+        'rid_offset',
     )
 
     def __init__(
@@ -161,6 +182,7 @@ class LicenseIndex(object):
         _spdx_tokens=frozenset(),
         _license_tokens=frozenset(),
         _all_languages=False,
+        _base=None,
     ):
         """
         Initialize the index with an iterable of Rule objects.
@@ -169,6 +191,11 @@ class LicenseIndex(object):
         ``_license_tokens`` is a set of "license" tokens used as start or end of a rule
         If ``_all_languages`` is True, use all spoken languages license and rules.
         Otherwise, use only English rules and licenses.
+
+        ``_base`` is an optional optimized LicenseIndex used as a read-only base
+        layer. This index is then an overlay that extends the ``_base``
+        dictionary and contains only the ``rules``: matching this index matches
+        both the rules of the ``_base`` and of the overlay.
         """
         # total number of unique known tokens
         self.len_tokens = 0
@@ -209,6 +236,11 @@ class LicenseIndex(object):
         self.sets_by_rid = []
         self.msets_by_rid = []
 
+        # mapping-like of legalese token id -> array of ids of the approx
+        # matchable rules that contain this token. This is an inverted index
+        # used to select the candidate rules for approximate matching.
+        self.high_rids_by_tid = []
+
         # mapping of hash -> single rid for hash match: duplicated rules are not allowed
         self.rid_by_hash = {}
 
@@ -228,6 +260,12 @@ class LicenseIndex(object):
         # match. Other rules can only be matched exactly
         self.approx_matchable_rids = set()
 
+        # mapping of token id -> array of regular rule ids. Each regular rule
+        # is listed once under its token that is the least used in other rules.
+        # A rule can only be matched exactly in a text that contains this token
+        # and this is used to prefilter texts.
+        self.prefilter_rids_by_tid = {}
+
         # if True the index has been optimized and becomes read only:
         # no new rules can be added
         self.optimized = False
@@ -236,7 +274,14 @@ class LicenseIndex(object):
         # in all languages as opposed to be only in English.
         self.all_languages = _all_languages
 
-        if rules:
+        # the base LicenseIndex of an overlay index or None
+        self.base = _base
+
+        # the rule ids of an overlay index follow the rule ids of its base: the
+        # rid of a Rule is its position in the rid-> data lists plus this offset
+        self.rid_offset = len(_base.rules_by_rid) if _base else 0
+
+        if rules or _base:
             if TRACE_INDEXING_PERF:
                 start = time()
                 logger_debug('LicenseIndex: building index.')
@@ -287,11 +332,21 @@ class LicenseIndex(object):
         # valid "unichr" values, making it easier downstream when used in
         # automatons
 
-        self.dictionary = dictionary = dict(_legalese)
-        dictionary_get = dictionary.get
+        base = self.base
+        if base:
+            # an overlay extends the base dictionary: the base token ids and
+            # legalese are unchanged and new tokens are never legalese
+            if not base.optimized:
+                raise Exception('A base index must be optimized.')
+            self.dictionary = dictionary = dict(base.dictionary)
+            self.len_legalese = len_legalese = base.len_legalese
+            highest_tid = base.len_tokens - 1
+        else:
+            self.dictionary = dictionary = dict(_legalese)
+            self.len_legalese = len_legalese = len(dictionary)
+            highest_tid = len_legalese - 1
 
-        self.len_legalese = len_legalese = len(dictionary)
-        highest_tid = len_legalese - 1
+        dictionary_get = dictionary.get
 
         # Add SPDX key tokens to the dictionary: these are always treated as
         # non-legalese. This may seem weird but they are detected in expressions
@@ -309,7 +364,9 @@ class LicenseIndex(object):
                 dictionary[sts] = stid
 
         self.rules_by_rid = rules_by_rid = list(rules)
-        self.rules_by_id = {r.identifier: r for r in self.rules_by_rid}
+        self.rules_by_id = {r.identifier: r for r in rules_by_rid}
+        if base:
+            self.set_base(base)
         if TRACE_INDEXING:
             for _rid, _rule in enumerate(rules_by_rid):
                 logger_debug('rules_by_rid:', _rid, _rule)
@@ -372,13 +429,14 @@ class LicenseIndex(object):
         min_len_starts = SMALL_RULE * 6
 
         ngram_len = AHO_FRAGMENTS_NGRAM_LEN
+        rid_offset = self.rid_offset
 
         # Index each rule
         ########################################################################
         for rid, rule in enumerate(rules_by_rid):
 
             # assign rid
-            rule.rid = rid
+            rule.rid = rid + rid_offset
 
             rule_token_ids = array('h', [])
             tids_by_rid_append(rule_token_ids)
@@ -546,12 +604,28 @@ class LicenseIndex(object):
             ts for ts, _tid in sorted(dictionary.items(), key=itemgetter(1))]
         self.len_tokens = len_tokens = len(tokens_by_tid)
 
+        # Create the legalese token id -> rule ids inverted index for approx
+        # matching
+        ########################################################################
+        self.high_rids_by_tid = match_set.build_high_rids_by_tid(
+            sets_by_rid=sets_by_rid,
+            rids=self.approx_matchable_rids,
+            len_legalese=len_legalese,
+        )
+
         # some tokens are made entirely of digits and these can create some
         # worst case behavior when there are long runs on these
         ########################################################################
         self.digit_only_tids = intbitset([
             i for i, s in enumerate(self.tokens_by_tid) if s.isdigit()])
 
+        # Create the prefilter token id -> rule ids mapping
+        ########################################################################
+        self.prefilter_rids_by_tid = build_prefilter_rids_by_tid(
+            sets_by_rid=sets_by_rid,
+            rids=self.regular_rids,
+        )
+
         # Finalize automatons
         ########################################################################
         self.rules_automaton.make_automaton()
@@ -571,6 +645,16 @@ class LicenseIndex(object):
         msg = 'Cannot support more than licensedcode.index.MAX_TOKENS: %d' % MAX_TOKENS
         assert len_tokens <= MAX_TOKENS, msg
 
+        if base:
+            # overlay rules cannot be duplicates of the base rules either
+            base_rid_by_hash = dict(base.rid_by_hash)
+            for rid in base.false_positive_rids:
+                base_rid_by_hash[match_hash_index_hash(base.tids_by_rid[rid])] = rid
+            for rule_hash, rules in dupe_rules_by_hash.items():
+                base_rid = base_rid_by_hash.get(rule_hash)
+                if base_rid is not None:
+                    rules.append(base.rules_by_rid[base_rid])
+
         dupe_rule_paths = []
         for rules in dupe_rules_by_hash.values():
             if len(rules) == 1:
@@ -585,6 +669,114 @@ class LicenseIndex(object):
 
         self.optimized = True
 
+    def layers(self):
+        """
+        Return a list of the LicenseIndex layers of this index: the base index
+        followed by this overlay index for an overlay or only this index.
+        """
+        if self.base:
+            return [self.base, self]
+        return [self]
+
+    def set_base(self, base):
+        """
+        Set the ``base`` LicenseIndex of this overlay index, such as when
+        loading an overlay index that was saved without its base.
+        """
+        self.base = base
+        if isinstance(self.rules_by_id, ChainMap):
+            rules_by_id = self.rules_by_id.maps[0]
+        else:
+            rules_by_id = self.rules_by_id
+        # the base rules are looked up in the base and not copied in the overlay
+        self.rules_by_id = ChainMap(rules_by_id, base.rules_by_id)
+
+    def get_rule_layer(self, rule):
+        """
+        Return the LicenseIndex layer of this index where ``rule`` is indexed or
+        None.
+        """
+        rid = rule.rid
+        if rid is None:
+            return
+        for layer in reversed(self.layers()):
+            if layer.rid_offset <= rid < layer.rid_offset + len(layer.rules_by_rid):
+                return layer
+
+    def may_match_query(self, qry, approximate=True, unknown_licenses=False):
+        """
+        Return True if the ``qry`` Query may be matched by this index. Return
+        False if this query cannot be matched. See Index.match() for the
+        ``approximate`` and ``unknown_licenses`` arguments.
+
+        This is a cheap check on the set of the query token ids. It only uses
+        conditions that are required for each matcher to return a match such
+        that no match can be lost:
+
+        - a rule can be matched exactly (including with a hash) only if the
+          query contains all its tokens.
+        - a rule can be matched approximately only if it is a matching
+          candidate for the set of the query tokens.
+        - an SPDX license identifier requires an SPDX license identifier line.
+        - an unknown license match requires at least a few legalese tokens.
+        """
+        if qry.spdx_lines:
+            return True
+
+        tokens = qry.tokens
+        len_legalese = self.len_legalese
+        len_legalese_tokens = sum(1 for tid in tokens if tid < len_legalese)
+
+        if unknown_licenses and len_legalese_tokens >= match_unknown.MIN_UNKNOWN_HIGH_LENGTH:
+            return True
+
+        qset = intbitset(tokens)
+        for layer in self.layers():
+            # exact matches
+            tids_by_rid = layer.tids_by_rid
+            prefilter_rids_by_tid_get = layer.prefilter_rids_by_tid.get
+            for tid in qset:
+                for rid in prefilter_rids_by_tid_get(tid, ()):
+                    if all(t in qset for t in tids_by_rid[rid]):
+                        return True
+
+            # approximate matches: this is the same candidate selection as in
+            # match_set.compute_candidates(). The query tokens set is a superset
+            # of the tokens set of any query run such that a rule that is not a
+            # candidate for the whole query is not a candidate for any run.
+            if approximate and len_legalese_tokens:
+                high_lengths = match_set.compute_high_intersections_lengths(
+                    qset=qset,
+                    high_rids_by_tid=layer.high_rids_by_tid,
+                    len_legalese=len_legalese,
+                )
+                sets_by_rid = layer.sets_by_rid
+                rules_by_rid = layer.rules_by_rid
+                approx_matchable_rids = layer.approx_matchable_rids
+                for rid, high_length in high_lengths.items():
+                    if rid not in approx_matchable_rids:
+                        continue
+
+                    rule = rules_by_rid[rid]
+                    if high_length < rule.min_high_matched_length_unique:
+                        continue
+
+                    scores_vectors, _ = match_set.compare_token_sets(
+                        qset=qset,
+                        iset=sets_by_rid[rid],
+                        intersector=match_set.tids_sets_intersector,
+                        counter=match_set.tids_set_counter,
+                        high_intersection_filter=match_set.high_tids_set_subset,
+                        len_legalese=len_legalese,
+                        unique=True,
+                        rule=rule,
+                        filter_non_matching=True,
+                    )
+                    if scores_vectors:
+                        return True
+
+        return False
+
     def debug_matches(
         self,
         matches,
@@ -675,12 +867,14 @@ class LicenseIndex(object):
         """
         wqr = query.whole_query_run()
 
-        matches = match_aho.exact_match(
-            idx=self,
-            query_run=wqr,
-            automaton=self.rules_automaton,
-            deadline=deadline,
-        )
+        matches = []
+        for layer in self.layers():
+            matches.extend(match_aho.exact_match(
+                idx=layer,
+                query_run=wqr,
+                automaton=layer.rules_automaton,
+                deadline=deadline,
+            ))
 
         matches, _discarded = match.refine_matches(
             matches=matches,
@@ -695,60 +889,83 @@ class LicenseIndex(object):
         query,
         matched_qspans,
         deadline=sys.maxsize,
+        stats=None,
         **kwargs,
     ):
         """
         Approximate matching strategy breaking a query in query_runs and using
         fragment matching. Return a list of matches.
+        Collect matching counters in the ``stats`` MatchStats if provided.
         """
         matches = []
 
+        if stats:
+            start = time()
+
         for query_run in query.query_runs:
             # we cannot do a sequence match in query run without some high token left
             if not query_run.is_matchable(include_low=False, qspans=matched_qspans):
                 continue
-            qrun_matches = match_aho.match_fragments(self, query_run)
-            matches.extend(match.merge_matches(qrun_matches))
+            for layer in self.layers():
+                qrun_matches = match_aho.match_fragments(layer, query_run)
+                matches.extend(match.merge_matches(qrun_matches))
             # break if deadline has passed
             if time() > deadline:
                 break
 
+        if stats:
+            stats.add_matcher('aho-frag', time() - start, len(matches))
+
         return matches
 
     def get_approximate_matches(self, query, matched_qspans, existing_matches,
-                                deadline=sys.maxsize, **kwargs):
+                                deadline=sys.maxsize, stats=None, **kwargs):
         """
         Approximate matching strategy breaking a query in query_runs and using
         multiple local alignments (aka. diff). Return a list of matches.
+
+        Collect matching counters in the ``stats`` MatchStats if provided.
         """
         matches = []
-        matchable_rids = self.approx_matchable_rids
 
+        if stats:
+            start = time()
+
+        layers = self.layers()
         already_matched_qspans = matched_qspans[:]
 
         MAX_NEAR_DUPE_CANDIDATES = 10
 
         # first check if the whole file may be close, near-dupe match
         whole_query_run = query.whole_query_run()
-        near_dupe_candidates = match_set.compute_candidates(
-            query_run=whole_query_run,
-            idx=self,
-            matchable_rids=matchable_rids,
-            top=MAX_NEAR_DUPE_CANDIDATES,
-            high_resemblance=True,
-            _use_bigrams=USE_BIGRAM_MULTISETS,
-        )
+        near_dupe_candidates_by_layer = [
+            (layer, match_set.compute_candidates(
+                query_run=whole_query_run,
+                idx=layer,
+                matchable_rids=layer.approx_matchable_rids,
+                top=MAX_NEAR_DUPE_CANDIDATES,
+                high_resemblance=True,
+                _use_bigrams=USE_BIGRAM_MULTISETS,
+            ))
+            for layer in layers
+        ]
 
         # if near duplicates, we only match the whole file at once against these
         # candidates
-        if near_dupe_candidates:
-            if TRACE_APPROX_CANDIDATES:
-                logger_debug('get_query_run_approximate_matches: near dupe candidates:')
-                for rank, ((sv1, sv2), _rid, can, _inter) in enumerate(near_dupe_candidates, 1):
-                    logger_debug(rank, sv1, sv2, can.identifier)
+        if any(candidates for _layer, candidates in near_dupe_candidates_by_layer):
+            matched = []
+            for layer, near_dupe_candidates in near_dupe_candidates_by_layer:
+                if not near_dupe_candidates:
+                    continue
 
-            matched = self.get_query_run_approximate_matches(
-                whole_query_run, near_dupe_candidates, already_matched_qspans, deadline)
+                if TRACE_APPROX_CANDIDATES:
+                    logger_debug('get_query_run_approximate_matches: near dupe candidates:')
+                    for rank, ((sv1, sv2), _rid, can, _inter) in enumerate(near_dupe_candidates, 1):
+                        logger_debug(rank, sv1, sv2, can.identifier)
+
+                matched.extend(layer.get_query_run_approximate_matches(
+                    whole_query_run, near_dupe_candidates, already_matched_qspans,
+                    deadline, stats=stats))
 
             matches.extend(matched)
 
@@ -758,10 +975,20 @@ class LicenseIndex(object):
                 query.subtract(qspan)
                 already_matched_qspans.append(qspan)
 
+            if stats:
+                stats.add_matcher('near_dupe', time() - start, len(matched))
+
             # break if deadline has passed
             if time() > deadline:
                 return matches
 
+        elif stats:
+            stats.add_matcher('near_dupe', time() - start, 0)
+
+        if stats:
+            start = time()
+            seq_matches_count = len(matches)
+
         # otherwise, and in all cases we break things in smaller query runs and
         # match each separately
 
@@ -773,30 +1000,34 @@ class LicenseIndex(object):
 
         MAX_CANDIDATES = 70
         for query_run in query.query_runs:
-            # inverted index match and ranking, query run-level
-            candidates = match_set.compute_candidates(
-                query_run=query_run,
-                idx=self,
-                matchable_rids=matchable_rids,
-                top=MAX_CANDIDATES,
-                high_resemblance=False,
-                _use_bigrams=USE_BIGRAM_MULTISETS,
-            )
+            for layer in layers:
+                # inverted index match and ranking, query run-level
+                candidates = match_set.compute_candidates(
+                    query_run=query_run,
+                    idx=layer,
+                    matchable_rids=layer.approx_matchable_rids,
+                    top=MAX_CANDIDATES,
+                    high_resemblance=False,
+                    _use_bigrams=USE_BIGRAM_MULTISETS,
+                )
 
-            if TRACE_APPROX_CANDIDATES:
-                logger_debug('get_query_run_approximate_matches: candidates:')
-                for rank, ((sv1, sv2), _rid, can, _inter) in enumerate(candidates, 1):
-                    logger_debug(rank, sv1, sv2, can.identifier)
+                if TRACE_APPROX_CANDIDATES:
+                    logger_debug('get_query_run_approximate_matches: candidates:')
+                    for rank, ((sv1, sv2), _rid, can, _inter) in enumerate(candidates, 1):
+                        logger_debug(rank, sv1, sv2, can.identifier)
 
-            matched = self.get_query_run_approximate_matches(
-                query_run, candidates, matched_qspans, deadline)
+                matched = layer.get_query_run_approximate_matches(
+                    query_run, candidates, matched_qspans, deadline, stats=stats)
 
-            matches.extend(matched)
+                matches.extend(matched)
 
             # break if deadline has passed
             if time() > deadline:
                 break
 
+        if stats:
+            stats.add_matcher('seq', time() - start, len(matches) - seq_matches_count)
+
         return matches
 
     def get_query_run_approximate_matches(
@@ -805,10 +1036,12 @@ class LicenseIndex(object):
         candidates,
         matched_qspans,
         deadline=sys.maxsize,
+        stats=None,
         **kwargs,
     ):
         """
         Return Return a list of approximate matches for a single query run.
+        Collect matching counters in the ``stats`` MatchStats if provided.
         """
         matches = []
 
@@ -825,12 +1058,26 @@ class LicenseIndex(object):
         # matches returned
 
         for _score_vecs, rid, candidate_rule, high_intersection in candidates:
+            if stats:
+                stats.candidates += 1
+
             if USE_DMP:
                 # Myers diff works best when the difference are small, otherwise
                 # it performs rather poorly as it is not aware of legalese
                 match_blocks = match_blocks_dmp
                 high_postings = None
 
+            elif USE_SEQ_ARRAY:
+                # the rule high postings are used as-is: only the high tokens
+                # of the query run are matchable and these are all in the
+                # high_intersection
+                match_blocks = match_blocks_array
+                high_postings_by_rid = self.high_postings_by_rid
+                if isinstance(high_postings_by_rid, MappedPostings):
+                    high_postings = high_postings_by_rid.get_rule_postings(rid)
+                else:
+                    high_postings = high_postings_by_rid[rid]
+
             else:
                 # we prefer to use the high tken aware seq matching only
                 # when the matches are not clear. it works best when things
@@ -843,6 +1090,9 @@ class LicenseIndex(object):
 
             start_offset = 0
             while True:
+                if stats:
+                    stats.alignments += 1
+
                 rule_matches = match_seq.match_sequence(
                     self, candidate_rule, query_run,
                     high_postings=high_postings,
@@ -893,6 +1143,7 @@ class LicenseIndex(object):
         approximate=True,
         unknown_licenses=False,
         deadline=sys.maxsize,
+        stats=None,
         _skip_hash_match=False,
         **kwargs,
     ):
@@ -915,9 +1166,17 @@ class LicenseIndex(object):
         If ``unknown_licenses`` is True, perform unknown licenses matching after
         all regular matching steps.
 
+        Large text files are matched as a sequence of bounded, overlapping
+        query windows such that memory does not grow with the file size. See
+        ``query.build_query_windows()``.
+
         ``deadline`` is a time.time() value in seconds by which the processing
         should stop and return whatever was matched so far.
 
+        If ``stats`` is a MatchStats, collect per-matcher timings and counters
+        in it. Otherwise, use the MatchStats of an active
+        ``licensedcode.match_stats.collecting_stats()`` context if any.
+
         ``_skip_hash_match`` is used only for testing.
         """
         assert 0 <= min_score <= 100
@@ -925,6 +1184,24 @@ class LicenseIndex(object):
         if not location and not query_string:
             return []
 
+        if location and not as_expression and query.use_query_windows(location):
+            windows = query.build_query_windows(
+                location=location,
+                idx=self,
+                line_threshold=15,
+            )
+            return self.match_query_windows(
+                windows=windows,
+                min_score=min_score,
+                expression_symbols=expression_symbols,
+                approximate=approximate,
+                unknown_licenses=unknown_licenses,
+                deadline=deadline,
+                stats=stats,
+                _skip_hash_match=_skip_hash_match,
+                **kwargs,
+            )
+
         qry = query.build_query(
             location=location,
             query_string=query_string,
@@ -947,10 +1224,118 @@ class LicenseIndex(object):
             approximate=approximate,
             unknown_licenses=unknown_licenses,
             deadline=deadline,
+            stats=stats,
             _skip_hash_match=_skip_hash_match,
             **kwargs,
         )
 
+    def match_query_windows(self, windows, deadline=sys.maxsize, **kwargs):
+        """
+        Return a list of LicenseMatch by matching each Query of a ``windows``
+        iterable of (Query, last line) as returned by
+        ``query.build_query_windows()``. See Index.match() for arguments
+        documentation.
+
+        Matches found in the lines shared by two consecutive windows are kept
+        only once: a window keeps the matches that start after the first line
+        of this window and up to its last line. A match that is the tail of a
+        match of the previous window is discarded.
+
+        The text of the query run that straddles the end of the previous window
+        may have been matched only in parts in each window. When both windows
+        have matches in this text, these lines are stitched: they are matched
+        again as a single Query such that their matches are merged and refined
+        as in a whole file Query, and these matches replace the matches of each
+        window for these lines.
+
+        The matches of each window point to the Query of this window or to the
+        Query of their stitched lines.
+        """
+        matches = []
+        # matches kept from the previous window
+        previous_matches = []
+        # the Query of the previous window
+        previous_qry = None
+        # the last line of the previous window is the first line of this window
+        first_line = None
+        # the actual last line of the text of the previous window
+        previous_end_line = None
+
+        for qry, last_line in windows:
+            window_matches = self.match_query(qry=qry, deadline=deadline, **kwargs)
+
+            kept = []
+            for window_match in window_matches:
+                start_line = window_match.start_line
+                end_line = window_match.end_line
+
+                if (
+                    first_line is not None
+                    and start_line <= first_line
+                    and end_line <= previous_end_line
+                ):
+                    # found whole in the previous window
+                    continue
+
+                if last_line is not None and start_line > last_line:
+                    # found whole in the next window
+                    continue
+
+                if any(
+                    pm.start_line <= start_line and end_line <= pm.end_line
+                    for pm in previous_matches
+                ):
+                    # the tail of a match of the previous window
+                    continue
+
+                kept.append(window_match)
+
+            stitch = previous_qry and get_stitch_line_range(
+                previous_qry=previous_qry,
+                qry=qry,
+                previous_matches=previous_matches,
+                matches=kept,
+            )
+            if stitch:
+                stitch_start_line, stitch_end_line = stitch
+                # the lines come from the queries of the previous matches, of
+                # the previous window and of this window
+                queries = {pm.query: None for pm in previous_matches}
+                queries = sorted(queries, key=lambda q: q.start_line)
+                stitched_qry = query.build_stitched_query(
+                    queries=queries + [previous_qry, qry],
+                    start_line=stitch_start_line,
+                    end_line=stitch_end_line,
+                )
+                stitched_matches = self.match_query(
+                    qry=stitched_qry,
+                    deadline=deadline,
+                    **kwargs,
+                )
+
+                # the stitched matches replace the matches of their lines
+                is_outside = lambda m: (
+                    m.end_line < stitch_start_line
+                    or m.start_line > stitch_end_line
+                )
+                previous_matches = [m for m in previous_matches if is_outside(m)]
+                kept = [m for m in kept if is_outside(m)]
+                kept.extend(stitched_matches)
+
+            matches.extend(previous_matches)
+            kept.sort(key=lambda m: m.start_line)
+            previous_matches = kept
+            previous_qry = qry
+            previous_end_line = get_end_line(qry)
+            first_line = last_line
+
+            # break if deadline has passed
+            if time() > deadline:
+                break
+
+        matches.extend(previous_matches)
+        return matches
+
     def match_query(
         self,
         qry,
@@ -960,6 +1345,7 @@ class LicenseIndex(object):
         approximate=True,
         unknown_licenses=False,
         deadline=sys.maxsize,
+        stats=None,
         _skip_hash_match=False,
         **kwargs,
     ):
@@ -967,13 +1353,42 @@ class LicenseIndex(object):
         Return a sequence of LicenseMatch by matching the ``qry`` Query against
         this index. See Index.match() for arguments documentation.
         """
+        if stats is None:
+            stats = get_current_stats()
 
         whole_query_run = qry.whole_query_run()
         if not whole_query_run or not whole_query_run.matchables:
             return []
 
+        if (
+            USE_PREFILTER
+            and not as_expression
+            and not self.may_match_query(
+                qry=qry,
+                approximate=approximate,
+                unknown_licenses=unknown_licenses,
+            )
+        ):
+            if stats:
+                stats.prefiltered += 1
+            return []
+
+        if stats:
+            stats.queries += 1
+            stats.query_runs += len(qry.query_runs)
+
         if not _skip_hash_match:
-            matches = match_hash.hash_match(self, whole_query_run)
+            if stats:
+                start = time()
+
+            for layer in self.layers():
+                matches = match_hash.hash_match(layer, whole_query_run)
+                if matches:
+                    break
+
+            if stats:
+                stats.add_matcher('hash', time() - start, len(matches))
+
             if matches:
                 match.set_matched_lines(matches, qry.line_by_pos)
                 return matches
@@ -984,7 +1399,14 @@ class LicenseIndex(object):
         )
 
         if as_expression:
+            if stats:
+                start = time()
+
             matches = get_spdx_id_matches(qry, from_spdx_id_lines=False)
+
+            if stats:
+                stats.add_matcher('spdx_lid', time() - start, len(matches))
+
             match.set_matched_lines(matches, qry.line_by_pos)
             return matches
 
@@ -992,8 +1414,10 @@ class LicenseIndex(object):
 
         if USE_AHO_FRAGMENTS:
             approx = self.get_fragments_matches
+            approx_name = 'aho-frag'
         else:
             approx = self.get_approximate_matches
+            approx_name = 'seq'
 
         matchers = [
             # matcher, include_low in post-matching remaining matchable check
@@ -1002,7 +1426,7 @@ class LicenseIndex(object):
         ]
 
         if approximate:
-            matchers += [(approx, False, 'seq'), ]
+            matchers += [(approx, False, approx_name), ]
 
         already_matched_qspans = []
         for matcher, include_low, matcher_name in matchers:
@@ -1010,13 +1434,21 @@ class LicenseIndex(object):
                 logger_debug()
                 logger_debug('match_query: matching with matcher:', matcher_name)
 
+            if stats:
+                start = time()
+
             matched = matcher(
                 qry,
                 matched_qspans=already_matched_qspans,
                 existing_matches=matches,
                 deadline=deadline,
+                stats=stats,
             )
 
+            # the approximate matchers collect their own timings
+            if stats and matcher is not approx:
+                stats.add_matcher(matcher_name, time() - start, len(matched))
+
             if TRACE:
                 self.debug_matches(
                     matches=matched,
@@ -1054,8 +1486,13 @@ class LicenseIndex(object):
 
             # break if deadline has passed
             if time() > deadline:
+                if stats:
+                    stats.deadline_reached = True
                 break
 
+        if stats:
+            start = time()
+
         # refining matches without filtering false positives
         matches, _discarded = match.refine_matches(
             matches=matches,
@@ -1065,7 +1502,13 @@ class LicenseIndex(object):
             merge=True,
         )
 
+        if stats:
+            stats.refine_time += time() - start
+
         if unknown_licenses:
+            if stats:
+                start = time()
+
             good_matches, weak_matches = match.split_weak_matches(matches)
             # collect the positions that are "good matches" to exclude from
             # matching for unknown_licenses. Create a Span to check for unknown
@@ -1088,7 +1531,7 @@ class LicenseIndex(object):
                 unknown_match = match_unknown.match_unknowns(
                     idx=self,
                     query_run=unquery_run,
-                    automaton=self.unknown_automaton,
+                    automaton=[layer.unknown_automaton for layer in self.layers()],
                 )
 
                 if unknown_match:
@@ -1099,6 +1542,9 @@ class LicenseIndex(object):
                 good_matches=good_matches,
             )
 
+            if stats:
+                stats.add_matcher('unknown', time() - start, len(unknown_matches))
+
             matches.extend(unknown_matches)
             # reinject weak matches and let refine matches keep the bests
             matches.extend(weak_matches)
@@ -1114,6 +1560,9 @@ class LicenseIndex(object):
                 query_string=qry.query_string,
                 with_text=True, qry=qry)
 
+        if stats:
+            start = time()
+
         matches, _discarded = match.refine_matches(
             matches=matches,
             query=qry,
@@ -1122,6 +1571,9 @@ class LicenseIndex(object):
             merge=True,
         )
 
+        if stats:
+            stats.refine_time += time() - start
+
         matches.sort()
 
         if TRACE:
@@ -1157,6 +1609,8 @@ class LicenseIndex(object):
             'sets_by_rid',
             'msets_by_rid',
 
+            'high_rids_by_tid',
+
             'regular_rids',
             'approx_matchable_rids',
             'false_positive_rids',
@@ -1187,6 +1641,24 @@ class LicenseIndex(object):
         return u' '.join('None' if t is None else self.tokens_by_tid[t] for t in tokens)
 
 
+def build_prefilter_rids_by_tid(sets_by_rid, rids):
+    """
+    Return a mapping of {token id: array of rule ids} where each rule id of the
+    ``rids`` set of rule ids is listed once under the token id of its
+    ``sets_by_rid`` token ids set that is the least used in these rules.
+    """
+    rules_count_by_tid = Counter()
+    for rid in rids:
+        rules_count_by_tid.update(sets_by_rid[rid])
+
+    rids_by_tid = defaultdict(list)
+    for rid in sorted(rids):
+        tid = min(sets_by_rid[rid], key=lambda t: (rules_count_by_tid[t], t))
+        rids_by_tid[tid].append(rid)
+
+    return {tid: array('i', tid_rids) for tid, tid_rids in rids_by_tid.items()}
+
+
 def get_weak_rids(len_legalese, tids_by_rid, _idx):
     """
     Return a set of "weak" rule ids made entirely of junk tokens: they can only
@@ -1212,6 +1684,64 @@ def get_weak_rids(len_legalese, tids_by_rid, _idx):
     return weak_rids
 
 
+def get_end_line(qry):
+    """
+    Return the last line of the text of a ``qry`` Query.
+    """
+    return qry.start_line + qry.query_string.count('\n')
+
+
+def get_stitch_line_range(previous_qry, qry, previous_matches, matches):
+    """
+    Return a tuple of (start line, end line) of the lines to match again as a
+    single Query for the text that straddles the end of the ``previous_qry``
+    Query of the previous window and continues in the ``qry`` Query of this
+    window. Return None if there is nothing to stitch.
+
+    These lines start with the last query run of the previous window or with
+    the earliest of the ``previous_matches`` of the previous window in this run.
+    They end with the query run of this window that runs past the end of the
+    previous window. There is something to stitch only if there are
+    ``previous_matches`` in these lines and ``matches`` of this window in these
+    lines that run past the end of the previous window.
+    """
+    if not previous_qry.query_runs:
+        return
+
+    first_line = qry.start_line
+    previous_end_line = get_end_line(previous_qry)
+
+    previous_run = previous_qry.query_runs[-1]
+    if previous_run.end_line < first_line:
+        return
+
+    current_run = None
+    for query_run in qry.query_runs:
+        if query_run.start_line <= previous_end_line < query_run.end_line:
+            current_run = query_run
+            break
+
+    if not current_run:
+        return
+
+    start_lines = [
+        pm.start_line for pm in previous_matches
+        if pm.end_line >= previous_run.start_line
+    ]
+    if not start_lines:
+        return
+
+    end_line = current_run.end_line
+    if not any(
+        m.end_line > previous_end_line and m.start_line <= end_line
+        for m in matches
+    ):
+        return
+
+    start_line = min(start_lines + [previous_run.start_line])
+    return start_line, end_line
+
+
 def get_matched_rule_ids(matches, query_run):
     """
     Yield the subset of matched rule ids from a `matches` LicenseMatch
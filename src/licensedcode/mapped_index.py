@@ -0,0 +1,240 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import json
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+"""
+Flat, memory-mapped storage for the largest per-rule LicenseIndex structures:
+the token ids of each rule (``tids_by_rid``) and the high token postings of each
+rule (``high_postings_by_rid``).
+
+These are stored as a few flat arrays back to back in a single file with a small
+JSON header. The file is memory-mapped read-only and every per-rule item is a
+zero-copy memoryview slice of this mapping. Since the mapping is read-only and
+shared, all the processes that use the same index file share the same physical
+memory pages through the OS page cache instead of each holding a private,
+unpickled copy of these structures.
+
+The layout is:
+ - a magic string and a 4 bytes little-endian header length
+ - a JSON header with {table name: [typecode, byte offset, items count]}
+ - the tables proper, each aligned on 8 bytes, in native byte order.
+
+The tables are:
+ - tids: concatenated token ids of all rules.
+ - tids_offsets: start offset in tids for each rid. The end is the next start.
+ - postings_tids: concatenated high token ids of the postings of all rules.
+ - postings_offsets: start offset in postings_tids for each rid.
+ - positions: concatenated positions of all the postings of all rules.
+ - positions_offsets: start offset in positions for each postings_tids item.
+"""
+
+MAGIC = b'SCANCODE-FLAT-INDEX-1'
+
+# these are the typecodes for the values and the offsets
+TOKEN_TYPECODE = 'h'
+OFFSET_TYPECODE = 'i'
+
+
+class MappedArrays(Sequence):
+    """
+    A read-only sequence of integer arrays where each item is a slice of a flat
+    ``values`` array or memoryview between two consecutive ``offsets``.
+    """
+
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        offsets = self.offsets
+        return self.values[offsets[index]:offsets[index + 1]]
+
+
+class MappedPostings(Sequence):
+    """
+    A read-only sequence of high token postings mappings of {token id: array of
+    positions}, or None for rules without postings.
+    """
+
+    def __init__(self, tids, offsets, positions):
+        self.tids = tids
+        self.offsets = offsets
+        # a MappedArrays of positions indexed by the position in tids
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, rid):
+        start = self.offsets[rid]
+        end = self.offsets[rid + 1]
+        if start == end:
+            return None
+        positions = self.positions
+        tids = self.tids
+        return {tids[i]: positions[i] for i in range(start, end)}
+
+    def get_rule_postings(self, rid):
+        """
+        Return a RulePostings for ``rid`` without building a mapping.
+        """
+        return RulePostings(
+            tids=self.tids,
+            positions=self.positions,
+            start=self.offsets[rid],
+            end=self.offsets[rid + 1],
+        )
+
+
+class RulePostings:
+    """
+    A read-only, dict-like lookup of the array of positions of a high token id
+    in a rule, backed by the slice between ``start`` and ``end`` of the flat
+    and sorted ``tids`` high token ids of a MappedPostings.
+    """
+
+    __slots__ = ('tids', 'positions', 'start', 'end')
+
+    def __init__(self, tids, positions, start, end):
+        self.tids = tids
+        self.positions = positions
+        self.start = start
+        self.end = end
+
+    def get(self, tid, default=None):
+        i = bisect_left(self.tids, tid, self.start, self.end)
+        if i < self.end and self.tids[i] == tid:
+            return self.positions[i]
+        return default
+
+
+def build_tables(tids_by_rid, high_postings_by_rid):
+    """
+    Return a mapping of {table name: array} built from the ``tids_by_rid`` and
+    ``high_postings_by_rid`` of a LicenseIndex.
+    """
+    tids = array(TOKEN_TYPECODE)
+    tids_offsets = array(OFFSET_TYPECODE, [0])
+
+    postings_tids = array(TOKEN_TYPECODE)
+    postings_offsets = array(OFFSET_TYPECODE, [0])
+
+    positions = array(TOKEN_TYPECODE)
+    positions_offsets = array(OFFSET_TYPECODE, [0])
+
+    for rule_tids, postings in zip(tids_by_rid, high_postings_by_rid):
+        tids.extend(rule_tids)
+        tids_offsets.append(len(tids))
+
+        if postings:
+            for tid, tid_positions in sorted(postings.items()):
+                postings_tids.append(tid)
+                positions.extend(tid_positions)
+                positions_offsets.append(len(positions))
+        postings_offsets.append(len(postings_tids))
+
+    return dict(
+        tids=tids,
+        tids_offsets=tids_offsets,
+        postings_tids=postings_tids,
+        postings_offsets=postings_offsets,
+        positions=positions,
+        positions_offsets=positions_offsets,
+    )
+
+
+def dump(index, location):
+    """
+    Save the flat arrays of a LicenseIndex ``index`` to the file at
+    ``location``. The file is replaced atomically such that processes which
+    have mapped a previous file at the same location are not affected.
+    """
+    tables = build_tables(
+        tids_by_rid=index.tids_by_rid,
+        high_postings_by_rid=index.high_postings_by_rid,
+    )
+
+    header = {}
+    offset = 0
+    for name, table in tables.items():
+        header[name] = [table.typecode, offset, len(table)]
+        offset += aligned(len(table) * table.itemsize)
+    header = json.dumps(header).encode('utf-8')
+
+    tmp_location = location + '.tmp'
+    with open(tmp_location, 'wb') as out:
+        out.write(MAGIC)
+        out.write(len(header).to_bytes(4, 'little'))
+        out.write(header)
+        out.write(b'\x00' * (aligned(out.tell()) - out.tell()))
+        for table in tables.values():
+            data = table.tobytes()
+            out.write(data)
+            out.write(b'\x00' * (aligned(len(data)) - len(data)))
+
+    os.replace(tmp_location, location)
+
+
+def load(location):
+    """
+    Return a tuple of (``tids_by_rid``, ``high_postings_by_rid``) read-only
+    sequences backed by a memory-mapping of the flat arrays file at
+    ``location``.
+    """
+    with open(location, 'rb') as inp:
+        mapped = mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    len_magic = len(MAGIC)
+    if bytes(buffer[:len_magic]) != MAGIC:
+        raise Exception(f'Invalid flat license index file: {location!r}')
+
+    header_start = len_magic + 4
+    header_length = int.from_bytes(buffer[len_magic:header_start], 'little')
+    header_end = header_start + header_length
+    header = json.loads(bytes(buffer[header_start:header_end]))
+
+    tables_start = aligned(header_end)
+    tables = {}
+    for name, (typecode, offset, length) in header.items():
+        start = tables_start + offset
+        end = start + length * array(typecode).itemsize
+        tables[name] = buffer[start:end].cast(typecode)
+
+    tids_by_rid = MappedArrays(
+        values=tables['tids'],
+        offsets=tables['tids_offsets'],
+    )
+
+    high_postings_by_rid = MappedPostings(
+        tids=tables['postings_tids'],
+        offsets=tables['postings_offsets'],
+        positions=MappedArrays(
+            values=tables['positions'],
+            offsets=tables['positions_offsets'],
+        ),
+    )
+
+    return tids_by_rid, high_postings_by_rid
+
+
+def aligned(size, alignment=8):
+    """
+    Return ``size`` rounded up to a multiple of ``alignment``.
+    """
+    return (size + alignment - 1) // alignment * alignment
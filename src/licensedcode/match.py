@@ -7,12 +7,16 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
 from enum import IntEnum
 from itertools import groupby
 from typing import NamedTuple
 
 import attr
 from attr import validators
+from intbitset import intbitset
 
 from licensedcode import MAX_DIST
 from licensedcode import SMALL_RULE
@@ -712,7 +716,9 @@ class LicenseMatch(object):
         ispan = self.ispan
         rid = self.rule.rid
         if rid is not None:
-            for pos, token in enumerate(idx.tids_by_rid[rid]):
+            # the rule may be indexed in the base of an overlay index
+            idx = idx.get_rule_layer(self.rule) or idx
+            for pos, token in enumerate(idx.tids_by_rid[rid - idx.rid_offset]):
                 if pos in ispan:
                     yield token
 
@@ -737,11 +743,11 @@ class LicenseMatch(object):
     ):
         """
         Return the matched text for this match or an empty string if no query
-        exists for this match.
+        exists for this match. The text is rendered from the text tokens kept
+        in the query of this match such that the scanned file is not read again.
 
-        `_usecache` can be set to False in testing to avoid any unwanted caching
-        side effects as the caching depends on which index instance is being
-        used and this index can change during testing.
+        `_usecache` is not used and is kept for backward compatibility: the text
+        tokens are cached in the query which is tied to a single index.
         """
         if TRACE_MATCHED_TEXT:
             logger_debug(f'LicenseMatch.matched_text: self.query: {self.query}')
@@ -757,9 +763,7 @@ class LicenseMatch(object):
 
         return ''.join(get_full_matched_text(
             match=self,
-            location=query.location,
-            query_string=query.query_string,
-            idx=query.idx,
+            query=query,
             whole_lines=whole_lines,
             highlight=highlight,
             highlight_matched=highlight_matched,
@@ -1502,7 +1506,7 @@ def restore_non_overlapping(matches, discarded):
     `matches` and `discarded` sequences of LicenseMatch. Reintegrate as matches
     these that may have been filtered too agressively.
     """
-    all_matched_qspans = Span().union(*(m.qspan for m in matches))
+    matched_qspans = QspanIntervals(m.qspan for m in matches)
 
     to_keep = []
     to_keep_append = to_keep.append
@@ -1511,7 +1515,7 @@ def restore_non_overlapping(matches, discarded):
     to_discard_append = to_discard.append
 
     for disc in merge_matches(discarded):
-        if not disc.qspan & all_matched_qspans:
+        if not matched_qspans.intersects(disc.qspan):
             # keep previously discarded matches that do not intersect at all
             to_keep_append(disc)
             disc.discard_reason = DiscardReason.NOT_DISCARDED
@@ -1521,6 +1525,76 @@ def restore_non_overlapping(matches, discarded):
     return to_keep, to_discard
 
 
+class QspanIntervals:
+    """
+    An index of query position Spans to find quickly if a Span intersects any
+    of the indexed Spans.
+
+    The (start, end) intervals of the Spans are merged in sorted, non-
+    overlapping clusters of Spans. A Span that intersects none of these
+    interval clusters is found with a binary search. Otherwise, the exact
+    positions of the Span are checked against the positions of each cluster it
+    falls in.
+
+    For example:
+    >>> intervals = QspanIntervals([Span(1, 3), Span([10, 12]), Span(11, 11)])
+    >>> intervals.clusters
+    [(1, 3), (10, 12)]
+    >>> intervals.intersects(Span(4, 9))
+    False
+    >>> intervals.intersects(Span(3, 4))
+    True
+    >>> intervals.intersects(Span([5, 13]))
+    False
+    >>> intervals.intersects(Span(12, 20))
+    True
+    >>> QspanIntervals([]).intersects(Span(12, 20))
+    False
+    """
+
+    def __init__(self, qspans):
+        qspans = sorted((qs for qs in qspans if len(qs)), key=lambda qs: qs.start)
+
+        # lists of (start, end) and of the Spans of each cluster
+        clusters = []
+        groups = []
+        for qspan in qspans:
+            if clusters and qspan.start <= clusters[-1][1]:
+                cluster_start, cluster_end = clusters[-1]
+                clusters[-1] = cluster_start, max(cluster_end, qspan.end)
+                groups[-1].append(qspan)
+            else:
+                clusters.append((qspan.start, qspan.end))
+                groups.append([qspan])
+
+        self.clusters = clusters
+        self.starts = [start for start, _end in clusters]
+        # the union of the positions of the Spans of each cluster
+        self.cluster_sets = [intbitset().union(*[qs._set for qs in group]) for group in groups]
+
+    def intersects(self, qspan):
+        """
+        Return True if the ``qspan`` Span intersects any of the indexed Spans.
+        """
+        if not len(qspan):
+            return False
+        start = qspan.start
+        end = qspan.end
+        clusters = self.clusters
+        cluster_sets = self.cluster_sets
+        qspan_set = qspan._set
+        # the first cluster that could intersect is the last one starting at or
+        # before start, and we stop at the first one starting after end
+        first = max(bisect_right(self.starts, start) - 1, 0)
+        for i in range(first, bisect_right(self.starts, end)):
+            _cluster_start, cluster_end = clusters[i]
+            if cluster_end < start:
+                continue
+            if not qspan_set.isdisjoint(cluster_sets[i]):
+                return True
+        return False
+
+
 def filter_below_rule_minimum_coverage(
     matches,
     trace=TRACE_FILTER_RULE_MIN_COVERAGE,
@@ -2915,81 +2989,207 @@ def _tokenize_matched_text(
                 'line_num:', line_num,
                 'line:', line)
 
-        for is_text, token_str in matched_query_text_tokenizer(line):
-            if trace:
-                logger_debug('     is_text:', is_text, 'token_str:', repr(token_str))
-
-            # Determine if a token is is_known in the license index or not. This
-            # is essential as we need to realign the query-time tokenization
-            # with the full text to report proper matches.
-            if is_text and token_str and token_str.strip():
-
-                # we retokenize using the query tokenizer:
-                # 1. to lookup for is_known tokens in the index dictionary
-
-                # 2. to ensure the number of tokens is the same in both
-                # tokenizers (though, of course, the case will differ as the
-                # regular query tokenizer ignores case and punctuations).
-
-                # NOTE: we have a rare Unicode bug/issue because of some Unicode
-                # codepoint such as some Turkish characters that decompose to
-                # char + punct when casefolded. This should be fixed in Unicode
-                # release 14 and up and likely implemented in Python 3.10 and up
-                # See https://github.com/nexB/scancode-toolkit/issues/1872
-                # See also: https://bugs.python.org/issue34723#msg359514
-                qtokenized = list(index_tokenizer(token_str))
-                if not qtokenized:
-
-                    yield Token(
-                        value=token_str,
-                        line_num=line_num,
-                        is_text=is_text,
-                        is_known=False,
-                        pos=-1,
-                    )
+        line_tokens = _tokenize_matched_text_line(
+            line=line,
+            dictionary=dictionary,
+            trace=trace,
+        )
+        for start, end, value, is_text, is_known in line_tokens:
+            if is_known:
+                p = pos
+                pos += 1
+            else:
+                p = -1
+
+            if value is None:
+                value = line[start:end]
+
+            yield Token(
+                value=value,
+                line_num=line_num,
+                is_text=is_text,
+                is_known=is_known,
+                pos=p,
+            )
+
+
+def _tokenize_matched_text_line(line, dictionary, trace=TRACE_MATCHED_TEXT_DETAILS):
+    """
+    Yield tuples of (start, end, value, is_text, is_known) for each token of a
+    query text ``line``. `dictionary` is the index mapping of tokens to token
+    ids. ``start`` and ``end`` are the offsets of the token in the line. The
+    ``value`` is None if the token text is the line[start:end] slice or is the
+    token text if an original token is split in multiple query tokens.
+    """
+    end = 0
+    for is_text, token_str in matched_query_text_tokenizer(line):
+        if trace:
+            logger_debug('     is_text:', is_text, 'token_str:', repr(token_str))
+
+        start = end
+        end = start + len(token_str)
+
+        # Determine if a token is is_known in the license index or not. This
+        # is essential as we need to realign the query-time tokenization
+        # with the full text to report proper matches.
+        if is_text and token_str and token_str.strip():
+
+            # we retokenize using the query tokenizer:
+            # 1. to lookup for is_known tokens in the index dictionary
+
+            # 2. to ensure the number of tokens is the same in both
+            # tokenizers (though, of course, the case will differ as the
+            # regular query tokenizer ignores case and punctuations).
+
+            # NOTE: we have a rare Unicode bug/issue because of some Unicode
+            # codepoint such as some Turkish characters that decompose to
+            # char + punct when casefolded. This should be fixed in Unicode
+            # release 14 and up and likely implemented in Python 3.10 and up
+            # See https://github.com/nexB/scancode-toolkit/issues/1872
+            # See also: https://bugs.python.org/issue34723#msg359514
+            qtokenized = list(index_tokenizer(token_str))
+            if not qtokenized:
+                yield start, end, None, is_text, False
+
+            elif len(qtokenized) == 1:
+                yield start, end, None, is_text, qtokenized[0] in dictionary
 
-                elif len(qtokenized) == 1:
-                    is_known = qtokenized[0] in dictionary
-                    if is_known:
-                        p = pos
-                        pos += 1
-                    else:
-                        p = -1
-
-                    yield Token(
-                        value=token_str,
-                        line_num=line_num,
-                        is_text=is_text,
-                        is_known=is_known,
-                        pos=p,
-                    )
-                else:
-                    # we have two or more tokens from the original query mapped
-                    # to a single matched text tokenizer token.
-                    for qtoken in qtokenized:
-                        is_known = qtoken in dictionary
-                        if is_known:
-                            p = pos
-                            pos += 1
-                        else:
-                            p = -1
-
-                        yield Token(
-                            value=qtoken,
-                            line_num=line_num,
-                            is_text=is_text,
-                            is_known=is_known,
-                            pos=p,
-                        )
             else:
+                # we have two or more tokens from the original query mapped
+                # to a single matched text tokenizer token.
+                for qtoken in qtokenized:
+                    yield start, end, qtoken, is_text, qtoken in dictionary
+        else:
+            yield start, end, None, False, False
 
-                yield Token(
-                    value=token_str,
-                    line_num=line_num,
-                    is_text=False,
-                    is_known=False,
-                    pos=-1,
-                )
+
+# flags of a MatchedTextTokens token
+IS_TEXT = 1
+IS_KNOWN = 2
+
+
+class MatchedTextTokens:
+    """
+    A compact table of the Tokens of a query text used to render matched texts.
+    Each token is stored as offsets in its text line such that the matched text
+    is sliced directly from the lines decoded once for a query.
+    """
+
+    __slots__ = (
+        'numbered_lines',
+        'line_nums',
+        'first_tokens',
+        'line_indexes',
+        'starts',
+        'ends',
+        'positions',
+        'flags',
+        'values',
+    )
+
+    def __init__(self, numbered_lines):
+        # list of (line number, text line)
+        self.numbered_lines = numbered_lines
+        # line number of each numbered line. The chunks of a long line have
+        # the same line number
+        self.line_nums = array('I')
+        # index of the first token of each numbered line
+        self.first_tokens = array('I')
+
+        # for each token: the index of its numbered line, the start and end
+        # offsets in this line, its known position or -1 and its flags
+        self.line_indexes = array('I')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.positions = array('i')
+        self.flags = bytearray()
+
+        # {token index: value} for the tokens that are not a slice of their
+        # line
+        self.values = {}
+
+    @classmethod
+    def from_numbered_lines(cls, numbered_lines, dictionary):
+        """
+        Return a new MatchedTextTokens built from a ``numbered_lines`` iterable
+        of (line number, text line) as returned by query_lines(strip=False)
+        given a ``dictionary`` index mapping of tokens to token ids.
+        """
+        numbered_lines = list(numbered_lines)
+        mtt = cls(numbered_lines)
+
+        line_nums_append = mtt.line_nums.append
+        first_tokens_append = mtt.first_tokens.append
+        line_indexes_append = mtt.line_indexes.append
+        starts_append = mtt.starts.append
+        ends_append = mtt.ends.append
+        positions_append = mtt.positions.append
+        flags_append = mtt.flags.append
+        values = mtt.values
+
+        pos = 0
+        index = 0
+        for line_index, (line_num, line) in enumerate(numbered_lines):
+            line_nums_append(line_num)
+            first_tokens_append(index)
+
+            line_tokens = _tokenize_matched_text_line(line=line, dictionary=dictionary)
+            for start, end, value, is_text, is_known in line_tokens:
+                if is_known:
+                    positions_append(pos)
+                    pos += 1
+                else:
+                    positions_append(-1)
+
+                line_indexes_append(line_index)
+                starts_append(start)
+                ends_append(end)
+                flags_append((is_text and IS_TEXT) | (is_known and IS_KNOWN))
+                if value is not None:
+                    values[index] = value
+                index += 1
+
+        return mtt
+
+    def __len__(self):
+        return len(self.starts)
+
+    def start_index(self, start_line):
+        """
+        Return the index of the first token on or after the ``start_line``
+        line number.
+        """
+        line_index = bisect_left(self.line_nums, start_line)
+        if line_index >= len(self.first_tokens):
+            return len(self)
+        return self.first_tokens[line_index]
+
+    def tokens(self, start_index=0):
+        """
+        Yield Token objects starting at the ``start_index`` token index.
+        """
+        numbered_lines = self.numbered_lines
+        line_indexes = self.line_indexes
+        starts = self.starts
+        ends = self.ends
+        positions = self.positions
+        flags = self.flags
+        values_get = self.values.get
+
+        for index in range(start_index, len(self)):
+            line_num, line = numbered_lines[line_indexes[index]]
+            value = values_get(index)
+            if value is None:
+                value = line[starts[index]:ends[index]]
+            token_flags = flags[index]
+
+            yield Token(
+                value=value,
+                line_num=line_num,
+                is_text=bool(token_flags & IS_TEXT),
+                is_known=bool(token_flags & IS_KNOWN),
+                pos=positions[index],
+            )
 
 
 def reportable_tokens(
@@ -2998,6 +3198,7 @@ def reportable_tokens(
     start_line,
     end_line,
     whole_lines=False,
+    start_index=0,
     trace=TRACE_MATCHED_TEXT_DETAILS,
 ):
     """
@@ -3015,6 +3216,9 @@ def reportable_tokens(
     included. Otherwise, a token is included if its position is within the
     matched ``match_qspan`` or it is a punctuation token immediately after the
     matched ``match_qspan`` even though not matched.
+
+    ``start_index`` is the index of the first of the ``tokens`` in the
+    sequence of all the tokens of a query.
     """
     start = match_qspan.start
     end = match_qspan.end
@@ -3024,7 +3228,7 @@ def reportable_tokens(
 
     end_pos = 0
     last_pos = 0
-    for real_pos, tok in enumerate(tokens):
+    for real_pos, tok in enumerate(tokens, start_index):
         if trace:
             logger_debug('reportable_tokens: processing', real_pos, tok)
 
@@ -3116,6 +3320,7 @@ def get_full_matched_text(
     location=None,
     query_string=None,
     idx=None,
+    query=None,
     whole_lines=False,
     highlight=True,
     highlight_matched='{}',
@@ -3128,7 +3333,7 @@ def get_full_matched_text(
     """
     Yield strings corresponding to the full matched query text given a ``match``
     LicenseMatch detected with an `idx` LicenseIndex in a query file at
-    ``location`` or a ``query_string``.
+    ``location`` or a ``query_string`` or in a ``query`` Query.
 
     See get_full_qspan_matched_text() for other arguments documentation
     """
@@ -3143,6 +3348,7 @@ def get_full_matched_text(
         location=location,
         query_string=query_string,
         idx=idx,
+        query=query,
         whole_lines=whole_lines,
         highlight=highlight,
         highlight_matched=highlight_matched,
@@ -3162,6 +3368,7 @@ def get_full_qspan_matched_text(
     location=None,
     query_string=None,
     idx=None,
+    query=None,
     whole_lines=False,
     highlight=True,
     highlight_matched='{}',
@@ -3176,6 +3383,10 @@ def get_full_qspan_matched_text(
     ``match_qspan`` LicenseMatch qspan Span detected with an `idx` LicenseIndex
     in a query file at ``location`` or a ``query_string``.
 
+    If a ``query`` Query is provided, its text tokens are used instead and
+    ``location``, ``query_string`` and ``idx`` are ignored: the query text is
+    never read or tokenized again.
+
     - ``match_query_start_line`` is the match query.start_line
     - ``match_start_line`` is the match start_line
     - ``match_end_line`` is the match= end_line
@@ -3204,8 +3415,7 @@ def get_full_qspan_matched_text(
         logger_debug('get_full_qspan_matched_text:  location:', location)
         logger_debug('get_full_qspan_matched_text:  query_string :', query_string)
 
-    assert location or query_string
-    assert idx
+    assert query or ((location or query_string) and idx)
 
     if only_matched:
         # use highlighting to skip the reporting of unmatched entirely
@@ -3216,7 +3426,13 @@ def get_full_qspan_matched_text(
         highlight = True
 
     # Create and process a stream of Tokens
-    if not _usecache:
+    start_index = 0
+    if query:
+        matched_text_tokens = query.matched_text_tokens()
+        start_index = matched_text_tokens.start_index(match_start_line)
+        tokens = matched_text_tokens.tokens(start_index)
+
+    elif not _usecache:
         # for testing only, reset cache on each call
         tokens = tokenize_matched_text(
             location=location,
@@ -3247,6 +3463,7 @@ def get_full_qspan_matched_text(
         start_line=match_start_line,
         end_line=match_end_line,
         whole_lines=whole_lines,
+        start_index=start_index,
     )
 
     if trace:
@@ -3281,13 +3498,7 @@ def get_highlighted_lines(
     """
     Yield highlighted text lines (with line returns) for the whole of the matched and unmatched text of a ``query``.
     """
-    tokens = tokenize_matched_text(
-        location=query.location,
-        query_string=query.query_string,
-        dictionary=query.idx.dictionary,
-        start_line=match.query.start_line,
-        _cache={},
-    )
+    tokens = query.matched_text_tokens().tokens()
     tokens = tag_matched_tokens(tokens=tokens, match_qspan=match.qspan)
 
     if trace:
@@ -219,7 +219,9 @@ def match_fragments(idx, query_run):
     matches.sort(key=keyf)
     matches_by_rule = groupby(matches, key=keyf)
 
+    rid_offset = idx.rid_offset
     for rid, rule_matches in matches_by_rule:
+        rid -= rid_offset
         itokens = tids_by_rid[rid]
         blo, bhi = 0, len(itokens)
         rule = rules_by_rid[rid]
@@ -60,7 +60,7 @@ def match_sequence(idx, rule, query_run, high_postings, start_offset=0,
     if not match_blocks:
         from licensedcode.seq import match_blocks
 
-    rid = rule.rid
+    rid = rule.rid - idx.rid_offset
     itokens = idx.tids_by_rid[rid]
 
     len_legalese = idx.len_legalese
@@ -7,6 +7,8 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+from array import array
+from collections import Counter
 from collections import defaultdict
 from collections import namedtuple
 from functools import partial
@@ -15,6 +17,7 @@ from itertools import groupby
 from intbitset import intbitset
 
 from licensedcode.tokenize import ngrams
+from licensedcode.mapped_index import MappedArrays
 
 """
 Approximate matching strategies using token sets and multisets.
@@ -78,6 +81,27 @@ This sum is then used for the same filtering and ranking used for the token sets
 step: skip if some threshold is not met and rank the candidates.
 
 Finally we return the sorted top candidates.
+
+
+Rule ids by high token id
+=========================
+
+Rather than intersecting the query set with the set of every rule, we first
+select the few rules that share enough legalese tokens with the query using an
+inverted index of rule ids by legalese token id. This is the transposed rules x
+legalese tokens occurrence matrix stored as compressed sparse rows: each token
+id row is an array of the ids of the rules that contain this token. Counting the
+occurrences of each rule id in the rows of the query legalese token ids yields
+the high intersection length of every rule that shares at least one legalese
+token with the query.
+
+A rule must have a high intersection length of at least its minimum high matched
+length to be a candidate. This is the lower bound we use to prune rules, similar
+to the WAND or MaxScore techniques of search engines: the rows of the common
+non-legalese tokens are the longest and we never need to visit them. Only the
+rules that pass this bound get the costlier sets comparison and scoring. With a
+short license notice in a source file, these are a few hundred rules out of tens
+of thousands.
 """
 
 # Set to True for tracing
@@ -241,6 +265,44 @@ def build_set_and_mset(token_ids, _use_bigrams=False):
 # matching for no reason.
 
 
+def build_high_rids_by_tid(sets_by_rid, rids, len_legalese):
+    """
+    Return a sequence of arrays of rule ids indexed by legalese token id, given
+    a ``sets_by_rid`` list of token ids sets indexed by rule id, a ``rids`` set
+    of the rule ids to index and the ``len_legalese`` number of legalese tokens.
+    Each array contains the sorted ids of the rules that contain this token id.
+    """
+    rids_by_tid = [[] for _ in range(len_legalese)]
+    for rid in sorted(rids):
+        for tid in sets_by_rid[rid]:
+            if tid < len_legalese:
+                rids_by_tid[tid].append(rid)
+
+    values = array('i')
+    offsets = array('i', [0])
+    for tid_rids in rids_by_tid:
+        values.extend(tid_rids)
+        offsets.append(len(values))
+
+    return MappedArrays(values=values, offsets=offsets)
+
+
+def compute_high_intersections_lengths(qset, high_rids_by_tid, len_legalese):
+    """
+    Return a Counter of {rid: length} where ``length`` is the length of the
+    intersection of the legalese tokens of a ``qset`` query token ids set with
+    the token ids set of a rule, given a ``high_rids_by_tid`` sequence of rule
+    ids arrays indexed by legalese token id. A rule is only present if it has at
+    least one legalese token in common with the query.
+    """
+    high_lengths = Counter()
+    high_update = high_lengths.update
+    for tid in qset:
+        if tid < len_legalese:
+            high_update(high_rids_by_tid[tid])
+    return high_lengths
+
+
 def compute_candidates(query_run, idx, matchable_rids, top=50,
                        high_resemblance=False, high_resemblance_threshold=0.8,
                        _use_bigrams=False):
@@ -248,7 +310,8 @@ def compute_candidates(query_run, idx, matchable_rids, top=50,
     Return a ranked list of rule candidates for further matching give a
     `query_run`. Use approximate matching based on token sets ignoring
     positions. Only consider rules that have an rid in a `matchable_rids` rids
-    set if provided.
+    set if provided. `matchable_rids` must be a subset of the index
+    `approx_matchable_rids`.
 
     The ranking is based on a combo of resemblance, containment, length and
     other measures.
@@ -273,11 +336,26 @@ def compute_candidates(query_run, idx, matchable_rids, top=50,
     sortable_candidates_append = sortable_candidates.append
 
     sets_by_rid = idx.sets_by_rid
+    rules_by_rid = idx.rules_by_rid
+
+    # OPTIMIZED: compute the high intersection lengths of all rules at once to
+    # only consider the rules that can pass the compare_token_sets minimum high
+    # matched length threshold. A rule with no legalese token in common with the
+    # query cannot pass this threshold either.
+    high_lengths = compute_high_intersections_lengths(
+        qset=qset,
+        high_rids_by_tid=idx.high_rids_by_tid,
+        len_legalese=len_legalese,
+    )
 
-    for rid, rule in enumerate(idx.rules_by_rid):
+    for rid, high_length in high_lengths.items():
         if rid not in matchable_rids:
             continue
 
+        rule = rules_by_rid[rid]
+        if high_length < rule.min_high_matched_length_unique:
+            continue
+
         scores_vectors, high_set_intersection = compare_token_sets(
             qset=qset,
             iset=sets_by_rid[rid],
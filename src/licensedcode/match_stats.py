@@ -0,0 +1,151 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+from contextlib import contextmanager
+
+"""
+Optional counters of the work done by ``LicenseIndex.match_query`` to find which
+matching phase is slow for a file.
+"""
+
+# names of the matchers tracked in MatchStats, in matching order
+MATCHERS = (
+    'hash',
+    'aho',
+    'spdx_lid',
+    'near_dupe',
+    'aho-frag',
+    'seq',
+    'unknown',
+)
+
+
+class MatchStats:
+    """
+    Counters of the work done to match one or more license queries:
+
+    - ``queries``: the number of queries matched.
+    - ``prefiltered``: the number of queries skipped without running the
+      matchers because they cannot be matched.
+    - ``query_runs``: the number of query runs of these queries.
+    - ``candidates``: the number of approximate matching candidate rules
+      evaluated.
+    - ``alignments``: the number of sequence alignments attempted against these
+      candidates.
+    - ``refine_time``: the duration in seconds spent refining the matches.
+    - ``deadline_reached``: True if the deadline cut matching short.
+    - ``memo_hits`` and ``memo_misses``: the number of license statements whose
+      matches were found or not in a memo of matches, such as the memo of the
+      package license statements.
+    - ``matchers``: a mapping of {matcher name: [duration in seconds, matches
+      count]} for each matcher that ran.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.prefiltered = 0
+        self.query_runs = 0
+        self.candidates = 0
+        self.alignments = 0
+        self.refine_time = 0.
+        self.deadline_reached = False
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.matchers = {}
+
+    def add_matcher(self, name, duration, matches_count):
+        """
+        Add the ``duration`` in seconds and ``matches_count`` of a run of the
+        ``name`` matcher.
+        """
+        counts = self.matchers.get(name)
+        if counts is None:
+            self.matchers[name] = [duration, matches_count]
+        else:
+            counts[0] += duration
+            counts[1] += matches_count
+
+    def has_counts(self):
+        """
+        Return True if any license query was matched or any memo was used.
+        """
+        return bool(self.queries or self.memo_hits or self.memo_misses)
+
+    def update(self, stats):
+        """
+        Add the counters of a ``stats`` mapping as returned by ``to_dict()``.
+        """
+        self.queries += stats['queries']
+        self.prefiltered += stats['prefiltered']
+        self.query_runs += stats['query_runs']
+        self.candidates += stats['candidates']
+        self.alignments += stats['alignments']
+        self.refine_time += stats['refine_time']
+        self.deadline_reached = self.deadline_reached or stats['deadline_reached']
+        self.memo_hits += stats['memo_hits']
+        self.memo_misses += stats['memo_misses']
+        for name, counts in stats['matchers'].items():
+            self.add_matcher(
+                name=name,
+                duration=counts['time'],
+                matches_count=counts['matches'],
+            )
+
+    def to_dict(self):
+        """
+        Return a mapping of these counters that can be pickled and serialized
+        to JSON.
+        """
+        matchers = {}
+        for name in MATCHERS:
+            counts = self.matchers.get(name)
+            if counts:
+                duration, matches_count = counts
+                matchers[name] = dict(time=duration, matches=matches_count)
+
+        return dict(
+            queries=self.queries,
+            prefiltered=self.prefiltered,
+            query_runs=self.query_runs,
+            candidates=self.candidates,
+            alignments=self.alignments,
+            refine_time=self.refine_time,
+            deadline_reached=self.deadline_reached,
+            memo_hits=self.memo_hits,
+            memo_misses=self.memo_misses,
+            matchers=matchers,
+        )
+
+
+# The MatchStats collecting the counters of all the license queries matched in
+# this process, if any.
+_current_stats = None
+
+
+def get_current_stats():
+    """
+    Return the MatchStats currently collecting counters or None.
+    """
+    return _current_stats
+
+
+@contextmanager
+def collecting_stats(stats):
+    """
+    Context manager to collect the counters of every license query matched while
+    the context is active in the ``stats`` MatchStats. Nothing is collected if
+    ``stats`` is None. Yield ``stats``.
+    """
+    global _current_stats
+    previous = _current_stats
+    _current_stats = stats
+    try:
+        yield stats
+    finally:
+        _current_stats = previous
@@ -7,6 +7,8 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+from itertools import chain
+
 import ahocorasick
 
 from licensedcode import tokenize
@@ -47,6 +49,9 @@ MATCH_UNKNOWN = '6-unknown'
 
 UNKNOWN_NGRAM_LENGTH = 6
 
+# minimum number of legalese tokens of an unknown match
+MIN_UNKNOWN_HIGH_LENGTH = 5
+
 
 def get_automaton():
     """
@@ -137,14 +142,24 @@ def match_unknowns(
 ):
     """
     Return a LicenseMatch (or None) by matching the ``query_run`` against the
-    ``automaton`` and ``idx`` index.
+    ``automaton`` and ``idx`` index. ``automaton`` can also be a list of
+    automatons (such as one for each layer of an overlay index) whose matched
+    ngrams are combined.
     """
-    matched_ngrams = get_matched_ngrams(
-        tokens=query_run.tokens,
-        qbegin=query_run.start,
-        automaton=automaton,
-        unknown_ngram_length=unknown_ngram_length,
-    )
+    if isinstance(automaton, (list, tuple)):
+        automatons = automaton
+    else:
+        automatons = [automaton]
+
+    matched_ngrams = list(chain.from_iterable(
+        get_matched_ngrams(
+            tokens=query_run.tokens,
+            qbegin=query_run.start,
+            automaton=atmtn,
+            unknown_ngram_length=unknown_ngram_length,
+        )
+        for atmtn in automatons
+    ))
 
     # build match from merged matched ngrams
     qspans = (Span(qstart, qend) for qstart, qend in matched_ngrams)
@@ -196,9 +211,7 @@ def match_unknowns(
         match_query_start_line=query.start_line,
         match_start_line=match_start_line,
         match_end_line=match_end_line,
-        location=query.location,
-        query_string=query.query_string,
-        idx=idx,
+        query=query,
         only_matched=True,
     ))
 
@@ -215,7 +228,7 @@ def match_unknowns(
         if tok < len_legalese
     )
 
-    if len(qspan) < unknown_ngram_length * 4 or len(hispan) < 5:
+    if len(qspan) < unknown_ngram_length * 4 or len(hispan) < MIN_UNKNOWN_HIGH_LENGTH:
         if TRACE:
             print('match_unknowns: Skipping weak unkown match', text)
         return
@@ -7,11 +7,14 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+import multiprocessing
 import os
+import pickle
 import sys
 import traceback
 from collections import Counter
 from collections import defaultdict
+from functools import partial
 from hashlib import sha1
 from itertools import chain
 from operator import itemgetter
@@ -846,12 +849,18 @@ def get_rules(
     validate=False,
     validate_thorough=False,
     is_builtin=True,
+    with_tokens=False,
+    processes=1,
+    rule_cache=None,
 ):
     """
     Yield Rule objects loaded from a ``licenses_db`` and license files found in
     ``licenses_data_dir`` and rule files found in `rules_data_dir`. Raise an
     Exception if a rule is inconsistent or incorrect.
 
+    See ``load_rules()`` for the ``with_tokens``, ``processes`` and
+    ``rule_cache`` arguments.
+
     If ``validate`` flag is True, we validate all the license rules for consistency
     and if ``validate_thorough`` is True we perform additional validation tests
     (like whether it would produce valid YAML) which is skipped normally because these
@@ -864,6 +873,9 @@ def get_rules(
     rules = list(load_rules(
         rules_data_dir=rules_data_dir,
         is_builtin=is_builtin,
+        with_tokens=with_tokens,
+        processes=processes,
+        rule_cache=rule_cache,
     ))
 
     if validate:
@@ -959,17 +971,26 @@ def get_rules_from_multiple_dirs(
     licenses_db,
     builtin_rule_data_dir,
     additional_rules_data_dirs,
+    with_tokens=False,
+    processes=1,
+    rule_cache=None,
 ):
     """
     Yield Rule(s) built from:
     - A ``license_db`` mapping of {key: License}
     - The ``builtin_rule_data_dir`` of builtin license rules
     - The list of ``additional_rules_data_dirs`` containing additional rules.
+
+    See ``load_rules()`` for the ``with_tokens``, ``processes`` and
+    ``rule_cache`` arguments.
     """
     # first load all builtin
     combined_rules = list(get_rules(
         licenses_db=licenses_db,
         rules_data_dir=builtin_rule_data_dir,
+        with_tokens=with_tokens,
+        processes=processes,
+        rule_cache=rule_cache,
     ))
 
     # load additional rules
@@ -977,6 +998,9 @@ def get_rules_from_multiple_dirs(
         combined_rules.extend(load_rules(
             rules_data_dir=rules_dir,
             is_builtin=False,
+            with_tokens=with_tokens,
+            processes=processes,
+            rule_cache=rule_cache,
         ))
 
     validate_rules(rules=combined_rules, licenses_by_key=licenses_db, thorough=False)
@@ -1195,10 +1219,19 @@ def load_rules(
     with_checks=True,
     is_builtin=True,
     with_depreacted=False,
+    with_tokens=False,
+    processes=1,
+    rule_cache=None,
 ):
     """
     Return an iterable of rules loaded from rule files in ``rules_data_dir``.
     Optionally check for consistency if ``with_checks`` is True.
+
+    If ``with_tokens`` is True, also tokenize the text of each rule such that
+    the rule can be indexed without tokenizing its text again.
+
+    Load rule files using up to ``processes`` processes and reuse the rules of
+    an optional ``rule_cache`` RuleFileCache. See ``load_rule_files()``.
     """
     # TODO: OPTIMIZE: create a graph of rules to account for containment and
     # similarity clusters?
@@ -1209,6 +1242,7 @@ def load_rules(
     space_problems = []
     model_errors = []
 
+    rule_files = []
     for rule_file in resource_iter(location=rules_data_dir, with_dirs=False):
         if rule_file.endswith('.RULE'):
             base_name = file_base_name(rule_file)
@@ -1216,16 +1250,7 @@ def load_rules(
             if with_checks and ' ' in base_name:
                 space_problems.append(rule_file)
 
-            try:
-                rule = Rule.from_file(rule_file=rule_file)
-                if not with_depreacted and rule.is_deprecated:
-                    continue 
-                else:
-                    yield rule
-
-            except Exception as re:
-                if with_checks:
-                    model_errors.append(str(re))
+            rule_files.append(rule_file)
 
             if with_checks:
                 # accumulate sets to ensures we do not have illegal names or extra
@@ -1241,6 +1266,24 @@ def load_rules(
         if with_checks and not rule_file.endswith('~'):
             seen_files.add(rule_file)
 
+    loaded_rules = load_rule_files(
+        rule_files=rule_files,
+        with_tokens=with_tokens,
+        processes=processes,
+        rule_cache=rule_cache,
+    )
+
+    for rule, error in loaded_rules:
+        if error:
+            if with_checks:
+                model_errors.append(error)
+            continue
+
+        if not with_depreacted and rule.is_deprecated:
+            continue
+
+        yield rule
+
     if with_checks:
         unknown_files = seen_files - processed_files
         if unknown_files or case_problems or model_errors or space_problems:
@@ -1281,6 +1324,222 @@ def load_rules(
             raise InvalidRule(msg)
 
 
+# Minimum number of rule files to load for using multiple processes
+MIN_PARALLEL_RULE_FILES = 200
+
+
+def load_rule_files(
+    rule_files,
+    with_tokens=False,
+    processes=1,
+    rule_cache=None,
+):
+    """
+    Yield a tuple of (Rule or None, error message or None) for each rule file
+    path of a ``rule_files`` list, in the same order.
+
+    If ``with_tokens`` is True, each Rule text is also tokenized ahead of time.
+    See ``Rule.pretokenize()``.
+
+    The rule files are loaded using up to ``processes`` processes. Use all the
+    available CPUs if ``processes`` is 0. A single process is used if there are
+    only a few files to load.
+
+    If a ``rule_cache`` RuleFileCache is provided, the cached Rule of a rule file
+    is reused if this file is not modified and a newly loaded Rule is added to
+    this cache. Cached rules are always tokenized ahead of time.
+    """
+    if rule_cache is not None:
+        with_tokens = True
+
+    loaded_by_file = {}
+    to_load = []
+    for rule_file in rule_files:
+        rule = rule_cache and rule_cache.get(rule_file)
+        if rule:
+            loaded_by_file[rule_file] = rule, None
+        else:
+            to_load.append(rule_file)
+
+    if to_load:
+        processes = processes or os.cpu_count() or 1
+        use_pool = (
+            processes > 1
+            and len(to_load) >= MIN_PARALLEL_RULE_FILES
+            # daemonic processes such as scan workers cannot have children
+            and not multiprocessing.current_process().daemon
+        )
+
+        if use_pool:
+            from scancode.pool import get_pool
+            pool = get_pool(processes=processes)
+            chunksize = max(1, len(to_load) // (processes * 8))
+            try:
+                loaded = pool.imap(
+                    partial(_load_rule_file, with_tokens=with_tokens),
+                    to_load,
+                    chunksize=chunksize,
+                )
+                loaded = list(loaded)
+                pool.close()
+            finally:
+                pool.terminate()
+        else:
+            loaded = (_load_rule_file(rf, with_tokens=with_tokens) for rf in to_load)
+
+        for rule_file, rule, error, stat, checksum in loaded:
+            if rule_cache is not None and rule:
+                rule_cache.add(rule_file=rule_file, rule=rule, stat=stat, checksum=checksum)
+            loaded_by_file[rule_file] = rule, error
+
+    for rule_file in rule_files:
+        yield loaded_by_file[rule_file]
+
+
+def _load_rule_file(rule_file, with_tokens=False):
+    """
+    Return a tuple of (rule file, Rule or None, error message or None, (mtime,
+    size) stat, SHA1 checksum) for a ``rule_file`` path. Also compute the
+    tokens of the Rule if ``with_tokens`` is True.
+    """
+    try:
+        stat, checksum = RuleFileCache.get_file_signature(rule_file)
+        rule = Rule.from_file(rule_file=rule_file)
+        if with_tokens:
+            rule.pretokenize()
+        return rule_file, rule, None, stat, checksum
+    except Exception as e:
+        return rule_file, None, str(e), None, None
+
+
+class RuleFileCache:
+    """
+    An on-disk cache of Rule objects loaded from .RULE files such that only the
+    modified rule files are loaded again when rebuilding the license index.
+
+    A cached Rule is reused if its file has the same modification time and size
+    or else the same SHA1 checksum as when it was loaded. The whole cache is
+    discarded if the code used to load and tokenize rules has changed.
+    """
+
+    # the modules used to load and tokenize a Rule
+    code_modules = (
+        'models.py',
+        'frontmatter.py',
+        'tokenize.py',
+        'stopwords.py',
+    )
+
+    def __init__(self, location, entries=None):
+        self.location = location
+        # {rule file: ((mtime, size), sha1, Rule)}
+        self.entries = entries or {}
+        self.is_modified = False
+
+    @classmethod
+    def load(cls, location):
+        """
+        Return a RuleFileCache loaded from ``location`` or an empty cache if
+        there is no valid cache at ``location``.
+        """
+        entries = None
+        if location and os.path.exists(location):
+            try:
+                with open(location, 'rb') as cf:
+                    fingerprint, entries = pickle.load(cf)
+                if fingerprint != cls.get_fingerprint() or not isinstance(entries, dict):
+                    entries = None
+            except Exception:
+                # a stale or corrupted cache is ignored and rebuilt
+                entries = None
+
+        return cls(location=location, entries=entries)
+
+    def save(self):
+        """
+        Save this cache if it was modified, forgetting the rule files that do
+        not exist anymore.
+        """
+        if not self.location or not self.is_modified:
+            return
+
+        entries = {
+            rule_file: entry for rule_file, entry in self.entries.items()
+            if os.path.exists(rule_file)
+        }
+        tmp_location = f'{self.location}.tmp'
+        with open(tmp_location, 'wb') as cf:
+            pickle.dump((self.get_fingerprint(), entries), cf, protocol=4)
+        os.replace(tmp_location, self.location)
+        self.is_modified = False
+
+    @classmethod
+    def get_fingerprint(cls):
+        """
+        Return a fingerprint string for the ScanCode version and the code used
+        to load and tokenize rules.
+        """
+        from scancode_config import __version__ as scancode_version
+
+        code_checksum = sha1()
+        for module in cls.code_modules:
+            with open(join(dirname(__file__), module), 'rb') as mf:
+                code_checksum.update(mf.read())
+        return f'{scancode_version}:{code_checksum.hexdigest()}'
+
+    @staticmethod
+    def delete(location):
+        """
+        Delete the cache at ``location`` if it exists.
+        """
+        if location and os.path.exists(location):
+            os.remove(location)
+
+    @staticmethod
+    def get_file_signature(rule_file):
+        """
+        Return a tuple of ((mtime, size), SHA1 checksum) for a ``rule_file``.
+        """
+        with open(rule_file, 'rb') as rf:
+            checksum = sha1(rf.read()).hexdigest()
+        st = os.stat(rule_file)
+        return (st.st_mtime_ns, st.st_size), checksum
+
+    def get(self, rule_file):
+        """
+        Return a cached Rule for ``rule_file`` or None if this rule is not
+        cached or its file was modified.
+        """
+        entry = self.entries.get(rule_file)
+        if not entry:
+            return
+
+        try:
+            cached_stat, cached_checksum, rule = entry
+            st = os.stat(rule_file)
+        except (TypeError, ValueError, OSError):
+            # an invalid entry or a missing file: the rule is loaded again
+            return
+
+        if (st.st_mtime_ns, st.st_size) != cached_stat:
+            # the file may have been touched but not changed, such as on checkout
+            stat, checksum = self.get_file_signature(rule_file)
+            if checksum != cached_checksum:
+                return
+            self.entries[rule_file] = stat, checksum, rule
+            self.is_modified = True
+
+        return rule
+
+    def add(self, rule_file, rule, stat, checksum):
+        """
+        Add a ``rule`` Rule loaded from ``rule_file`` with a ``stat`` (mtime,
+        size) tuple and SHA1 ``checksum`` to this cache.
+        """
+        self.entries[rule_file] = stat, checksum, rule
+        self.is_modified = True
+
+
 @attr.s(slots=True)
 class BasicRule:
     """
@@ -1724,6 +1983,18 @@ class BasicRule:
             'position is using the magic -1 key.')
     )
 
+    pretokenized = attr.ib(
+        default=None,
+        repr=False,
+        eq=False,
+        order=False,
+        metadata=dict(
+            help='Internal tuple of (tokens, stopwords_by_pos, key_phrase_spans) '
+            'of this rule text computed when the rule is loaded such that '
+            'indexing this rule does not tokenize its text again. Discarded '
+            'once used by the tokens() method.')
+    )
+
     @property
     def rule_url(self):
         """
@@ -2166,6 +2437,8 @@ class Rule(BasicRule):
         SIDE EFFECT: Computed attributes such as "length", "relevance",
         "is_continuous",  "minimum_coverage" and "stopword_by_pos" are
         recomputed as a side effect.
+
+        Use and discard the tokens computed with pretokenize() if any.
         """
 
         text = self.text
@@ -2178,18 +2451,37 @@ class Rule(BasicRule):
         ):
             self.minimum_coverage = 100
 
-        toks, stopwords_by_pos = index_tokenizer_with_stopwords(text)
+        pretokenized = self.pretokenized
+        if pretokenized:
+            toks, stopwords_by_pos, key_phrase_spans = pretokenized
+            self.pretokenized = None
+        else:
+            toks, stopwords_by_pos = index_tokenizer_with_stopwords(text)
+            key_phrase_spans = self.build_key_phrase_spans()
+
         self.length = len(toks)
         self.stopwords_by_pos = stopwords_by_pos
         self.set_relevance()
 
         # set key phrase spans that must be present for the rule
         # to pass through refinement
-        self.key_phrase_spans = self.build_key_phrase_spans()
+        self.key_phrase_spans = key_phrase_spans
         self._set_continuous()
 
         return toks
 
+    def pretokenize(self):
+        """
+        Compute and keep the tokens, stopwords and key phrase spans of this rule
+        text to be used by the next call to tokens(). This has no other side
+        effect such that rules can be tokenized ahead of time when loaded.
+        """
+        toks, stopwords_by_pos = index_tokenizer_with_stopwords(self.text)
+        # interned tokens are pickled once when rules are cached or sent
+        # across processes
+        toks = [sys.intern(t) for t in toks]
+        self.pretokenized = toks, stopwords_by_pos, self.build_key_phrase_spans()
+
     def _set_continuous(self):
         """
         Set the "is_continuous" flag if this rule must be matched exactly
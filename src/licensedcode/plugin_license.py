@@ -85,6 +85,10 @@ class LicenseScanner(ScanPlugin):
     run_order = 4
     sort_order = 4
 
+    # license detection depends only on the file content: the references to
+    # other files are resolved later in process_codebase
+    is_content_only = True
+
     options = [
         PluggableCommandLineOption(('-l', '--license'),
             is_flag=True,
@@ -8,6 +8,7 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+import os
 import re
 
 from collections import defaultdict
@@ -107,6 +108,18 @@ MAX_TOKEN_PER_LINE = 25
 # or non-legalese/junk lines
 LINES_THRESHOLD = 4
 
+# Text files larger than this size in bytes are matched as a sequence of
+# bounded, overlapping query windows rather than as a single query.
+QUERY_WINDOW_MIN_SIZE = 20 * 1024 * 1024
+
+# Maximum number of text lines in a query window. Long lines are broken in
+# chunks that count each as a line.
+QUERY_WINDOW_LINES = 5000
+
+# Number of text lines shared by two consecutive query windows. A match that
+# spans fewer lines is always found whole in one window.
+QUERY_WINDOW_OVERLAP_LINES = 1000
+
 
 def build_query(
     location=None,
@@ -152,6 +165,140 @@ def build_query(
     return qry
 
 
+def use_query_windows(location, min_size=QUERY_WINDOW_MIN_SIZE):
+    """
+    Return True if the file at ``location`` is a text file of at least
+    ``min_size`` bytes that should be matched as a sequence of query windows.
+    """
+    if not location or not min_size:
+        return False
+
+    try:
+        if os.path.getsize(location) < min_size:
+            return False
+    except OSError:
+        return False
+
+    T = typecode.get_type(location)
+    return T.is_text and not T.is_binary
+
+
+# characters that break a line in str.splitlines() but not in the text lines
+# of a file: these are replaced by a space in the text of query windows
+line_breaks = re.compile(r'[\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]').sub
+
+
+def build_query_windows(
+    location,
+    idx,
+    line_threshold=15,
+    window_lines=QUERY_WINDOW_LINES,
+    overlap_lines=QUERY_WINDOW_OVERLAP_LINES,
+):
+    """
+    Yield a tuple of (Query, last line) for each window of up to
+    ``window_lines`` text lines of the text file at ``location`` given an
+    ``idx`` index. Each window starts with the last ``overlap_lines`` lines of
+    the previous window. Only the lines of one window are kept in memory at a
+    time.
+
+    The ``last line`` is the number of the first line of the next window or
+    None for the last window: a match starting after this line is found whole
+    in the next window and a match starting on or before this line is found
+    whole in this window if it spans fewer than ``overlap_lines`` lines.
+
+    The Query of a window is built from the text of its lines such that the
+    file is never read again to collect the matched text.
+    """
+    assert 0 < overlap_lines < window_lines
+
+    has_long_lines = typecode.get_type(location).is_text_with_long_lines
+
+    # list of (line number, text line) of the current window
+    window = []
+    for numbered_line in query_lines(location=location, strip=False):
+        window.append(numbered_line)
+        if len(window) < window_lines:
+            continue
+
+        overlap = window[-overlap_lines:]
+        last_line = overlap[0][0]
+        qry = build_window_query(window, idx, line_threshold, has_long_lines)
+        if qry:
+            yield qry, last_line
+        window = overlap
+
+    qry = build_window_query(window, idx, line_threshold, has_long_lines)
+    if qry:
+        yield qry, None
+
+
+def build_window_query(window, idx, line_threshold, has_long_lines=False):
+    """
+    Return a Query built from a ``window`` list of (line number, text line)
+    or None if there is no text in this window.
+    """
+    if not window:
+        return
+
+    # consecutive chunks of a long line have the same line number and are
+    # joined back as a single line of the query text
+    start_line = window[0][0]
+    lines = []
+    current_line = start_line
+    current_chunks = []
+    for line_num, line in window:
+        if line_num != current_line:
+            lines.append(''.join(current_chunks))
+            # there are no missing line numbers in practice
+            lines.extend([''] * (line_num - current_line - 1))
+            current_line = line_num
+            current_chunks = []
+        current_chunks.append(line_breaks(' ', line))
+    lines.append(''.join(current_chunks))
+
+    query_string = '\n'.join(lines)
+    if not query_string.strip():
+        return
+
+    return Query(
+        query_string=query_string,
+        idx=idx,
+        line_threshold=line_threshold,
+        start_line=start_line,
+        has_long_lines=has_long_lines,
+    )
+
+
+def build_stitched_query(queries, start_line, end_line):
+    """
+    Return a Query for the text lines from ``start_line`` to ``end_line`` taken
+    from a ``queries`` list of Query built with ``build_query_windows()`` or
+    with this function. Each line is taken from the first Query of ``queries``
+    that contains this line: these must contain all the lines between
+    ``start_line`` and ``end_line``.
+    """
+    lines = []
+    line_num = start_line
+    for qry in queries:
+        qry_lines = qry.query_string.split('\n')
+        qry_end_line = min(qry.start_line + len(qry_lines) - 1, end_line)
+        while qry.start_line <= line_num <= qry_end_line:
+            lines.append(qry_lines[line_num - qry.start_line])
+            line_num += 1
+
+    assert line_num > end_line, f'Missing query line: {line_num}'
+
+    last = queries[-1]
+    return Query(
+        query_string='\n'.join(lines),
+        idx=last.idx,
+        line_threshold=last.line_threshold,
+        start_line=start_line,
+        has_long_lines=last.has_long_lines,
+    )
+
+
 class Query(object):
     """
     A query represent a whole file or string being scanned for licenses. It
@@ -191,6 +338,8 @@ class Query(object):
         'has_long_lines',
         'is_binary',
         'start_line',
+        'text_lines',
+        '_matched_text_tokens',
     )
 
     def __init__(
@@ -200,6 +349,7 @@ class Query(object):
         idx=None,
         line_threshold=LINES_THRESHOLD,
         start_line=1,
+        has_long_lines=False,
         _test_mode=False,
     ):
         """
@@ -208,6 +358,9 @@ class Query(object):
         Break query in runs when there are at least `line_threshold` empty lines
         or junk-only lines.
         Line numbers start at ``start_line`` which is 1-based by default.
+        If ``has_long_lines`` is True, treat the ``query_string`` as a text with
+        very long lines. This is otherwise detected from the type of the file
+        at ``location``.
         """
         assert (location or query_string) and idx
 
@@ -219,7 +372,7 @@ class Query(object):
         self.start_line = start_line
 
         # True if the text is made of very long lines
-        self.has_long_lines = False
+        self.has_long_lines = has_long_lines
 
         # True if the query is binary
         self.is_binary = False
@@ -278,6 +431,14 @@ class Query(object):
 
         self._whole_query_run = None
 
+        # list of (line number, text line) as decoded from the file at
+        # location, kept to render the matched text without reading this file
+        # again. Empty for a query_string.
+        self.text_lines = []
+
+        # MatchedTextTokens built on demand from the query text
+        self._matched_text_tokens = None
+
         # list of QueryRun objects. Does not include SPDX-related query runs
         self.query_runs = []
         if _test_mode:
@@ -324,6 +485,30 @@ class Query(object):
 
         return self._whole_query_run
 
+    def matched_text_tokens(self):
+        """
+        Return a MatchedTextTokens table of the text tokens of this query used
+        to render matched texts. This is built once from the query text lines.
+        """
+        if self._matched_text_tokens is None:
+            from licensedcode.match import MatchedTextTokens
+
+            if self.location:
+                numbered_lines = self.text_lines
+            else:
+                numbered_lines = query_lines(
+                    query_string=self.query_string,
+                    strip=False,
+                    start_line=self.start_line,
+                )
+
+            self._matched_text_tokens = MatchedTextTokens.from_numbered_lines(
+                numbered_lines=numbered_lines,
+                dictionary=self.idx.dictionary,
+            )
+
+        return self._matched_text_tokens
+
     def spdx_lid_query_runs_and_text(self):
         """
         Yield a tuple of query run, line text for each SPDX-License-Identifier line.
@@ -402,9 +587,12 @@ class Query(object):
 
         spdx_lid_token_ids = self.spdx_lid_token_ids
 
+        # the lines are not stripped such that they can be kept as-is to
+        # render the matched text
         qlines = query_lines(
             location=location,
             query_string=query_string,
+            strip=False,
             start_line=start_line,
         )
         if TRACE or TRACE_STOP_AND_UNKNOWN:
@@ -413,7 +601,16 @@ class Query(object):
             for line_num, line in qlines:
                 logger_debug(' ', line_num, ':', line)
 
+        text_lines_append = None
+        if location:
+            self.text_lines = []
+            text_lines_append = self.text_lines.append
+
         for line_num, line in qlines:
+            if text_lines_append:
+                text_lines_append((line_num, line))
+            line = line.strip()
+
             if TRACE_STOP_AND_UNKNOWN:
                 logger_debug(f'  line: {line_num}: {line!r}')
 
@@ -595,6 +792,9 @@ class Query(object):
             if ft.is_binary:
                 self.is_binary = True
 
+        elif self.has_long_lines:
+            tokens_by_line = break_long_lines(tokens_by_line)
+
         for tokens in tokens_by_line:
             # have we reached a run break point?
             if len(query_run) > 0 and empty_lines >= line_threshold:
@@ -150,6 +150,14 @@ def match_blocks(a, b, a_start, a_end, b2j, len_good, matchables=frozenset(), *a
                 # there is unprocessed things remaining to the right
                 queue_append((i + k, ahi, j + k, bhi))
 
+    return collapse_blocks(matching_blocks)
+
+
+def collapse_blocks(matching_blocks):
+    """
+    Return a sorted list of Match from a ``matching_blocks`` list of (i, j, n)
+    triples where adjacent blocks are merged and collapsed in a single block.
+    """
     matching_blocks.sort()
 
     # collapse adjacent blocks
@@ -0,0 +1,120 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+from array import array
+
+from licensedcode.seq import collapse_blocks
+from licensedcode.seq import extend_match
+
+"""
+Token sequences alignment using preallocated integer arrays.
+
+This is the same local alignment on the longest common substrings of "high
+tokens" as in ``licensedcode.seq`` and it returns exactly the same matching
+blocks. It is faster because it does not allocate a new mapping of {position in
+b: length} for each position in a:
+
+- the lengths of the matches are stored in an array with one item per position
+  in b, allocated once and reused across all the longest match searches of a
+  single alignment.
+
+- a second array records for each position in b the "row" (e.g. the position in
+  a and the search) that last updated the length at this position. A length is
+  current only if it was stored for the previous position in a, so we never
+  need to clear the lengths array.
+
+- the positions in b of a token are visited in reverse order such that the
+  length stored for the previous position in b is always the one from the
+  previous position in a, and the lengths can be updated in place.
+
+The ``b2j`` postings are any mapping of {token id: sorted sequence of positions
+in b} with a ``get()`` method such as a dict of arrays or a RulePostings
+backed by the flat arrays of a memory-mapped index.
+"""
+
+
+def find_longest_match(
+    a, b, alo, ahi, blo, bhi, b2j, len_good, matchables, j2len, j2row, row,
+):
+    """
+    Return a tuple of (Match, row) for the longest matching block of a and b in
+    a[alo:ahi] and b[blo:bhi]. See ``licensedcode.seq.find_longest_match`` for
+    the details of which block is returned.
+
+    ``j2len`` and ``j2row`` are arrays of len(b) + 1 integers: j2len[j + 1] is
+    the length of the longest junk-free match ending with b[j] and the a
+    position of row j2row[j + 1]. ``row`` is the last row number used and the
+    returned row is the new last row number used.
+    """
+    besti, bestj, bestsize = alo, blo, 0
+    bestrow = 0
+    b2j_get = b2j.get
+
+    # skip a row such that lengths from a previous search are never current
+    row += 1
+    for i in range(alo, ahi):
+        row += 1
+        # we cannot do LCS on junk or non matchable
+        cura = a[i]
+        if cura < len_good and i in matchables:
+            positions = b2j_get(cura)
+            if not positions:
+                continue
+            prevrow = row - 1
+            for j in reversed(positions):
+                # a[i] matches b[j]
+                if j >= bhi:
+                    continue
+                if j < blo:
+                    break
+                if j2row[j] == prevrow:
+                    k = j2len[j] + 1
+                else:
+                    k = 1
+                j2len[j + 1] = k
+                j2row[j + 1] = row
+                # on ties, keep the block that starts earliest in b: since we
+                # visit b positions in reverse, this is the last one in a row
+                if k > bestsize or (k == bestsize and bestrow == row):
+                    besti, bestj, bestsize = i - k + 1, j - k + 1, k
+                    bestrow = row
+
+    match = extend_match(besti, bestj, bestsize, a, b, alo, ahi, blo, bhi, matchables)
+    return match, row
+
+
+def match_blocks(a, b, a_start, a_end, b2j, len_good, matchables=frozenset(), *args, **kwargs):
+    """
+    Return a list of matching block Match triples describing matching
+    subsequences of `a` in `b` starting from the `a_start` position in `a` up to
+    the `a_end` position in `a`. See ``licensedcode.seq.match_blocks`` for
+    details.
+    """
+    j2len = array('i', [0]) * (len(b) + 1)
+    j2row = array('i', [0]) * (len(b) + 1)
+    row = 0
+
+    queue = [(a_start, a_end, 0, len(b))]
+    queue_append = queue.append
+    queue_pop = queue.pop
+    matching_blocks = []
+    matching_blocks_append = matching_blocks.append
+    while queue:
+        alo, ahi, blo, bhi = queue_pop()
+        x, row = find_longest_match(
+            a, b, alo, ahi, blo, bhi, b2j, len_good, matchables, j2len, j2row, row)
+        i, j, k = x
+        if k:
+            matching_blocks_append(x)
+            if alo < i and blo < j:
+                queue_append((alo, i, blo, j))
+            if i + k < ahi and j + k < bhi:
+                queue_append((i + k, ahi, j + k, bhi))
+
+    return collapse_blocks(matching_blocks)
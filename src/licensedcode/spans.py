@@ -45,8 +45,16 @@ class Span(Set):
     A Span is hashable and not meant to be modified once created, like a frozenset.
     It is equivalent to a sparse closed interval.
     Originally derived and heavily modified from Whoosh Span.
+
+    The start and end of a Span are computed once and cached: finding these in
+    an intbitset is proportional to the position of the items in the set. They
+    are used as a cheap interval check to avoid some set operations.
     """
 
+    # cached start and end, None until computed
+    _start = None
+    _end = None
+
     def __init__(self, *args):
         """
         Create a new Span from a start and end ints or an iterable of ints.
@@ -132,7 +140,14 @@ class Span(Set):
         return hash(tuple(self._set))
 
     def __eq__(self, other):
-        return isinstance(other, Span) and self._set == other._set
+        if not isinstance(other, Span):
+            return False
+        len_self = len(self._set)
+        if len_self != len(other._set):
+            return False
+        if len_self and (self.start != other.start or self.end != other.end):
+            return False
+        return self._set == other._set
 
     def __and__(self, *others):
         return Span(self._set.intersection(*[o._set for o in others]))
@@ -198,6 +213,12 @@ class Span(Set):
         False
         """
         if isinstance(other, Span):
+            len_other = len(other._set)
+            if len_other:
+                if len_other > len(self._set):
+                    return False
+                if other.start < self.start or other.end > self.end:
+                    return False
             return self._set.issuperset(other._set)
 
         if isinstance(other, int):
@@ -221,15 +242,21 @@ class Span(Set):
 
     @property
     def start(self):
-        if not self._set:
-            raise TypeError('Empty Span has no start.')
-        return self._set[0]
+        start = self._start
+        if start is None:
+            if not len(self._set):
+                raise TypeError('Empty Span has no start.')
+            start = self._start = self._set[0]
+        return start
 
     @property
     def end(self):
-        if not self._set:
-            raise TypeError('Empty Span has no end.')
-        return self._set[-1]
+        end = self._end
+        if end is None:
+            if not len(self._set):
+                raise TypeError('Empty Span has no end.')
+            end = self._end = self._set[-1]
+        return end
 
     @classmethod
     def sort(cls, spans):
@@ -326,8 +353,14 @@ class Span(Set):
         1
         >>> Span([4, 5]).overlap(Span([6, 7]))
         0
+        >>> Span().overlap(Span([6, 7]))
+        0
         """
-        return len(self & other)
+        if not len(self._set) or not len(other._set):
+            return 0
+        if self.end < other.start or other.end < self.start:
+            return 0
+        return len(self._set & other._set)
 
     def resemblance(self, other):
         """
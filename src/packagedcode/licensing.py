@@ -7,8 +7,10 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+import json
 import logging
 import os
+from collections import OrderedDict
 
 from license_expression import Licensing
 
@@ -935,11 +937,173 @@ def get_license_detections_for_extracted_license_statement(
     return license_detections
 
 
+class LicenseStatementsMemo:
+    """
+    A bounded, least recently used memo of the license matches of extracted
+    license statements, holding up to ``max_size`` results.
+
+    Package manifests use a small vocabulary of license statements such as
+    "MIT" or "Apache-2.0" that are otherwise matched again and again. The memo
+    is process-wide: each scan worker process has its own memo.
+
+    If ``warm_start_location`` is provided, the key of each new statement is
+    saved such that the memo can be warmed up ahead of the next scans with
+    ``warm_start()``. Each process appends to its own file next to this
+    location: these files are merged in this location on warm start.
+    """
+
+    def __init__(self, max_size, warm_start_location=None):
+        self.max_size = max_size
+        self.warm_start_location = warm_start_location
+        # {(index id, query_string, try_as_expression, approximate):
+        #     (tuple of LicenseMatch, matched_as_expression)}
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.warmed_up = False
+
+    def get(self, key):
+        """
+        Return a cached (tuple of LicenseMatch, matched_as_expression) for
+        ``key`` or None.
+        """
+        from licensedcode.match_stats import get_current_stats
+
+        stats = get_current_stats()
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+            if stats:
+                stats.memo_misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+            if stats:
+                stats.memo_hits += 1
+        return result
+
+    def put(self, key, matches, matched_as_expression, save=True):
+        """
+        Cache a list of LicenseMatch ``matches`` and ``matched_as_expression``
+        flag for ``key``. Append the key to the warm start file of this process
+        if ``save``.
+        """
+        self.results[key] = tuple(matches or ()), matched_as_expression
+        if len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+        if save and self.warm_start_location:
+            _idx_id, query_string, try_as_expression, approximate = key
+            line = json.dumps([query_string, try_as_expression, approximate])
+            try:
+                with open(self.get_process_location(), 'a') as out:
+                    out.write(line + '\n')
+            except OSError:
+                pass
+
+    def get_process_location(self):
+        """
+        Return the location of the warm start file of the current process.
+        """
+        return f'{self.warm_start_location}.{os.getpid()}'
+
+    def get_process_locations(self):
+        """
+        Return a list of the locations of the existing warm start files of
+        processes.
+        """
+        base_dir, base_name = os.path.split(self.warm_start_location)
+        try:
+            names = os.listdir(base_dir)
+        except OSError:
+            return []
+
+        prefix = f'{base_name}.'
+        return [
+            os.path.join(base_dir, name) for name in sorted(names)
+            if name.startswith(prefix) and name[len(prefix):].isdigit()
+        ]
+
+    def warm_start(self):
+        """
+        Detect licenses for the license statements of the warm start file and of
+        the warm start files of processes, up to ``max_size`` of the most recent.
+        Merge and compact these in the warm start file.
+        """
+        if self.warmed_up or not self.warm_start_location:
+            return
+        self.warmed_up = True
+
+        process_locations = self.get_process_locations()
+        keys = OrderedDict()
+        for location in [self.warm_start_location] + process_locations:
+            try:
+                with open(location) as inp:
+                    for line in inp:
+                        try:
+                            key = tuple(json.loads(line))
+                        except ValueError:
+                            continue
+                        keys.pop(key, None)
+                        keys[key] = True
+            except OSError:
+                continue
+
+        keys = list(keys)[-self.max_size:]
+        for query_string, try_as_expression, approximate in keys:
+            get_license_matches_for_extracted_license_statement(
+                query_string=query_string,
+                try_as_expression=try_as_expression,
+                approximate=approximate,
+                _save=False,
+            )
+
+        try:
+            tmp_location = f'{self.warm_start_location}.{os.getpid()}.tmp'
+            with open(tmp_location, 'w') as out:
+                for key in keys:
+                    out.write(json.dumps(key) + '\n')
+            os.replace(tmp_location, self.warm_start_location)
+            for location in process_locations:
+                os.remove(location)
+        except OSError:
+            pass
+
+
+def get_license_statements_memo():
+    """
+    Return the process-wide LicenseStatementsMemo.
+    """
+    global _license_statements_memo
+    if _license_statements_memo is None:
+        from scancode_config import package_license_memo_size
+        from scancode_config import package_license_memo_warm_start
+        from scancode_config import scancode_cache_dir
+
+        warm_start_location = None
+        if package_license_memo_warm_start:
+            warm_start_location = os.path.join(
+                scancode_cache_dir, LICENSE_STATEMENTS_FILENAME)
+
+        _license_statements_memo = LicenseStatementsMemo(
+            max_size=package_license_memo_size,
+            warm_start_location=warm_start_location,
+        )
+    return _license_statements_memo
+
+
+_license_statements_memo = None
+
+# file name of the warm start license statements in the scancode cache dir
+LICENSE_STATEMENTS_FILENAME = 'package_license_statements.jsonl'
+
+
 def get_license_matches_for_extracted_license_statement(
     query_string,
     try_as_expression=True,
     approximate=True,
     expression_symbols=None,
+    _save=True,
 ):
     """
     Return `matches` list of LicenseMatch and a flag `matched_as_expression`
@@ -947,10 +1111,43 @@ def get_license_matches_for_extracted_license_statement(
 
     Here the `query_string` is generally a extracted_license_statement
     which can be a valid license-expression.
+
+    Results are memoized unless custom ``expression_symbols`` are used. The
+    returned LicenseMatch may be shared across calls and must not be modified.
     """
     from licensedcode.cache import get_index
     idx = get_index()
 
+    memo = key = None
+    if expression_symbols is None:
+        memo = get_license_statements_memo()
+        key = id(idx), query_string, try_as_expression, approximate
+        cached = memo.get(key)
+        if cached is not None:
+            matches, matched_as_expression = cached
+            return list(matches), matched_as_expression
+
+    matches, matched_as_expression = _get_license_matches_for_extracted_license_statement(
+        idx=idx,
+        query_string=query_string,
+        try_as_expression=try_as_expression,
+        approximate=approximate,
+        expression_symbols=expression_symbols,
+    )
+
+    if memo:
+        memo.put(key, matches, matched_as_expression, save=_save)
+
+    return matches, matched_as_expression
+
+
+def _get_license_matches_for_extracted_license_statement(
+    idx,
+    query_string,
+    try_as_expression=True,
+    approximate=True,
+    expression_symbols=None,
+):
     # we match twice in a cascade: as an expression, then as plain text if we
     # did not succeed.
     matches = None
@@ -187,6 +187,19 @@ class PackageScanner(ScanPlugin):
     def is_enabled(self, package, system_package, package_only, **kwargs):
         return package or system_package or package_only
 
+    def setup(self, **kwargs):
+        """
+        This is a warmup such that child process inherit from the loaded
+        package handlers and from the license index used to detect licenses in
+        package data, and from the license detections of the warm start package
+        license statements if enabled.
+        """
+        from licensedcode.cache import populate_cache
+        from packagedcode import recognize  # NOQA
+        from packagedcode.licensing import get_license_statements_memo
+        populate_cache()
+        get_license_statements_memo().warm_start()
+
     def get_scanner(self, package=True, system_package=False, package_only=False, **kwargs):
         """
         Return a scanner callable to scan a file for package data.
@@ -8,9 +8,13 @@
 #
 
 import os
+import re
 import sys
+from collections import defaultdict
+from fnmatch import translate
 
 from commoncode import filetype
+from commoncode.fileutils import as_posixpath
 from packagedcode import APPLICATION_PACKAGE_DATAFILE_HANDLERS
 from packagedcode import SYSTEM_PACKAGE_DATAFILE_HANDLERS
 from packagedcode import ALL_DATAFILE_HANDLERS
@@ -82,8 +86,11 @@ def _parse(
     Use the provided ``datafile_handlers`` list of DatafileHandler classes.
     Default to use application packages
     """
+    handlers_index = HANDLERS_INDEXES.get(id(datafile_handlers))
+    if not handlers_index:
+        handlers_index = DatafileHandlersIndex(datafile_handlers)
 
-    for handler in datafile_handlers:
+    for handler in handlers_index.get_candidates(location):
         if TRACE:
             logger_debug(f'_parse:.is_datafile: {handler}')
 
@@ -113,3 +120,114 @@ def _parse(
 
             if TRACE:
                 raise
+
+
+# glob pattern special characters
+GLOB_CHARS = frozenset('*?[')
+
+
+class DatafileHandlersIndex:
+    """
+    An index of a list of DatafileHandler classes by their path patterns to
+    quickly find the few handlers that could handle a file path without
+    matching every path pattern of every handler.
+
+    The index returns candidate handlers: each still needs to check if it can
+    handle a file with its ``is_datafile`` method. A path pattern is indexed
+    based on its last path segment:
+
+    - as an exact file name when this segment has no glob special characters,
+      such as "*/package.json"
+    - as a file extension when this segment ends with an extension, such as
+      "*.gemspec" or "*requirement*.txt"
+    - otherwise in one combined regex, such as "*.exe_*" or "*Podfile"
+
+    Handlers that override ``is_datafile`` may recognize a file with other
+    criteria than its path (such as its content) and are always candidates.
+    """
+
+    def __init__(self, datafile_handlers):
+        self.datafile_handlers = list(datafile_handlers)
+
+        # {file name: set of handler indexes}
+        self.by_name = defaultdict(set)
+        # {file extension: set of handler indexes}
+        self.by_extension = defaultdict(set)
+        # set of handler indexes that are always candidates
+        self.always = set()
+
+        # list of (handler index, compiled pattern) for patterns matched with
+        # the combined regex
+        self.patterns = []
+
+        base_is_datafile = models.DatafileHandler.is_datafile.__func__
+        for hidx, handler in enumerate(self.datafile_handlers):
+            if handler.is_datafile.__func__ is not base_is_datafile:
+                self.always.add(hidx)
+                continue
+
+            for pattern in handler.path_patterns:
+                self.add_pattern(hidx, pattern)
+
+        self.combined = None
+        if self.patterns:
+            self.combined = re.compile(
+                '|'.join(f'(?:{p.pattern})' for _, p in self.patterns)
+            )
+
+    def add_pattern(self, hidx, pattern):
+        """
+        Index the ``pattern`` path pattern of the handler at index ``hidx``.
+        """
+        head, slash, segment = pattern.rpartition('/')
+
+        if slash and not GLOB_CHARS.intersection(segment):
+            self.by_name[segment].add(hidx)
+            return
+
+        # the literal tail of the segment after its last "*" is always a suffix
+        # of a matched file name
+        if '?' not in segment and '[' not in segment:
+            tail = segment.rpartition('*')[-1]
+            _, dot, extension = tail.rpartition('.')
+            if dot and extension:
+                self.by_extension[extension].add(hidx)
+                return
+
+        self.patterns.append((hidx, re.compile(translate(pattern))))
+
+    def get_candidates(self, location):
+        """
+        Return a list of candidate DatafileHandler classes that may handle the
+        file at ``location``, in the same order as the indexed handlers.
+        """
+        path = as_posixpath(location)
+        name = path.rpartition('/')[-1]
+
+        candidates = set(self.always)
+        candidates.update(self.by_name.get(name, ()))
+
+        _, dot, extension = name.rpartition('.')
+        if dot:
+            candidates.update(self.by_extension.get(extension, ()))
+
+        combined = self.combined
+        if combined and combined.match(path):
+            candidates.update(
+                hidx for hidx, pattern in self.patterns
+                if pattern.match(path)
+            )
+
+        handlers = self.datafile_handlers
+        return [handlers[hidx] for hidx in sorted(candidates)]
+
+
+# {id of a list of handlers: DatafileHandlersIndex for this list}
+HANDLERS_INDEXES = {
+    id(handlers): DatafileHandlersIndex(handlers)
+    for handlers in (
+        APPLICATION_PACKAGE_DATAFILE_HANDLERS,
+        SYSTEM_PACKAGE_DATAFILE_HANDLERS,
+        ALL_DATAFILE_HANDLERS,
+    )
+}
@@ -85,12 +85,19 @@ def get_emails(
     threshold=50,
     test_slow_mode=False,
     test_error_mode=False,
+    with_urls=False,
+    url_threshold=50,
     **kwargs,
 ):
     """
     Return a mapping with a single 'emails' key with a value that is a list of
     mappings for emails detected in the file at `location`.
     Return only up to `threshold` values. Return all values if `threshold` is 0.
+    The file text is only read until `threshold` values are found.
+
+    If `with_urls` is True, the URLs are also found in the same pass over the
+    file text, up to `url_threshold`, and are reused by get_urls() when
+    scanning this file.
 
     If test_mode is True, the scan will be slow for testing purpose and pause
     for one second.
@@ -102,42 +109,112 @@ def get_emails(
         import time
         time.sleep(1)
 
-    from cluecode.finder import find_emails
-    results = []
-
-    found_emails = ((em, ln) for (em, ln) in find_emails(location) if em)
-    if threshold:
-        found_emails = islice(found_emails, threshold)
+    if with_urls:
+        emails, _urls = get_emails_and_urls(
+            location,
+            email_threshold=threshold,
+            url_threshold=url_threshold,
+        )
+        return dict(emails=emails)
 
-    for email, line_num in found_emails:
-        result = {}
-        results.append(result)
-        result['email'] = email
-        result['start_line'] = line_num
-        result['end_line'] = line_num
-    return dict(emails=results)
+    from cluecode.finder import find_emails
+    emails = get_clues(find_emails(location), key='email', threshold=threshold)
+    return dict(emails=emails)
 
 
-def get_urls(location, threshold=50, **kwargs):
+def get_urls(location, threshold=50, with_emails=False, email_threshold=50, **kwargs):
     """
     Return a mapping with a single 'urls' key with a value that is a list of
     mappings for urls detected in the file at `location`.
     Return only up to `threshold` values. Return all values if `threshold` is 0.
+    The file text is only read until `threshold` values are found.
+
+    If `with_emails` is True, the emails are also found in the same pass over
+    the file text, up to `email_threshold`, and are reused by get_emails() when
+    scanning this file.
     """
+    if with_emails:
+        _emails, urls = get_emails_and_urls(
+            location,
+            email_threshold=email_threshold,
+            url_threshold=threshold,
+        )
+        return dict(urls=urls)
+
     from cluecode.finder import find_urls
+    urls = get_clues(find_urls(location), key='url', threshold=threshold)
+    return dict(urls=urls)
+
+
+def get_emails_and_urls(location, email_threshold=50, url_threshold=50):
+    """
+    Return a tuple of (emails, urls) lists of mappings for the emails and urls
+    detected in the file at `location` in a single pass over its text.
+    Return only up to `email_threshold` emails and `url_threshold` urls. Return
+    all values if a threshold is 0.
+
+    When scanning the file at `location`, these lists are computed once and
+    shared by the email and url scanners. They are kept only once complete such
+    that a failed or interrupted scan does not affect the next scanner.
+    """
+    from cluecode.finder import find_emails_and_urls
+    from textcode.analysis import get_extraction_context
+
+    context = get_extraction_context(location)
+    memo_key = ('emails_and_urls', email_threshold, url_threshold)
+    if context and memo_key in context.memo:
+        return context.memo[memo_key]
+
+    emails, urls = find_emails_and_urls(location)
+    emails_and_urls = (
+        get_clues(emails, key='email', threshold=email_threshold),
+        get_clues(urls, key='url', threshold=url_threshold),
+    )
+
+    if context:
+        context.memo[memo_key] = emails_and_urls
+    return emails_and_urls
+
+
+def get_clues(found, key, threshold=50):
+    """
+    Return a list of mappings with a `key` and line numbers given a `found`
+    iterable of (value, line number) of emails or urls. Return only up to
+    `threshold` values. Return all values if `threshold` is 0.
+    """
     results = []
 
-    found_urls = ((u, ln) for (u, ln) in find_urls(location) if u)
+    found = ((value, ln) for (value, ln) in found if value)
     if threshold:
-        found_urls = islice(found_urls, threshold)
+        found = islice(found, threshold)
 
-    for urls, line_num in found_urls:
+    for value, line_num in found:
         result = {}
         results.append(result)
-        result['url'] = urls
+        result[key] = value
         result['start_line'] = line_num
         result['end_line'] = line_num
-    return dict(urls=results)
+    return results
+
+
+def get_emails_count(location, **kwargs):
+    """
+    Return a mapping with a single 'emails_count' key with a value that is the
+    count of all the emails detected in the file at `location`.
+    """
+    from cluecode.finder import find_emails
+    emails_count = sum(1 for (em, _ln) in find_emails(location) if em)
+    return dict(emails_count=emails_count)
+
+
+def get_urls_count(location, **kwargs):
+    """
+    Return a mapping with a single 'urls_count' key with a value that is the
+    count of all the urls detected in the file at `location`.
+    """
+    from cluecode.finder import find_urls
+    urls_count = sum(1 for (u, _ln) in find_urls(location) if u)
+    return dict(urls_count=urls_count)
 
 
 SPDX_LICENSE_URL = 'https://spdx.org/licenses/{}'
@@ -179,6 +256,7 @@ def get_licenses(
     from licensedcode.cache import build_spdx_license_expression
     from licensedcode.cache import get_cache
     from licensedcode.detection import detect_licenses
+    from licensedcode.detection import get_percentage_license_text_of_file
     from packagedcode.utils import combine_expressions
 
     license_clues = []
@@ -195,10 +273,9 @@ def get_licenses(
         **kwargs,
     )
 
-    all_qspans = []
-    detection = None
+    all_matches = []
     for detection in detections:
-        all_qspans.extend(detection.qspans)
+        all_matches.extend(detection.matches)
 
         if detection.license_expression is None:
             detection_mapping = detection.to_dict(
@@ -233,8 +310,8 @@ def get_licenses(
         ))
 
     percentage_of_license_text = 0
-    if detection:
-        percentage_of_license_text = detection.percentage_license_text_of_file(all_qspans)
+    if all_matches:
+        percentage_of_license_text = get_percentage_license_text_of_file(all_matches)
 
     return dict([
         ('detected_license_expression', detected_license_expression),
@@ -22,6 +22,7 @@ import traceback
 
 from collections import defaultdict
 from functools import partial
+from itertools import chain
 from multiprocessing import TimeoutError
 from time import sleep
 from time import time
@@ -47,10 +48,13 @@ from commoncode.filetype import is_dir
 from commoncode.filetype import is_file
 from commoncode.filetype import is_readable
 from commoncode.fileutils import as_posixpath
+from commoncode.hash import sha1 as file_sha1
 from commoncode.timeutils import time2tstamp
 from commoncode.resource import Codebase
 from commoncode.resource import VirtualCodebase
 from commoncode.system import on_windows
+from licensedcode.match_stats import MatchStats
+from licensedcode.match_stats import collecting_stats
 
 # these are important to register plugin managers
 from plugincode import PluginManager
@@ -65,12 +69,22 @@ from scancode import ScancodeCliUsageError
 from scancode import notice
 from scancode import print_about
 from scancode import Scanner
+from scancode.duplicates import DuplicateFiles
 from scancode.help import epilog_text
 from scancode.help import examples_text
 from scancode.interrupt import DEFAULT_TIMEOUT
 from scancode.interrupt import fake_interruptible
 from scancode.interrupt import interruptible
 from scancode.pool import ScanCodeTimeoutError
+from scancode.results_cache import SCAN_RESULTS_CACHE_DIR
+from scancode.results_cache import ScanResultsCache
+from scancode.results_cache import get_config_key
+from scancode.results_cache import get_license_index_version
+from scancode.scheduler import AdaptiveBatcher
+from scancode.scheduler import BatchedScans
+from scancode.scheduler import get_error_scans
+from scancode.scheduler import order_by_cost
+from textcode.analysis import extraction_context
 
 # Tracing flags
 TRACE = False
@@ -244,6 +258,27 @@ def validate_input_path(ctx, param, value):
          f'[default: {DEFAULT_TIMEOUT} seconds]',
     help_group=cliutils.CORE_GROUP, sort_order=10, cls=PluggableCommandLineOption)
 
+@click.option('--largest-first',
+    is_flag=True,
+    help='Scan the largest and costliest files first to reduce the overall scan '
+         'time when using multiple processes.',
+    help_group=cliutils.CORE_GROUP, sort_order=15, cls=PluggableCommandLineOption)
+
+@click.option('--scan-cache',
+    is_flag=True,
+    help='Reuse the cached license, copyright, email and url scan results of '
+         'files with an identical content and name scanned in previous runs '
+         'and cache new results. The cache size is capped with the '
+         'SCANCODE_SCAN_CACHE_MAX_SIZE environment variable in MB.',
+    help_group=cliutils.CORE_GROUP, sort_order=16, cls=PluggableCommandLineOption)
+
+@click.option('--dedupe-files',
+    is_flag=True,
+    help='Scan files with an identical content and name only once for '
+         'licenses, copyrights, emails and urls and copy these scan results to '
+         'all the duplicated files.',
+    help_group=cliutils.CORE_GROUP, sort_order=17, cls=PluggableCommandLineOption)
+
 @click.option('-q', '--quiet',
     is_flag=True,
     conflicting_options=['verbose'],
@@ -380,6 +415,9 @@ def scancode(
     full_root,
     processes,
     timeout,
+    largest_first,
+    scan_cache,
+    dedupe_files,
     quiet,
     verbose,
     max_depth,
@@ -489,6 +527,9 @@ def scancode(
             full_root=full_root,
             processes=processes,
             timeout=timeout,
+            largest_first=largest_first,
+            scan_cache=scan_cache,
+            dedupe_files=dedupe_files,
             quiet=quiet,
             verbose=verbose,
             max_depth=max_depth,
@@ -531,6 +572,9 @@ def run_scan(
     max_in_memory=10000,
     processes=1,
     timeout=120,
+    largest_first=False,
+    scan_cache=False,
+    dedupe_files=False,
     quiet=True,
     verbose=False,
     max_depth=0,
@@ -638,6 +682,9 @@ def run_scan(
         full_root=full_root,
         processes=processes,
         timeout=timeout,
+        largest_first=largest_first,
+        scan_cache=scan_cache,
+        dedupe_files=dedupe_files,
         quiet=quiet,
         verbose=verbose,
         from_json=from_json,
@@ -946,6 +993,9 @@ def run_scan(
             processes=processes,
             timeout=timeout,
             timing=timeout,
+            largest_first=largest_first,
+            scan_cache=scan_cache,
+            dedupe_files=dedupe_files,
             quiet=quiet,
             verbose=verbose,
             kwargs=requested_options,
@@ -1138,6 +1188,9 @@ def run_scanners(
     processes,
     timeout,
     timing,
+    largest_first=False,
+    scan_cache=False,
+    dedupe_files=False,
     quiet=False,
     verbose=False,
     kwargs=None,
@@ -1154,6 +1207,11 @@ def run_scanners(
     Use multiple `processes` and limit the runtime of a single scanner
     function to `timeout` seconds.
     Compute detailed timings if `timing` is True.
+    Scan the costliest files first if `largest_first` is True.
+    Reuse and cache the results of content-only scanners across runs if
+    `scan_cache` is True.
+    Scan identical files only once for content-only scanners if `dedupe_files`
+    is True.
     Display progress and errors based on the `quiet` and `verbose` flags.
     """
 
@@ -1180,10 +1238,50 @@ def run_scanners(
             item_show_func=item_show_func,
             verbose=verbose, file=sys.stderr)
 
-    # TODO: add CLI option to bypass cache entirely?
+    # each new worker process runs the plugins setup again: this is near
+    # instant when a worker inherits an already warmed up parent process.
+    # These warmups are pickled with their options for spawned workers.
+    warmups = [
+        partial(setup_plugin, type(plugin), **get_plugin_options(plugin, kwargs))
+        for plugin in plugins
+    ]
+
+    # only the results of scanners that depend on a file content and name
+    # alone can be reused for another file with the same content and name
+    content_only = [
+        (plugin, scanner) for plugin, scanner in zip(plugins, scanners)
+        if getattr(plugin, 'is_content_only', False)
+    ]
+
+    results_cache = None
+    if scan_cache and content_only:
+        cached_scanners = [scanner for _plugin, scanner in content_only]
+        results_cache = ScanResultsCache(
+            cache_dir=os.path.join(
+                scancode_config.scancode_cache_dir, SCAN_RESULTS_CACHE_DIR),
+            scanner_names=[s.name for s in cached_scanners],
+            config_key=get_config_key(
+                scanners=cached_scanners,
+                license_index_version=get_license_index_version(),
+            ),
+            max_size=scancode_config.scan_results_cache_max_size * 1024 * 1024,
+        )
+
+    duplicate_files = None
+    if dedupe_files and content_only:
+        duplicate_files = DuplicateFiles(
+            scanner_names=[scanner.name for _plugin, scanner in content_only],
+            attributes=[
+                name for plugin, _scanner in content_only
+                for name in plugin.resource_attributes
+            ],
+        )
+
     scan_success = scan_codebase(
         codebase, scanners, processes, timeout,
-        with_timing=timing, progress_manager=progress_manager)
+        with_timing=timing, progress_manager=progress_manager,
+        warmups=warmups, largest_first=largest_first,
+        results_cache=results_cache, duplicate_files=duplicate_files)
 
     # TODO: add progress indicator
     # run the process codebase of each scan plugin (most often a no-op)
@@ -1221,6 +1319,10 @@ def scan_codebase(
     with_timing=False,
     progress_manager=None,
     echo_func=echo_stderr,
+    warmups=(),
+    largest_first=False,
+    results_cache=None,
+    duplicate_files=None,
 ):
     """
     Run the `scanners` Scanner objects on the `codebase` Codebase. Return True
@@ -1239,10 +1341,39 @@ def scan_codebase(
     Provide optional progress feedback in the UI using the ``progress_manager``
     callable that accepts an iterable of tuple of (location, path, scan_errors,
     scan_result) as argument.
+
+    Run the ``warmups`` callables once in each new worker process before it
+    starts scanning. If `with_timing` is True, the duration of each worker
+    startup is tracked in the codebase "scan:workers_startup" counter as a
+    mapping of {worker process id: duration in seconds}.
+
+    If ``largest_first`` is True and using multiprocessing, scan files in order
+    of decreasing estimated scan cost rather than in the codebase walk order.
+
+    If ``results_cache`` is a ScanResultsCache, reuse its cached scan results
+    rather than running its cached scanners and save new results in this cache.
+    Cache hits and misses are tracked in the codebase "scan:cache_hits" and
+    "scan:cache_misses" counters.
+
+    If ``duplicate_files`` is a DuplicateFiles, scan identical files only once
+    with its scanners and copy the results to the duplicated files. The other
+    scanners run on every file. The number of duplicated files is tracked in the
+    codebase "scan:duplicates_count" counter.
     """
 
     # NOTE: we never scan directories
-    resources = ((r.location, r.path) for r in codebase.walk() if r.is_file)
+    # the known SHA1 of a file, if any, is not computed again
+    resources = (
+        (r.location, r.path, getattr(r, 'sha1', None))
+        for r in codebase.walk() if r.is_file
+    )
+
+    duplicates = []
+    if duplicate_files:
+        resources, duplicates = duplicate_files.group(resources)
+
+    if largest_first and processes >= 1:
+        resources = order_by_cost(resources)
 
     use_threading = processes >= 0
     runner = partial(
@@ -1250,31 +1381,76 @@ def scan_codebase(
         scanners=scanners,
         timeout=timeout,
         with_timing=with_timing,
-        with_threading=use_threading
+        with_threading=use_threading,
+        results_cache=results_cache,
     )
 
+    # list of (runner, resources) to scan in sequence
+    runs = [(runner, resources)]
+
+    if duplicates:
+        # duplicated files only need the scanners that are not content-only
+        duplicate_scanners = [
+            s for s in scanners
+            if s.name not in duplicate_files.scanner_names
+        ]
+        if duplicate_scanners:
+            duplicate_runner = partial(
+                scan_resource,
+                scanners=duplicate_scanners,
+                timeout=timeout,
+                with_timing=with_timing,
+                with_threading=use_threading,
+            )
+            runs.append((duplicate_runner, duplicates))
+
     if TRACE:
         logger_debug('scan_codebase: scanners:', ', '.join(s.name for s in scanners))
 
     get_resource = codebase.get_resource
 
+    # {worker process id: startup duration in seconds}
+    workers_startup = {}
+    license_match_stats = MatchStats()
+    cache_hits = cache_misses = 0
+
     success = True
     pool = None
     scans = None
     try:
         if processes >= 1:
-            # maxtasksperchild helps with recycling processes in case of leaks
-            pool = get_pool(processes=processes, maxtasksperchild=1000)
-            # Using chunksize is documented as much more efficient in the Python
-            # doc. Yet "1" still provides a better and more progressive
-            # feedback. With imap_unordered, results are returned as soon as
-            # ready and out of order so we never know exactly what is processing
-            # until completed.
-            scans = pool.imap_unordered(runner, resources, chunksize=1)
-            pool.close()
+            # maxtasksperchild helps with recycling processes in case of leaks.
+            # A task is a batch of one or more files: batches start with a
+            # single file and a lower limit would recycle workers too often.
+            pool = get_pool(
+                processes=processes,
+                initializer=init_worker,
+                initargs=(warmups,),
+                maxtasksperchild=1000,
+            )
+            # Small files are sent to workers in batches to reduce the IPC
+            # overhead and large files alone. The batch size adapts to the
+            # observed scan time per file for a progressive feedback. Results
+            # are returned as soon as ready and out of order so we never know
+            # exactly what is processing until completed.
+            # Each run is started only once the previous run is done.
+            scans = chain.from_iterable(
+                BatchedScans(
+                    pool=pool,
+                    func=partial(scan_resources, runner=run_runner),
+                    batcher=AdaptiveBatcher(run_resources),
+                    max_pending=processes * 2,
+                    # each scanner of a file runs for up to timeout seconds
+                    file_timeout=(timeout or 0) * len(scanners),
+                )
+                for run_runner, run_resources in runs
+            )
         else:
             # no multiprocessing with processes=0 or -1
-            scans = map(runner, resources)
+            scans = chain.from_iterable(
+                map(run_runner, run_resources)
+                for run_runner, run_resources in runs
+            )
 
         if progress_manager:
             scans = progress_manager(scans)
@@ -1312,8 +1488,23 @@ def scan_codebase(
                     success = False
                     resource.scan_errors.extend(scan_errors)
 
+                cache_hit = scan_result.pop(SCAN_CACHE_HIT, None)
+                if cache_hit is True:
+                    cache_hits += 1
+                elif cache_hit is False:
+                    cache_misses += 1
+
                 if TRACE: logger_debug('scan_codebase: scan_timings:', scan_timings)
                 if with_timing and scan_timings:
+                    worker_startup = scan_timings.pop(WORKER_STARTUP, None)
+                    if worker_startup:
+                        worker_pid, startup_duration = worker_startup
+                        workers_startup[worker_pid] = startup_duration
+
+                    match_stats = scan_timings.get(LICENSE_MATCH_STATS)
+                    if match_stats:
+                        license_match_stats.update(match_stats)
+
                     if scan_timings:
                         resource.scan_timings.update(scan_timings)
 
@@ -1337,6 +1528,9 @@ def scan_codebase(
                 success = False
                 continue
             except StopIteration:
+                if pool:
+                    # all the files have been scanned
+                    pool.close()
                 break
             except KeyboardInterrupt:
                 echo_func('\nAborted with Ctrl+C!', fg='red')
@@ -1352,6 +1546,22 @@ def scan_codebase(
         if scans and hasattr(scans, 'render_finish'):
             # hack to avoid using a context manager
             scans.render_finish()
+
+    if workers_startup:
+        codebase.counters['scan:workers_startup'] = workers_startup
+
+    if license_match_stats.has_counts():
+        codebase.counters['scan:license_match_stats'] = license_match_stats.to_dict()
+
+    if results_cache:
+        codebase.counters['scan:cache_hits'] = cache_hits
+        codebase.counters['scan:cache_misses'] = cache_misses
+        results_cache.evict()
+
+    if duplicate_files:
+        duplicate_files.copy_results(codebase)
+        codebase.counters['scan:duplicates_count'] = len(duplicates)
+
     return success
 
 
@@ -1377,21 +1587,104 @@ def terminate_pool_with_backoff(pool, number_of_trials=3):
             sleep(trial)
 
 
+# scan_timings key for a tuple of (worker process id, startup duration in
+# seconds) reported with the first scan of a worker process
+WORKER_STARTUP = 'worker_startup'
+
+# scan_timings key for a mapping of license matching counters and per-matcher
+# timings as returned by MatchStats.to_dict() for the license queries of a scan
+LICENSE_MATCH_STATS = 'license_matching'
+
+# scan_results key set to True when the results of a resource were found in a
+# ScanResultsCache and to False otherwise
+SCAN_CACHE_HIT = 'scan_cache_hit'
+
+# The startup of this worker process as a tuple of (worker process id,
+# duration in seconds) set by init_worker() and not yet reported.
+_worker_startup = None
+
+
+def get_plugin_options(plugin, options):
+    """
+    Return a mapping of {option name: value} for the options of a ``plugin``
+    found in an ``options`` mapping of the requested options.
+    """
+    options = options or {}
+    return {
+        option.name: options[option.name]
+        for option in plugin.options
+        if option.name in options
+    }
+
+
+def setup_plugin(plugin_class, **options):
+    """
+    Setup a new plugin of ``plugin_class`` with its requested ``options``.
+    """
+    plugin_class(**options).setup(**options)
+
+
+def init_worker(warmups=()):
+    """
+    Initialize a new scan worker process running each of the ``warmups``
+    callables and record how long this took. This is near instant when the
+    worker inherits from an already warmed up parent process.
+
+    A failed warmup is reported and ignored: the worker then loads what it
+    needs when scanning.
+    """
+    global _worker_startup
+    start = time()
+    for warmup in warmups:
+        try:
+            warmup()
+        except Exception:
+            msg = f'ERROR: failed to warmup scan worker process: {os.getpid()}:\n'
+            echo_stderr(msg + traceback.format_exc(), fg='red')
+    _worker_startup = os.getpid(), time() - start
+
+
+def scan_resources(locations_paths, runner):
+    """
+    Return a list of scan result tuples from running the ``runner`` callable
+    on each (location, path, SHA1 or None) tuple of the ``locations_paths``
+    batch. ``runner`` is typically a ``scan_resource`` partial.
+    """
+    scans = []
+    for location_path in locations_paths:
+        try:
+            scans.append(runner(location_path))
+        except Exception:
+            # a failed file does not fail the scan of the whole batch
+            msg = 'ERROR: Internal error in scan_resources:\n' + traceback.format_exc()
+            scans.extend(get_error_scans([location_path], msg))
+    return scans
+
+
 def scan_resource(
     location_path,
     scanners,
     timeout=DEFAULT_TIMEOUT,
     with_timing=False,
     with_threading=True,
+    results_cache=None,
 ):
     """
-    Given a ``location_path`` tuple pf (location, path), return a tuple of:
+    Given a ``location_path`` tuple of (location, path) or of (location, path,
+    SHA1 or None), return a tuple of:
         (location, path, scan_errors, scan_time, scan_results, timings)
     by running the ``scanners`` Scanner objects for the file or directory
     resource at ``location`` and ``path`` for up to ``timeout`` seconds. If
     ``with_threading`` is False, threading is disabled. Include detailed timings
     if ``with_timing`` is True.
 
+    If ``results_cache`` is a ScanResultsCache, reuse the cached results of its
+    scanners if any, and set the SCAN_CACHE_HIT key of scan_results to True.
+    Otherwise, save the results of its scanners in this cache and set the
+    SCAN_CACHE_HIT key to False. The other scanners run first such that the
+    cache key uses the known SHA1 of the file or else the SHA1 of the info scan
+    if any: the file is hashed at most once.
+
     The returned tuple has these values:
     - `location` and `path` are the original arguments.
     - `scan_errors` is a list of error strings.
@@ -1399,17 +1692,26 @@ def scan_resource(
     - `scan_time` is the duration in seconds to run all scans for this resource.
     - `timings` is a mapping of scan {scanner.name: execution time in seconds}
       tracking the execution duration each each scan individually.
-      `timings` is empty unless `with_timing` is True.
+      `timings` is empty unless `with_timing` is True. For the first scan of a
+      worker process, it also contains a WORKER_STARTUP key with a tuple of
+      (worker process id, startup duration in seconds). If licenses were
+      matched, it also contains a LICENSE_MATCH_STATS key with a mapping of
+      license matching counters and per-matcher timings.
 
     All these values MUST be serializable and pickable because of the way multi-
     processing and threading works.
     """
     scan_time = time()
-    location, path = location_path
+    location, path = location_path[:2]
+    content_sha1 = location_path[2] if len(location_path) > 2 else None
     results = {}
     scan_errors = []
     timings = {} if with_timing else None
 
+    match_stats = None
+    if with_timing:
+        match_stats = MatchStats()
+
     if not with_threading:
         interruptor = fake_interruptible
     else:
@@ -1419,36 +1721,85 @@ def scan_resource(
     # and start returning values. The kill timeout is otherwise there
     # as a gatekeeper for runaway processes.
 
-    # run each scanner in sequence in its own interruptible
-    for scanner in scanners:
-        if with_timing:
-            start = time()
+    cached_results = None
+    cached_scanner_names = frozenset()
+    if results_cache:
+        cached_scanner_names = results_cache.scanner_names
+        scanners = sorted(scanners, key=lambda s: s.name in cached_scanner_names)
+
+    # results of the scanners of the results_cache to save in this cache
+    results_to_cache = {}
+
+    # run each scanner in sequence in its own interruptible, sharing the text
+    # extracted from this file across scanners and collecting the license
+    # matching stats of all scanners
+    with extraction_context(location), collecting_stats(match_stats):
+        for scanner in scanners:
+            is_cached = scanner.name in cached_scanner_names
+            if is_cached and SCAN_CACHE_HIT not in results:
+                # look up the cache once, before running the first cached scanner
+                content_sha1 = content_sha1 or results.get('sha1')
+                if not content_sha1:
+                    try:
+                        content_sha1 = file_sha1(location)
+                    except OSError:
+                        pass
+                if content_sha1:
+                    cached_results = results_cache.get(location, content_sha1=content_sha1)
+                if cached_results is not None:
+                    results.update(cached_results)
+                results[SCAN_CACHE_HIT] = cached_results is not None
+
+            if is_cached and cached_results is not None:
+                continue
 
-        try:
-            # pass a deadline that the scanner can opt to honor or not
-            if timeout:
-                deadline = time() + int(timeout / 2.5)
-            else:
-                deadline = sys.maxsize
+            if with_timing:
+                start = time()
 
-            runner = partial(scanner.function, location, path=path, deadline=deadline)
-            error, values_mapping = interruptor(runner, timeout=timeout)
-            if error:
-                msg = 'ERROR: for scanner: ' + scanner.name + ':\n' + error
+            try:
+                # pass a deadline that the scanner can opt to honor or not
+                if timeout:
+                    deadline = time() + int(timeout / 2.5)
+                else:
+                    deadline = sys.maxsize
+
+                runner = partial(scanner.function, location, path=path, deadline=deadline)
+                error, values_mapping = interruptor(runner, timeout=timeout)
+                if error:
+                    msg = 'ERROR: for scanner: ' + scanner.name + ':\n' + error
+                    scan_errors.append(msg)
+                # the return value of a scanner fun MUST be a mapping
+                if values_mapping:
+                    results.update(values_mapping)
+                    if is_cached:
+                        results_to_cache.update(values_mapping)
+
+            except Exception:
+                msg = 'ERROR: for scanner: ' + scanner.name + ':\n' + traceback.format_exc()
                 scan_errors.append(msg)
-            # the return value of a scanner fun MUST be a mapping
-            if values_mapping:
-                results.update(values_mapping)
-
-        except Exception:
-            msg = 'ERROR: for scanner: ' + scanner.name + ':\n' + traceback.format_exc()
-            scan_errors.append(msg)
-        finally:
-            if with_timing:
-                timings[scanner.name] = time() - start
+            finally:
+                if with_timing:
+                    timings[scanner.name] = time() - start
+
+    if (
+        results_cache
+        and content_sha1
+        and results.get(SCAN_CACHE_HIT) is False
+        and not scan_errors
+    ):
+        results_cache.put(location, results_to_cache, content_sha1=content_sha1)
 
     scan_time = time() - scan_time
 
+    if with_timing:
+        if match_stats.has_counts():
+            timings[LICENSE_MATCH_STATS] = match_stats.to_dict()
+
+    global _worker_startup
+    if with_timing and _worker_startup:
+        timings[WORKER_STARTUP] = _worker_startup
+        _worker_startup = None
+
     return location, path, scan_errors, scan_time, results, timings
 
 
@@ -1572,6 +1923,23 @@ def get_displayable_summary(codebase, scan_names, processes, errors):
         '%(final_size_count)s' % locals()
     )
 
+    cache_hits = codebase.counters.get('scan:cache_hits', 0)
+    cache_misses = codebase.counters.get('scan:cache_misses', 0)
+    cache_lookups = cache_hits + cache_misses
+    if cache_lookups:
+        cache_hit_rate = cache_hits * 100 / cache_lookups
+        summary_messages.append(
+            'Scan cache:     %(cache_hits)d hit(s), %(cache_misses)d miss(es), '
+            'hit rate: %(cache_hit_rate).1f%%' % locals()
+        )
+
+    duplicates_count = codebase.counters.get('scan:duplicates_count', 0)
+    if duplicates_count:
+        summary_messages.append(
+            'Duplicates:     %(duplicates_count)d file(s) with the scan results '
+            'of an identical file' % locals()
+        )
+
     summary_messages.append('Timings:')
 
     cle = codebase.get_or_create_current_header().to_dict()
@@ -1582,11 +1950,63 @@ def get_displayable_summary(codebase, scan_names, processes, errors):
         if value > 0.1:
             summary_messages.append('  %(name)s: %(value).2fs' % locals())
 
+    workers_startup = codebase.counters.get('scan:workers_startup')
+    if workers_startup:
+        workers_count = len(workers_startup)
+        max_startup = max(workers_startup.values())
+        summary_messages.append(
+            '  workers_startup: %(workers_count)d worker(s), '
+            'max: %(max_startup).2fs' % locals()
+        )
+        for worker_pid, startup in sorted(workers_startup.items()):
+            summary_messages.append('    worker %(worker_pid)d: %(startup).2fs' % locals())
+
+    license_match_stats = codebase.counters.get('scan:license_match_stats')
+    if license_match_stats:
+        summary_messages.extend(get_license_match_stats_summary(license_match_stats))
+
     # TODO: if timing was requested display top per-scan/per-file stats?
 
     return error_messages, summary_messages
 
 
+def get_license_match_stats_summary(stats):
+    """
+    Return a list of displayable summary messages for a license matching
+    ``stats`` mapping as returned by MatchStats.to_dict().
+    """
+    queries = stats['queries']
+    prefiltered = stats['prefiltered']
+    query_runs = stats['query_runs']
+    candidates = stats['candidates']
+    alignments = stats['alignments']
+    refine_time = stats['refine_time']
+    messages = [
+        '  license_matching: %(queries)d quer(ies), %(query_runs)d query run(s), '
+        '%(candidates)d candidate(s), %(alignments)d alignment(s)' % locals()
+    ]
+    if prefiltered:
+        messages.append('    prefiltered: %(prefiltered)d quer(ies) that cannot match' % locals())
+    for name, counts in stats['matchers'].items():
+        duration = counts['time']
+        matches = counts['matches']
+        messages.append('    %(name)s: %(duration).2fs, %(matches)d match(es)' % locals())
+    messages.append('    refine: %(refine_time).2fs' % locals())
+    if stats['deadline_reached']:
+        messages.append('    deadline reached: matching was cut short for some file(s)')
+
+    memo_hits = stats['memo_hits']
+    memo_misses = stats['memo_misses']
+    memo_lookups = memo_hits + memo_misses
+    if memo_lookups:
+        memo_hit_rate = memo_hits * 100 / memo_lookups
+        messages.append(
+            '    memo: %(memo_hits)d hit(s), %(memo_misses)d miss(es), '
+            'hit rate: %(memo_hit_rate).1f%%' % locals()
+        )
+    return messages
+
+
 def collect_errors(codebase, verbose=False):
     """
     Collect and return a list of error strings for all `codebase`-level and
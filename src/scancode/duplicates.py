@@ -0,0 +1,104 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+from collections import defaultdict
+from copy import deepcopy
+
+from commoncode.hash import sha1
+
+"""
+Scan identical files only once in a scan run.
+
+Large codebases often contain many byte-identical files such as LICENSE files
+or vendored sources. We group files first by size and name, and then by content
+hash (only computed for files with the same size and name) and scan one
+representative file of each group of identical files. The results of scanners
+that depend only on a file content and name (such as licenses or copyrights) are
+then copied from the representative to its duplicates. The other scanners still
+run on every file.
+"""
+
+
+class DuplicateFiles:
+    """
+    Track the duplicated files of a codebase for the ``scanner_names`` scanners
+    whose results are stored in the ``attributes`` Resource attribute names.
+    """
+
+    def __init__(self, scanner_names, attributes):
+        self.scanner_names = frozenset(scanner_names)
+        self.attributes = tuple(attributes)
+        # {duplicate path: representative path}
+        self.representatives = {}
+
+    def group(self, resources):
+        """
+        Return a tuple of (unique, duplicates) lists of resource tuples from a
+        ``resources`` iterable of (location, path) or (location, path, SHA1 or
+        None) tuples. ``unique`` contains the files with a distinct content and
+        the representative file of each group of identical files, in the
+        original order. ``duplicates`` contains the other identical files.
+
+        The known SHA1 of a file, such as set by the info scan, is reused rather
+        than computed again.
+        """
+        resources = list(resources)
+
+        by_size_and_name = defaultdict(list)
+        for resource in resources:
+            location, path = resource[:2]
+            try:
+                size = os.path.getsize(location)
+            except OSError:
+                continue
+            by_size_and_name[(size, os.path.basename(path))].append(resource)
+
+        representatives = {}
+        for candidates in by_size_and_name.values():
+            if len(candidates) < 2:
+                continue
+            by_sha1 = {}
+            for resource in candidates:
+                location, path = resource[:2]
+                content_sha1 = resource[2] if len(resource) > 2 else None
+                if not content_sha1:
+                    try:
+                        content_sha1 = sha1(location)
+                    except OSError:
+                        continue
+                representative = by_sha1.setdefault(content_sha1, path)
+                if representative != path:
+                    representatives[path] = representative
+
+        self.representatives = representatives
+        unique = [r for r in resources if r[1] not in representatives]
+        duplicates = [r for r in resources if r[1] in representatives]
+        return unique, duplicates
+
+    def copy_results(self, codebase):
+        """
+        Copy the scan results and scan errors of each representative Resource
+        to its duplicates in the ``codebase``.
+        """
+        get_resource = codebase.get_resource
+        for path, representative_path in self.representatives.items():
+            representative = get_resource(path=representative_path)
+            resource = get_resource(path=path)
+            if not representative or not resource:
+                continue
+            for name in self.attributes:
+                value = getattr(representative, name, None)
+                if value:
+                    # each Resource gets its own copy since the results may be
+                    # updated later for a single Resource
+                    setattr(resource, name, deepcopy(value))
+            if representative.scan_errors:
+                resource.scan_errors.extend(representative.scan_errors)
+            codebase.save_resource(resource)
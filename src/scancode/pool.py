@@ -48,8 +48,10 @@ WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 
 
+import multiprocessing
 from multiprocessing import pool
 from multiprocessing import TimeoutError
+import sys
 
 
 
@@ -87,5 +89,21 @@ pool.IMapUnorderedIterator.next = wrapped(pool.IMapUnorderedIterator.next)
 pool.IMapUnorderedIterator.__next__ = pool.IMapUnorderedIterator.next
 
 
+def get_start_method():
+    """
+    Return the multiprocessing start method to use for pool worker processes.
+
+    On Linux we "fork" workers such that they inherit the already loaded and
+    warmed up memory of the parent process (such as the license index and the
+    copyright detector) copy-on-write and can start scanning immediately. This
+    applies also to workers that replace a recycled worker. Elsewhere, we use
+    the platform default.
+    """
+    if sys.platform.startswith('linux'):
+        return 'fork'
+    return None
+
+
 def get_pool(processes=None, initializer=None, initargs=(), maxtasksperchild=None):
-    return pool.Pool(processes, initializer, initargs, maxtasksperchild)
+    context = multiprocessing.get_context(get_start_method())
+    return pool.Pool(processes, initializer, initargs, maxtasksperchild, context=context)
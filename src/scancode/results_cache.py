@@ -0,0 +1,166 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import json
+import os
+from hashlib import sha1
+
+from commoncode.hash import sha1 as file_sha1
+
+"""
+An on-disk cache of file scan results reused across scan runs.
+
+The scan results of a file are cached by file content hash and file name, such
+that the results of an identical file scanned in a previous run can be reused
+rather than scanned again. Only the results of scanners that depend only on the
+file content and name are cached (such as licenses or copyrights): other
+scanners always run. The file name is part of the cache key as some scanners
+handle a file differently based on its name or extension.
+
+Each cache entry is a JSON file stored under a directory specific to a
+"configuration key" computed from the scanners, their options, the ScanCode
+version and the license index version: changing any of these yields new entries.
+
+The cache size is capped: the least recently used entries are removed at the
+end of a scan when the cache is over its maximum size. Cache entries are written
+atomically and can be written and read concurrently by multiple processes.
+"""
+
+# the directory name of the scan results cache in the ScanCode cache directory
+SCAN_RESULTS_CACHE_DIR = 'scan_results'
+
+# after eviction, the cache size is below this fraction of its maximum size
+EVICTION_RATIO = 0.9
+
+
+class ScanResultsCache:
+    """
+    An on-disk cache of the scan results of ``scanner_names`` scanners stored
+    under the ``cache_dir`` directory for a ``config_key`` string, capped to
+    ``max_size`` bytes.
+    """
+
+    def __init__(self, cache_dir, scanner_names, config_key, max_size):
+        self.cache_dir = cache_dir
+        self.scanner_names = frozenset(scanner_names)
+        self.config_key = config_key
+        self.max_size = max_size
+        self.entries_dir = os.path.join(cache_dir, config_key)
+
+    def get_entry_location(self, location, content_sha1=None):
+        """
+        Return the location of the cache entry for the file at ``location``
+        using its ``content_sha1`` SHA1 if known or computing it otherwise.
+        """
+        content_sha1 = content_sha1 or file_sha1(location)
+        file_name = os.path.basename(location)
+        key = sha1(f'{content_sha1}/{file_name}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.entries_dir, key[:2], key + '.json')
+
+    def get(self, location, content_sha1=None):
+        """
+        Return a mapping of cached scan results for the file at ``location`` or
+        None if there are no cached results for this file. Use the
+        ``content_sha1`` SHA1 of this file if known.
+        """
+        try:
+            entry_location = self.get_entry_location(location, content_sha1)
+            with open(entry_location) as inp:
+                results = json.load(inp)
+            # refresh the entry last used time for LRU eviction
+            os.utime(entry_location)
+            return results
+        except (OSError, ValueError):
+            return None
+
+    def put(self, location, results, content_sha1=None):
+        """
+        Save the ``results`` mapping of scan results for the file at
+        ``location`` in the cache. Use the ``content_sha1`` SHA1 of this file if
+        known.
+        """
+        try:
+            entry_location = self.get_entry_location(location, content_sha1)
+            os.makedirs(os.path.dirname(entry_location), exist_ok=True)
+            tmp_location = f'{entry_location}.{os.getpid()}.tmp'
+            with open(tmp_location, 'w') as out:
+                json.dump(results, out, separators=(',', ':'))
+            os.replace(tmp_location, entry_location)
+        except (OSError, TypeError, ValueError):
+            # a scan that fails to be cached will be scanned again next time
+            pass
+
+    def evict(self):
+        """
+        Remove the least recently used cache entries if the cache is larger
+        than its maximum size. Return the number of removed entries.
+        """
+        entries = []
+        cache_size = 0
+        for top, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                location = os.path.join(top, name)
+                try:
+                    stat = os.stat(location)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, location))
+                cache_size += stat.st_size
+
+        if cache_size <= self.max_size:
+            return 0
+
+        target_size = self.max_size * EVICTION_RATIO
+        removed = 0
+        entries.sort()
+        for _mtime, size, location in entries:
+            if cache_size <= target_size:
+                break
+            try:
+                os.remove(location)
+            except OSError:
+                continue
+            cache_size -= size
+            removed += 1
+        return removed
+
+
+def get_license_index_version():
+    """
+    Return a string that changes when the license index cache changes.
+    """
+    from licensedcode.cache import LICENSE_INDEX_DIR
+    from licensedcode.cache import LICENSE_INDEX_FILENAME
+    from scancode_config import licensedcode_cache_dir
+
+    cache_file = os.path.join(
+        licensedcode_cache_dir, LICENSE_INDEX_DIR, LICENSE_INDEX_FILENAME)
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return ''
+    return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+
+def get_config_key(scanners, license_index_version=''):
+    """
+    Return a configuration key string for a list of ``scanners`` Scanner and a
+    ``license_index_version`` string.
+    """
+    from scancode_config import __version__
+
+    scanners_config = []
+    for scanner in sorted(scanners, key=lambda s: s.name):
+        options = getattr(scanner.function, 'keywords', None) or {}
+        options = sorted((key, repr(value)) for key, value in options.items())
+        scanners_config.append([scanner.name, options])
+
+    config = [__version__, license_index_version, scanners_config]
+    config = json.dumps(config, separators=(',', ':')).encode('utf-8')
+    return sha1(config).hexdigest()
@@ -0,0 +1,311 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+import queue
+from collections import deque
+from functools import partial
+
+"""
+Schedule the scan of files in a process pool in batches.
+
+Sending one (location, path) tuple to a worker and getting back one result per
+task means one inter-process round trip per file: with many small files, this
+IPC overhead dominates the actual scan time. Instead we group small files in
+batches that are scanned by a worker in a single task and returned as a single
+list of results. Large files are always scanned alone.
+
+The number of files in a batch is adapted to the observed scan time per file
+such that a batch takes about TARGET_BATCH_DURATION seconds to scan: this keeps
+the progress reporting responsive and the workers evenly loaded.
+
+Optionally, files can be scanned in order of decreasing estimated scan cost
+such that a few large files do not keep a few workers busy at the end of a scan.
+"""
+
+# files of this size in bytes or larger are always scanned alone
+LARGE_FILE_SIZE = 1024 * 1024
+
+# max cumulative size in bytes of the files of a batch
+MAX_BATCH_SIZE = 1024 * 1024
+
+# max number of files in a batch
+MAX_BATCH_FILES = 100
+
+# target scan duration of a batch in seconds
+TARGET_BATCH_DURATION = 0.5
+
+# weight of a new observation in the moving average of per-file scan time
+SMOOTHING = 0.2
+
+# number of leading bytes of a file sniffed to estimate its scan cost
+SNIFF_SIZE = 4096
+
+# extra seconds to wait for the scan results of a batch beyond the timeouts of
+# its files, for the IPC and the worker startup
+BATCH_TIMEOUT_SLACK = 60
+
+# relative scan cost of a byte of binary compared to a byte of text
+BINARY_BYTE_COST = 0.1
+
+# scan cost of a line of text in bytes-equivalent: many scans work line by line
+LINE_COST = 64
+
+
+def get_file_size(location):
+    try:
+        return os.path.getsize(location)
+    except OSError:
+        return 0
+
+
+def get_scan_cost(location):
+    """
+    Return a cheap estimate of the relative cost to scan the file at
+    ``location``, based on its size, its binary or text content type and its
+    estimated number of lines. Only the first SNIFF_SIZE bytes are read.
+    """
+    try:
+        size = os.path.getsize(location)
+        if not size:
+            return 0
+        with open(location, 'rb') as inp:
+            head = inp.read(SNIFF_SIZE)
+    except OSError:
+        return 0
+
+    if not head:
+        return 0
+
+    if b'\x00' in head:
+        return size * BINARY_BYTE_COST
+
+    # text: extrapolate the number of lines of the whole file from its head
+    lines = (head.count(b'\n') + 1) * size / len(head)
+    return size + lines * LINE_COST
+
+
+def order_by_cost(resources):
+    """
+    Return a list of ``resources`` tuples starting with (location, path) sorted
+    by decreasing estimated scan cost such that the costliest files are scanned
+    first.
+
+    This is a "longest processing time first" schedule: the long running scans
+    of large files are started early and the many short scans of small files
+    fill the gaps at the end, instead of a few large files found late in a scan
+    keeping a few workers busy long after the others are done.
+    """
+    costed = [(get_scan_cost(resource[0]), resource) for resource in resources]
+    costed.sort(key=lambda c: c[0], reverse=True)
+    return [resource for _cost, resource in costed]
+
+
+class AdaptiveBatcher:
+    """
+    Group an iterable of ``resources`` tuples starting with (location, path) in
+    batches of files to scan together.
+    """
+
+    def __init__(
+        self,
+        resources,
+        large_file_size=LARGE_FILE_SIZE,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_batch_files=MAX_BATCH_FILES,
+        target_duration=TARGET_BATCH_DURATION,
+    ):
+        self.resources = iter(resources)
+        self.large_file_size = large_file_size
+        self.max_batch_size = max_batch_size
+        self.max_batch_files = max_batch_files
+        self.target_duration = target_duration
+
+        # start small to get some early results and observations
+        self.batch_files = 1
+        # moving average of the scan time of small files in seconds
+        self.file_duration = None
+        # a (resource, size) that did not fit in the last batch
+        self._next = None
+
+    def _get_next(self):
+        if self._next:
+            item, self._next = self._next, None
+            return item
+        for resource in self.resources:
+            return resource, get_file_size(resource[0])
+
+    def next_batch(self):
+        """
+        Return a tuple of (list of resources, is_large) for the next batch of
+        files to scan, or None if there are no files left to scan.
+        ``is_large`` is True if this is a batch of a single large file.
+        """
+        batch = []
+        batch_size = 0
+        while len(batch) < self.batch_files:
+            item = self._get_next()
+            if not item:
+                break
+
+            resource, size = item
+            if size >= self.large_file_size:
+                if batch:
+                    self._next = item
+                    break
+                return [resource], True
+
+            if batch and batch_size + size > self.max_batch_size:
+                self._next = item
+                break
+
+            batch.append(resource)
+            batch_size += size
+
+        if batch:
+            return batch, False
+
+    def observe(self, scan_time):
+        """
+        Update the batch size based on the ``scan_time`` scan duration in
+        seconds of a small file.
+        """
+        if self.file_duration is None:
+            self.file_duration = scan_time
+        else:
+            self.file_duration += SMOOTHING * (scan_time - self.file_duration)
+
+        if self.file_duration > 0:
+            batch_files = int(self.target_duration / self.file_duration)
+        else:
+            batch_files = self.max_batch_files
+        self.batch_files = max(1, min(batch_files, self.max_batch_files))
+
+
+def get_error_scans(batch, error):
+    """
+    Return a list of scan result tuples for each resource tuple starting with
+    (location, path) of a ``batch`` of files that could not be scanned with an
+    ``error`` message.
+    """
+    return [
+        (location, path, [error], 0, {}, {})
+        for location, path, *_ in batch
+    ]
+
+
+class BatchedScans:
+    """
+    Iterator over the scan results of running the ``func`` batch scanning
+    function in a ``pool`` of processes on the batches of an
+    AdaptiveBatcher ``batcher``. ``func`` accepts a list of resource tuples
+    and returns a list of scan result tuples. Results are returned one by one
+    and unordered, as soon as their batch is ready.
+
+    Keep up to ``max_pending`` batches submitted to the pool at any time. If a
+    batch fails or if no batch result is returned in time, an error scan result
+    is returned for each file of the failed batch or of the oldest pending batch
+    and the scan goes on with the next batches.
+
+    A file scan runs for up to ``file_timeout`` seconds: a batch result is
+    waited for up to this timeout for each file of the largest pending batch
+    plus BATCH_TIMEOUT_SLACK seconds. Wait without limit if ``file_timeout`` is
+    zero.
+    """
+
+    def __init__(self, pool, func, batcher, max_pending, file_timeout=0):
+        self.pool = pool
+        self.func = func
+        self.batcher = batcher
+        self.max_pending = max(1, max_pending)
+        self.file_timeout = file_timeout
+
+        # queue of (batch id, is_large, scans, error) tuples filled from pool
+        # callbacks
+        self.done = queue.Queue()
+        # {batch id: batch} of the pending batches in submission order
+        self.pending = {}
+        self.batch_id = 0
+        self.scans = deque()
+        self.submit()
+
+    def submit(self):
+        while len(self.pending) < self.max_pending:
+            next_batch = self.batcher.next_batch()
+            if not next_batch:
+                return
+            batch, is_large = next_batch
+            self.batch_id += 1
+            self.pool.apply_async(
+                self.func,
+                (batch,),
+                callback=partial(self._callback, self.batch_id, is_large),
+                error_callback=partial(self._error_callback, self.batch_id),
+            )
+            self.pending[self.batch_id] = batch
+
+    def get_timeout(self):
+        """
+        Return the timeout in seconds to wait for the next batch result or None
+        to wait without limit.
+        """
+        if not self.file_timeout:
+            return None
+        max_files = max(len(batch) for batch in self.pending.values())
+        return self.file_timeout * max_files + BATCH_TIMEOUT_SLACK
+
+    def _callback(self, batch_id, is_large, scans):
+        self.done.put((batch_id, is_large, scans, None))
+
+    def _error_callback(self, batch_id, error):
+        self.done.put((batch_id, True, [], error))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self.scans:
+            if not self.pending:
+                raise StopIteration
+
+            timeout = self.get_timeout()
+            try:
+                batch_id, is_large, scans, error = self.done.get(timeout=timeout)
+            except queue.Empty:
+                # the oldest pending batch is lost: its late results if any are
+                # ignored
+                batch_id = next(iter(self.pending))
+                batch = self.pending.pop(batch_id)
+                error = (
+                    'ERROR: Processing interrupted: timeout after '
+                    f'{timeout} seconds waiting for the scan of a batch '
+                    f'of {len(batch)} files.'
+                )
+                self.scans.extend(get_error_scans(batch, error))
+                self.submit()
+                continue
+
+            batch = self.pending.pop(batch_id, None)
+            if batch is None:
+                # the late results of a lost batch
+                continue
+
+            if error:
+                error = f'ERROR: Failed to scan a batch of files: {error!r}'
+                scans = get_error_scans(batch, error)
+            elif not is_large:
+                for scan in scans:
+                    # the scan_time is the fourth item of a scan result
+                    self.batcher.observe(scan[3])
+            self.scans.extend(scans)
+            self.submit()
+
+        return self.scans.popleft()
+
+    next = __next__
@@ -32,6 +32,14 @@ except NameError:
         pass
 
 
+def _get_bool_env(name):
+    """
+    Return True if the ``name`` environment variable is set to a true value
+    such as "1", "true" or "yes" and False otherwise.
+    """
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 def _create_dir(location):
     """
     Create directory and all sub-directories recursively at `location`.
@@ -182,6 +190,31 @@ std_license_cache_dir = join(scancode_src_dir, 'licensedcode', 'data', 'cache')
 __env_license_cache_dir = os.getenv('SCANCODE_LICENSE_INDEX_CACHE')
 licensedcode_cache_dir = (__env_license_cache_dir or std_license_cache_dir)
 
+# If set, the license index cache stores its largest per-rule arrays in a flat
+# file that is memory-mapped read-only and shared by all the processes using it
+licensedcode_index_mmap = _get_bool_env('SCANCODE_LICENSE_INDEX_MMAP')
+
+# Number of processes used to load and tokenize the license rules files when
+# building the license index. If 0, use all the available CPUs.
+licensedcode_index_build_processes = int(os.getenv('SCANCODE_LICENSE_INDEX_BUILD_PROCESSES', 0))
+
+# Maximum size in MB of the on-disk cache of scan results reused across runs
+# when using the --scan-cache option
+scan_results_cache_max_size = int(os.getenv('SCANCODE_SCAN_CACHE_MAX_SIZE', 1024))
+
+# Maximum size in MB of a binary file to extract text strings from. Strings are
+# extracted only from the head, the tail and sections sampled in between of the
+# larger binaries. If 0, strings are extracted from the whole of any binary.
+binary_strings_max_size = int(os.getenv('SCANCODE_BINARY_STRINGS_MAX_SIZE', 0))
+
+# Maximum number of license detection results for package extracted license
+# statements memoized in a scan process
+package_license_memo_size = int(os.getenv('SCANCODE_PACKAGE_LICENSE_MEMO_SIZE', 10000))
+
+# If set, the extracted license statements seen in a scan are saved in the
+# cache directory and detected ahead of the next scan runs
+package_license_memo_warm_start = _get_bool_env('SCANCODE_PACKAGE_LICENSE_MEMO_WARM_START')
+
 _create_dir(licensedcode_cache_dir)
 _create_dir(scancode_cache_dir)
 
@@ -11,7 +11,9 @@ import io
 import json
 import os
 import re
+import threading
 import unicodedata
+from contextlib import contextmanager
 
 import chardet
 import typecode
@@ -87,6 +89,20 @@ def numbered_text_lines(
             logger_debug('numbered_text_lines:', 'plain_text')
         return enumerate(unicode_text_lines(location), start_line)
 
+    context = _current_context
+    if context and context.location == location:
+        if TRACE:
+            logger_debug('numbered_text_lines:', 'from extraction context')
+        return context.numbered_text_lines(demarkup=demarkup, start_line=start_line)
+
+    return _numbered_text_lines(location=location, demarkup=demarkup, start_line=start_line)
+
+
+def _numbered_text_lines(location, demarkup=False, start_line=1):
+    """
+    Return an iterable of (line number, text line) extracted from the file at
+    ``location``. See ``numbered_text_lines`` for details.
+    """
     T = typecode.get_type(location)
 
     if TRACE:
@@ -177,14 +193,193 @@ def numbered_text_lines(
     return iter([])
 
 
+class ExtractionContext:
+    """
+    Text extracted once from the file at ``location`` and shared by all the
+    scanners that run on this file such that the file is read, type-detected,
+    decoded, demarkup'ed and broken in lines only once per file.
+
+    Lines are extracted lazily for each variant (plain or demarkup'ed), only as
+    far as requested, and kept in memory until the context is discarded: a
+    scanner that stops early does not read the whole file and the next scanner
+    reuses the lines already extracted. The lines of files larger than
+    MAX_SHARED_TEXT_SIZE are not kept and are extracted again on each request
+    instead.
+    """
+
+    def __init__(self, location):
+        self.location = location
+        self._type = None
+        self._is_markup = None
+        self._is_shared = None
+        # {demarkup flag: list of (line number, text line) extracted so far}
+        self._numbered_lines = {}
+        # {demarkup flag: iterator of (line number, text line) not yet extracted}
+        self._unread_numbered_lines = {}
+        self._lock = threading.Lock()
+        # {key: value} of results computed from the text of this file that
+        # are shared by the scanners, such as the emails and URLs found at once
+        self.memo = {}
+
+    @property
+    def type(self):
+        """
+        Return the typecode Type of this file.
+        """
+        if self._type is None:
+            self._type = typecode.get_type(self.location)
+        return self._type
+
+    @property
+    def is_markup(self):
+        """
+        Return True if this file is some markup that could be demarkup'ed.
+        """
+        if self._is_markup is None:
+            self._is_markup = bool(
+                self.type.contains_text
+                and markup.is_markup(self.location)
+            )
+        return self._is_markup
+
+    @property
+    def is_shared(self):
+        """
+        Return True if the text lines of this file can be kept in memory.
+        """
+        if self._is_shared is None:
+            try:
+                size = os.path.getsize(self.location)
+            except OSError:
+                size = 0
+            self._is_shared = size <= MAX_SHARED_TEXT_SIZE
+        return self._is_shared
+
+    def numbered_text_lines(self, demarkup=False, start_line=1):
+        """
+        Return an iterable of (line number, text line) for this file. See
+        ``numbered_text_lines`` for details.
+        """
+        if not self.is_shared:
+            return _numbered_text_lines(
+                location=self.location,
+                demarkup=demarkup,
+                start_line=start_line,
+            )
+
+        # the demarkup'ed lines are the same as plain lines for non-markup
+        demarkup = bool(demarkup and self.is_markup)
+        numbered_lines = self._iter_numbered_lines(demarkup)
+
+        if start_line == 1:
+            return numbered_lines
+
+        offset = start_line - 1
+        return ((ln + offset, line) for ln, line in numbered_lines)
+
+    def _iter_numbered_lines(self, demarkup):
+        """
+        Yield (line number, text line) for this file, first from the lines
+        already extracted, then extracting and keeping the next lines only as
+        they are consumed.
+
+        Several iterators can be consumed at once, including from different
+        threads such as a scanner thread still running after a timeout: the
+        extraction of each next line is serialized with a lock.
+        """
+        numbered_lines = self._get_numbered_lines(demarkup)
+        index = 0
+        while True:
+            if index < len(numbered_lines):
+                yield numbered_lines[index]
+                index += 1
+                continue
+
+            with self._lock:
+                # the lines may have been extracted by another iterator or
+                # discarded after a failed extraction in the meantime
+                numbered_lines = self._get_numbered_lines(demarkup)
+                if index < len(numbered_lines):
+                    continue
+
+                unread_numbered_lines = self._unread_numbered_lines.get(demarkup)
+                if unread_numbered_lines is None:
+                    return
+
+                try:
+                    numbered_line = next(unread_numbered_lines)
+                except StopIteration:
+                    # all the lines are extracted
+                    del self._unread_numbered_lines[demarkup]
+                    return
+                except BaseException:
+                    # the extraction failed or was interrupted such as on
+                    # timeout: extract again from the start on the next request
+                    self._numbered_lines.pop(demarkup, None)
+                    self._unread_numbered_lines.pop(demarkup, None)
+                    raise
+
+                numbered_lines.append(numbered_line)
+
+    def _get_numbered_lines(self, demarkup):
+        """
+        Return the list of (line number, text line) extracted so far for the
+        ``demarkup`` variant, starting a new extraction if needed.
+        """
+        numbered_lines = self._numbered_lines.get(demarkup)
+        if numbered_lines is None:
+            numbered_lines = self._numbered_lines[demarkup] = []
+            self._unread_numbered_lines[demarkup] = iter(_numbered_text_lines(
+                location=self.location,
+                demarkup=demarkup,
+            ))
+        return numbered_lines
+
+
+# The ExtractionContext of the file being scanned, if any.
+_current_context = None
+
+# Maximum size in bytes of a file whose extracted text lines are kept in memory
+# in an ExtractionContext.
+MAX_SHARED_TEXT_SIZE = 20 * 1024 * 1024
+
+
+def get_extraction_context(location):
+    """
+    Return the active ExtractionContext for the file at ``location`` or None.
+    """
+    context = _current_context
+    if context and isinstance(location, str) and context.location == location:
+        return context
+
+
+@contextmanager
+def extraction_context(location):
+    """
+    Context manager to share the text extracted from the file at ``location``
+    with every ``numbered_text_lines`` call made for this same ``location``
+    while the context is active. Yield an ExtractionContext.
+    """
+    global _current_context
+    previous = _current_context
+    _current_context = context = ExtractionContext(location)
+    try:
+        yield context
+    finally:
+        _current_context = previous
+
+
 def unicode_text_lines_from_binary(location):
     """
     Return an iterable over unicode text lines extracted from a binary file at
-    location.
+    location. The lines are extracted lazily and only from up to
+    ``scancode_config.binary_strings_max_size`` MB of the file if set.
     """
+    import scancode_config
     T = typecode.get_type(location)
     if T.contains_text:
-        for line in strings.strings_from_file(location):
+        max_bytes = scancode_config.binary_strings_max_size * 1024 * 1024
+        for line in strings.strings_from_file(location, max_bytes=max_bytes):
             yield remove_verbatim_cr_lf_tab_chars(line)
 
 
@@ -334,10 +529,44 @@ def unicode_text_lines(location, decrlf=False):
         return lines
 
 
-def _unicode_text_lines(location):
+def _unicode_text_lines(location, block_size=1024 * 1024):
+    """
+    Yield unicode text lines from a file at ``location`` reading this file in
+    blocks of ``block_size`` bytes such that large files are never loaded at
+    once in memory.
+    """
     with open(location, 'rb') as f:
-        for line in f.read().splitlines(True):
-            yield as_unicode(line)
+        # the pieces of the last line of the previous blocks: this line may
+        # continue in the next block and its pieces are joined only once
+        pieces = []
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+
+            if pieces and pieces[-1].endswith((b'\r', b'\n')):
+                # the last line ended at the end of the previous block: keep
+                # together a CR LF split across two blocks
+                if pieces[-1].endswith(b'\r') and block.startswith(b'\n'):
+                    pieces.append(b'\n')
+                    block = block[1:]
+                yield as_unicode(b''.join(pieces))
+                pieces = []
+                if not block:
+                    continue
+
+            lines = block.splitlines(True)
+            last_line = lines.pop()
+            if lines:
+                pieces.append(lines[0])
+                lines[0] = b''.join(pieces)
+                pieces = []
+                for line in lines:
+                    yield as_unicode(line)
+            pieces.append(last_line)
+
+        if pieces:
+            yield as_unicode(b''.join(pieces))
 
 
 def unicode_text(location, decrlf=False):
@@ -7,6 +7,8 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+import mmap
+import os
 import re
 import string
 
@@ -33,21 +35,93 @@ MIN_LEN = 4
 MIN_LEN_STR = b'4'
 
 
-def strings_from_file(location, buff_size=1024 * 1024, clean=True, min_len=MIN_LEN):
+def strings_from_file(
+    location,
+    buff_size=1024 * 1024,
+    clean=True,
+    min_len=MIN_LEN,
+    max_bytes=0,
+):
     """
     Yield unicode strings made only of printable ASCII characters found in file
-    at `location``. Process the file in chunks of `buff_size` bytes (to limit
-    memory usage).
+    at `location``. The file is memory-mapped and processed lazily in chunks of
+    `buff_size` bytes. A string that straddles two chunks is extracted whole
+    unless it is longer than `buff_size`. A file that cannot be memory-mapped
+    is read in chunks instead.
+
+    If `max_bytes` is not zero, only process up to about `max_bytes` bytes of
+    the file from its head, tail and sections sampled in between. See
+    get_byte_ranges() for details.
     """
     with open(location, 'rb') as f:
-        while 1:
-            buf = f.read(buff_size)
-            if not buf:
-                break
-            for s in strings_from_string(buf, clean=clean, min_len=min_len):
-                s = s.strip()
-                if len(s) >= min_len:
-                    yield s
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file cannot be mapped
+            return
+        except OSError:
+            # some files such as special files cannot be mapped: read these
+            mapped = None
+
+        if mapped is None:
+            size = os.fstat(f.fileno()).st_size
+            for start, end in get_byte_ranges(size, max_bytes=max_bytes):
+                if not max_bytes:
+                    # the size of special files may be unknown: read all
+                    end = None
+                matches = read_string_matches(f, start, end, buff_size=buff_size)
+                for s in strings_from_matches(matches, clean=clean, min_len=min_len):
+                    s = s.strip()
+                    if len(s) >= min_len:
+                        yield s
+            return
+
+        with mapped:
+            for start, end in get_byte_ranges(len(mapped), max_bytes=max_bytes):
+                matches = string_matches(mapped, start, end, buff_size=buff_size)
+                strs = strings_from_matches(matches, clean=clean, min_len=min_len)
+                try:
+                    for s in strs:
+                        s = s.strip()
+                        if len(s) >= min_len:
+                            yield s
+                finally:
+                    # the mapped file cannot be closed while some matches
+                    # reference it, such as when we stop early
+                    strs.close()
+                    matches.close()
+
+
+def get_byte_ranges(size, max_bytes=0, samples=8):
+    """
+    Return a list of (start, end) byte offsets ranges to process in a file of
+    `size` bytes with a budget of `max_bytes`. Return a single range for the
+    whole file if `max_bytes` is zero or not smaller than `size`. Otherwise,
+    return a head range and a tail range of a quarter of the budget each and
+    `samples` ranges evenly spread in between sharing the rest of the budget.
+
+    For example:
+    >>> get_byte_ranges(1000)
+    [(0, 1000)]
+    >>> get_byte_ranges(1000, max_bytes=2000)
+    [(0, 1000)]
+    >>> get_byte_ranges(1000, max_bytes=100, samples=2)
+    [(0, 25), (250, 275), (725, 750), (975, 1000)]
+    """
+    if not max_bytes or max_bytes >= size:
+        return [(0, size)]
+
+    head_size = tail_size = max_bytes // 4
+    tail_start = size - tail_size
+    sample_size = (max_bytes - head_size - tail_size) // samples
+
+    ranges = [(0, head_size)]
+    step = (tail_start - head_size) / samples
+    for i in range(samples):
+        start = head_size + int(step * i + (step - sample_size) / 2)
+        ranges.append((start, start + sample_size))
+    ranges.append((tail_start, size))
+    return [(start, end) for start, end in ranges if end > start]
 
 
 # Extracted text is digit, letters, punctuation and white spaces
@@ -57,21 +131,116 @@ printable = b'A-Za-z0-9' + whitespaces + punctuation
 null_byte = b'\x00'
 
 _ascii_pattern = (
+    # both start with a printable: having this first in the pattern is much
+    # faster as the regex engine can skip quickly over non-printable bytes
+    b'[' + printable + b']'
+    +b'(?:'
     # plain ASCII is a sequence of printable of a minimum length
-      b'('
     +b'[' + printable + b']'
-    +b'{' + MIN_LEN_STR + b',}'
-    +b')'
+    +b'{' + str(MIN_LEN - 1).encode('ascii') + b',}'
     # or utf-16-le-encoded ASCII is a sequence of ASCII+null byte
     +b'|'
-    +b'('
+    +null_byte
     +b'(?:' + b'[' + printable + b']' + null_byte + b')'
-    +b'{' + MIN_LEN_STR + b',}'
+    +b'{' + str(MIN_LEN - 1).encode('ascii') + b',}'
     +b')'
 )
 
 ascii_strings = re.compile(_ascii_pattern).finditer
 
+# A string that does not touch the end of a chunk cannot continue in the next
+# chunk unless it is shorter than a minimum length string in UTF-16-LE: the
+# next chunk is searched starting this many bytes before the end of a chunk.
+BOUNDARY_OVERLAP = MIN_LEN * 2
+
+
+def string_matches(data, start=0, end=None, buff_size=1024 * 1024):
+    """
+    Yield regex match objects for strings found in a `data` bytes-like object
+    such as an mmap between the `start` and `end` offsets. Search lazily in
+    chunks of `buff_size` bytes. A string that straddles two chunks is matched
+    whole unless it is longer than `buff_size`.
+
+    For example:
+    >>> data = b'\x01abcdef\x02ghijkl\x03'
+    >>> [m.group() for m in string_matches(data, buff_size=10)]
+    [b'abcdef', b'ghijkl']
+    """
+    if end is None:
+        end = len(data)
+
+    pos = start
+    while pos < end:
+        chunk_end = min(pos + buff_size, end)
+        is_last_chunk = chunk_end == end
+        last_match_end = pos
+        next_pos = None
+
+        for match in ascii_strings(data, pos, chunk_end):
+            if (
+                not is_last_chunk
+                # a UTF-16-LE string can end with a half character
+                and match.end() >= chunk_end - 1
+                and match.start() > pos
+            ):
+                # this string may continue in the next chunk: match it again
+                next_pos = match.start()
+                break
+            yield match
+            last_match_end = match.end()
+
+        if is_last_chunk:
+            return
+
+        if next_pos is None:
+            next_pos = max(last_match_end, chunk_end - BOUNDARY_OVERLAP, pos + 1)
+        pos = next_pos
+
+
+def read_string_matches(f, start=0, end=None, buff_size=1024 * 1024):
+    """
+    Yield regex match objects for strings found in an `f` binary file object
+    between the `start` and `end` offsets or the end of the file if `end` is
+    None. Read the file in chunks of `buff_size` bytes. A string that straddles
+    two chunks is matched whole unless it is longer than `buff_size`.
+    """
+    f.seek(start)
+    remaining = None if end is None else end - start
+    pending = b''
+    while True:
+        read_size = buff_size if remaining is None else min(buff_size, remaining)
+        chunk = f.read(read_size) if read_size > 0 else b''
+        if remaining is not None:
+            remaining -= len(chunk)
+
+        is_last_chunk = not chunk
+        data = pending + chunk
+        if not data:
+            return
+
+        last_match_end = 0
+        next_pos = None
+        for match in ascii_strings(data):
+            if (
+                not is_last_chunk
+                # a UTF-16-LE string can end with a half character
+                and match.end() >= len(data) - 1
+                and match.start() > 0
+            ):
+                # this string may continue in the next chunk: match it again
+                next_pos = match.start()
+                break
+            yield match
+            last_match_end = match.end()
+
+        if is_last_chunk:
+            return
+
+        if next_pos is None:
+            next_pos = max(last_match_end, len(data) - BOUNDARY_OVERLAP)
+        pending = data[next_pos:]
+
+
 replace_literal_line_returns = re.compile(
     '[\\n\\r]+$'
 ).sub
@@ -92,7 +261,15 @@ def strings_from_string(binary_string, clean=False, min_len=0):
     and filter short and repeated strings. Note: we do not keep the offset of
     where a string was found (e.g. match.start).
     """
-    for match in ascii_strings(binary_string):
+    return strings_from_matches(ascii_strings(binary_string), clean, min_len)
+
+
+def strings_from_matches(matches, clean=False, min_len=0):
+    """
+    Yield strings extracted from a `matches` iterable of regex match objects.
+    See strings_from_string() for details.
+    """
+    for match in matches:
         s = decode(match.group())
         if not s:
             continue
@@ -10,9 +10,14 @@
 
 import os.path
 
+import pytest
+from pygmars import lex
+
 import cluecode_test_utils  # NOQA
 from commoncode.testcase import FileBasedTesting
 from cluecode import copyrights
+from cluecode.copyrights_lexer import CopyrightLexer
+from textcode.analysis import numbered_text_lines
 
 
 class TestTextPreparation(FileBasedTesting):
@@ -121,6 +126,43 @@ class TestTextPreparation(FileBasedTesting):
         result = list(copyrights.candidate_lines(enumerate(lines, 1)))
         assert result == expected
 
+    def test_candidate_lines_reads_lines_lazily_in_batches(self):
+        read = []
+
+        def numbered_lines():
+            for i in range(1, 100001):
+                read.append(i)
+                yield i, 'Copyright (c) Acme' if i % 2 else ''
+
+        candidates = copyrights.candidate_lines(numbered_lines())
+        assert next(candidates) == [(1, 'Copyright (c) Acme')]
+        assert len(read) == 10000
+
+    def test_get_hinted_line_indexes(self):
+        lines = [
+            'def foo(bar):',
+            '    # Copyright 2012 Foo',
+            '    return bar',
+            '    # (C) Bar',
+            '    # All R.E.S.E.R.V.E.D.',
+            '    # Écrit par Bar',
+            '    a = b',
+            '    # written by: Bar',
+            '    # written byte',
+        ]
+        assert copyrights.get_hinted_line_indexes(lines) == {1, 3, 4, 5, 7}
+
+    def test_candidate_lines_are_the_same_without_candidate_hints(self):
+        test_dir = self.get_test_loc('copyrights_basic')
+        for test_file in sorted(os.listdir(test_dir)):
+            numbered_lines = list(numbered_text_lines(os.path.join(test_dir, test_file)))
+            try:
+                copyrights.USE_CANDIDATE_HINTS = False
+                expected = list(copyrights.candidate_lines(numbered_lines))
+            finally:
+                copyrights.USE_CANDIDATE_HINTS = True
+            assert list(copyrights.candidate_lines(numbered_lines)) == expected
+
     def test_is_candidates_should_not_select_line_with_bare_full_year(self):
         line = '2012'
         line, _char_only = copyrights.prep_line(line)
@@ -237,6 +279,38 @@ class TestCopyrightDetector(FileBasedTesting):
         assert results == expected
 
 
+class TestCopyrightLexer(FileBasedTesting):
+    test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def check_same_labels_as_lexer(self, test_dir):
+        lexer = lex.Lexer(copyrights.patterns)
+        copyright_lexer = CopyrightLexer(copyrights.patterns)
+        test_dir = self.get_test_loc(test_dir)
+        for top, _dirs, files in os.walk(test_dir):
+            for test_file in files:
+                location = os.path.join(top, test_file)
+                numbered_lines = list(numbered_text_lines(location, demarkup=True))
+                for candidates in copyrights.candidate_lines(numbered_lines):
+                    values = [t.value for t in copyrights.get_tokens(candidates)]
+                    expected = [(t.value, t.label) for t in lexer.lex_strings(values)]
+                    results = [(t.value, t.label) for t in copyright_lexer.lex_strings(values)]
+                    assert results == expected, location
+
+    def test_copyright_lexer_labels_are_the_same_as_lexer_labels(self):
+        self.check_same_labels_as_lexer('copyrights_basic')
+
+    @pytest.mark.scanslow
+    def test_copyright_lexer_labels_are_the_same_as_lexer_labels_on_copyrights(self):
+        self.check_same_labels_as_lexer('copyrights')
+
+    def test_copyright_lexer_tries_all_patterns_for_non_ascii_values(self):
+        patterns = [(r'^(?i:k)$', 'K'), (r'^\W+$', 'JUNK'), (r'.+', 'NN')]
+        lexer = CopyrightLexer(patterns)
+        values = ['k', 'K', '\u212a', '\u00a9', 'kk']
+        results = [t.label for t in lexer.lex_strings(values)]
+        assert results == ['K', 'K', 'K', 'JUNK', 'NN']
+
+
 def check_full_detections(expected, test_file):
     """
     Run detection of copyright on the test_file, checking the results
@@ -758,6 +758,74 @@ class TestUrl(FileBasedTesting):
             assert str == type(url)
 
 
+class TestEmailsAndUrls(FileBasedTesting):
+    test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def test_find_emails_and_urls_is_the_same_as_find_emails_and_find_urls(self):
+        test_dir = self.get_test_loc('finder')
+        for top, _dirs, files in os.walk(test_dir):
+            for test_file in files:
+                location = os.path.join(top, test_file)
+                for unique in (True, False):
+                    expected = (
+                        list(finder.find_emails(location, unique)),
+                        list(finder.find_urls(location, unique)),
+                    )
+                    emails, urls = finder.find_emails_and_urls(location, unique)
+                    assert (list(emails), list(urls)) == expected, location
+
+    def test_find_emails_and_urls_with_line_numbers(self):
+        lines = [
+            'Copyright (c) Example Inc.',
+            'Contact: joe@nexb.com or see https://nexb.com',
+            'See WWW.scancode.io',
+            'git clone git@github.com:nexB/scancode-toolkit.git',
+        ]
+        emails, urls = finder.find_emails_and_urls(lines)
+        expected = [
+            ('https://nexb.com/', 2),
+            ('http://www.scancode.io/', 3),
+            ('git@github.com:nexB/scancode-toolkit.git', 4),
+        ]
+        assert list(urls) == expected
+        assert list(emails) == [('joe@nexb.com', 2), ('git@github.com', 4)]
+
+    def test_find_emails_and_urls_reads_lines_only_as_far_as_needed(self):
+        read = []
+
+        def lines():
+            for i in range(1000):
+                read.append(i)
+                yield f'see joe{i}@nexb.com at https://nexb.com/{i}'
+
+        emails, urls = finder.find_emails_and_urls(lines())
+        assert next(emails) == ('joe0@nexb.com', 1)
+        assert next(urls) == ('https://nexb.com/0', 1)
+        assert next(urls) == ('https://nexb.com/1', 2)
+        assert read == [0, 1]
+        assert next(emails) == ('joe1@nexb.com', 2)
+        assert read == [0, 1]
+
+    def test_find_skips_the_lines_without_hints(self):
+        lines = ['joe nexb.com', 'some@nexb.com', 'http']
+        searched = []
+
+        class Pattern:
+
+            def findall(self, line):
+                searched.append(line)
+                return []
+
+        patterns = [('emails', Pattern()), ('urls', Pattern()), (None, Pattern())]
+        assert list(find(lines, patterns)) == []
+        expected = [
+            'joe nexb.com',
+            'some@nexb.com', 'some@nexb.com', 'some@nexb.com',
+            'http',
+        ]
+        assert searched == expected
+
+
 class TestSearch(FileBasedTesting):
     test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
 
@@ -0,0 +1,11 @@
+/* This file is generated. Do not edit. */
+static const struct entry entries_block[] = {
+	{ .id = 0x0001, .name = "alpha", .flags = FLAG_READ | FLAG_WRITE, .size = 16 },
+	{ .id = 0x0002, .name = "beta", .flags = FLAG_READ, .size = 32 },
+	{ .id = 0x0003, .name = "gamma", .flags = FLAG_WRITE, .size = 64 },
+	{ .id = 0x0004, .name = "delta", .flags = FLAG_READ | FLAG_EXEC, .size = 128 },
+	{ .id = 0x0005, .name = "epsilon", .flags = 0, .size = 256 },
+	{ .id = 0x0006, .name = "zeta", .flags = FLAG_READ, .size = 512 },
+	{ .id = 0x0007, .name = "eta", .flags = FLAG_WRITE | FLAG_EXEC, .size = 1024 },
+	{ .id = 0x0008, .name = "theta", .flags = FLAG_READ | FLAG_WRITE, .size = 2048 },
+};
@@ -0,0 +1,37 @@
+/*
+ * Copyright 2019 The Example Project Authors
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.example.parser;
+
+import java.util.ArrayList;
+import java.util.List;
+
+public final class Parser {
+
+    private final List<String> tokens = new ArrayList<>();
+
+    public Parser(String text) {
+        for (String token : text.split("\\s+")) {
+            if (!token.isEmpty()) {
+                tokens.add(token);
+            }
+        }
+    }
+
+    public List<String> tokens() {
+        return tokens;
+    }
+}
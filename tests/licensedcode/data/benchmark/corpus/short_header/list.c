@@ -0,0 +1,32 @@
+/*
+ * list.c - a simple linked list
+ *
+ * Copyright (C) 2004 Example Developers
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 2 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ */
+
+#include <stdlib.h>
+
+struct node {
+	struct node *next;
+	void *data;
+};
+
+struct node *list_push(struct node *head, void *data)
+{
+	struct node *node = malloc(sizeof(*node));
+	if (!node)
+		return head;
+	node->next = head;
+	node->data = data;
+	return node;
+}
@@ -0,0 +1,17 @@
+# Copyright (c) 2021 Example Contributors
+# Licensed under the MIT License. See LICENSE file in the project root for
+# full license information.
+
+import itertools
+
+
+def chunked(iterable, size):
+    """
+    Yield lists of ``size`` items from ``iterable``.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
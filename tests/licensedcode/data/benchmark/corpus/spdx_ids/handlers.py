@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+
+def handler_0(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_0", 0)
+
+def handler_1(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_1", 1)
+
+def handler_2(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_2", 2)
+
+def handler_3(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_3", 3)
+
+def handler_4(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_4", 4)
+
+def handler_5(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_5", 5)
+
+def handler_6(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_6", 6)
+
+def handler_7(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_7", 7)
+
+def handler_8(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_8", 8)
+
+def handler_9(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_9", 9)
+
+def handler_10(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_10", 10)
+
+def handler_11(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_11", 11)
+
+def handler_12(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_12", 12)
+
+def handler_13(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_13", 13)
+
+def handler_14(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_14", 14)
+
+def handler_15(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_15", 15)
+
+def handler_16(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_16", 16)
+
+def handler_17(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_17", 17)
+
+def handler_18(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_18", 18)
+
+def handler_19(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_19", 19)
+
+def handler_20(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_20", 20)
+
+def handler_21(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_21", 21)
+
+def handler_22(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_22", 22)
+
+def handler_23(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_23", 23)
+
+def handler_24(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_24", 24)
+
+def handler_25(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_25", 25)
+
+def handler_26(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_26", 26)
+
+def handler_27(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_27", 27)
+
+def handler_28(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_28", 28)
+
+def handler_29(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_29", 29)
+
+def handler_30(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_30", 30)
+
+def handler_31(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_31", 31)
+
+def handler_32(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_32", 32)
+
+def handler_33(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_33", 33)
+
+def handler_34(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_34", 34)
+
+def handler_35(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_35", 35)
+
+def handler_36(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_36", 36)
+
+def handler_37(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_37", 37)
+
+def handler_38(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_38", 38)
+
+def handler_39(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_39", 39)
+
+def handler_40(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_40", 40)
+
+def handler_41(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_41", 41)
+
+def handler_42(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_42", 42)
+
+def handler_43(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_43", 43)
+
+def handler_44(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_44", 44)
+
+def handler_45(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_45", 45)
+
+def handler_46(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_46", 46)
+
+def handler_47(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_47", 47)
+
+def handler_48(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_48", 48)
+
+def handler_49(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_49", 49)
+
+def handler_50(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_50", 50)
+
+def handler_51(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_51", 51)
+
+def handler_52(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_52", 52)
+
+def handler_53(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_53", 53)
+
+def handler_54(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_54", 54)
+
+def handler_55(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_55", 55)
+
+def handler_56(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_56", 56)
+
+def handler_57(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_57", 57)
+
+def handler_58(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_58", 58)
+
+def handler_59(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_59", 59)
+
+def handler_60(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_60", 60)
+
+def handler_61(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_61", 61)
+
+def handler_62(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_62", 62)
+
+def handler_63(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_63", 63)
+
+def handler_64(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_64", 64)
+
+def handler_65(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_65", 65)
+
+def handler_66(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_66", 66)
+
+def handler_67(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_67", 67)
+
+def handler_68(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_68", 68)
+
+def handler_69(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_69", 69)
+
+def handler_70(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_70", 70)
+
+def handler_71(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_71", 71)
+
+def handler_72(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_72", 72)
+
+def handler_73(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_73", 73)
+
+def handler_74(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_74", 74)
+
+def handler_75(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_75", 75)
+
+def handler_76(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_76", 76)
+
+def handler_77(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_77", 77)
+
+def handler_78(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_78", 78)
+
+def handler_79(event):
+    # SPDX-FileCopyrightText: 2022 Example Contributors
+    return event.get("value_79", 79)
+
@@ -0,0 +1,360 @@
+// SPDX-License-Identifier: MIT
+static const int table_0[] = { 0, 0, 0 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_1[] = { 1, 3, 7 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_2[] = { 2, 6, 14 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_3[] = { 3, 9, 21 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_4[] = { 4, 12, 28 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_5[] = { 5, 15, 35 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_6[] = { 6, 18, 42 };
+
+// SPDX-License-Identifier: ISC
+static const int table_7[] = { 7, 21, 49 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_8[] = { 8, 24, 56 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_9[] = { 9, 27, 63 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_10[] = { 10, 30, 70 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_11[] = { 11, 33, 77 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_12[] = { 12, 36, 84 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_13[] = { 13, 39, 91 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_14[] = { 14, 42, 98 };
+
+// SPDX-License-Identifier: MIT
+static const int table_15[] = { 15, 45, 105 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_16[] = { 16, 48, 112 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_17[] = { 17, 51, 119 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_18[] = { 18, 54, 126 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_19[] = { 19, 57, 133 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_20[] = { 20, 60, 140 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_21[] = { 21, 63, 147 };
+
+// SPDX-License-Identifier: ISC
+static const int table_22[] = { 22, 66, 154 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_23[] = { 23, 69, 161 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_24[] = { 24, 72, 168 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_25[] = { 25, 75, 175 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_26[] = { 26, 78, 182 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_27[] = { 27, 81, 189 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_28[] = { 28, 84, 196 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_29[] = { 29, 87, 203 };
+
+// SPDX-License-Identifier: MIT
+static const int table_30[] = { 30, 90, 210 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_31[] = { 31, 93, 217 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_32[] = { 32, 96, 224 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_33[] = { 33, 99, 231 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_34[] = { 34, 102, 238 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_35[] = { 35, 105, 245 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_36[] = { 36, 108, 252 };
+
+// SPDX-License-Identifier: ISC
+static const int table_37[] = { 37, 111, 259 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_38[] = { 38, 114, 266 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_39[] = { 39, 117, 273 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_40[] = { 40, 120, 280 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_41[] = { 41, 123, 287 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_42[] = { 42, 126, 294 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_43[] = { 43, 129, 301 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_44[] = { 44, 132, 308 };
+
+// SPDX-License-Identifier: MIT
+static const int table_45[] = { 45, 135, 315 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_46[] = { 46, 138, 322 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_47[] = { 47, 141, 329 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_48[] = { 48, 144, 336 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_49[] = { 49, 147, 343 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_50[] = { 50, 150, 350 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_51[] = { 51, 153, 357 };
+
+// SPDX-License-Identifier: ISC
+static const int table_52[] = { 52, 156, 364 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_53[] = { 53, 159, 371 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_54[] = { 54, 162, 378 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_55[] = { 55, 165, 385 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_56[] = { 56, 168, 392 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_57[] = { 57, 171, 399 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_58[] = { 58, 174, 406 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_59[] = { 59, 177, 413 };
+
+// SPDX-License-Identifier: MIT
+static const int table_60[] = { 60, 180, 420 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_61[] = { 61, 183, 427 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_62[] = { 62, 186, 434 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_63[] = { 63, 189, 441 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_64[] = { 64, 192, 448 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_65[] = { 65, 195, 455 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_66[] = { 66, 198, 462 };
+
+// SPDX-License-Identifier: ISC
+static const int table_67[] = { 67, 201, 469 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_68[] = { 68, 204, 476 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_69[] = { 69, 207, 483 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_70[] = { 70, 210, 490 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_71[] = { 71, 213, 497 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_72[] = { 72, 216, 504 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_73[] = { 73, 219, 511 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_74[] = { 74, 222, 518 };
+
+// SPDX-License-Identifier: MIT
+static const int table_75[] = { 75, 225, 525 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_76[] = { 76, 228, 532 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_77[] = { 77, 231, 539 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_78[] = { 78, 234, 546 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_79[] = { 79, 237, 553 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_80[] = { 80, 240, 560 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_81[] = { 81, 243, 567 };
+
+// SPDX-License-Identifier: ISC
+static const int table_82[] = { 82, 246, 574 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_83[] = { 83, 249, 581 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_84[] = { 84, 252, 588 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_85[] = { 85, 255, 595 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_86[] = { 86, 258, 602 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_87[] = { 87, 261, 609 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_88[] = { 88, 264, 616 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_89[] = { 89, 267, 623 };
+
+// SPDX-License-Identifier: MIT
+static const int table_90[] = { 90, 270, 630 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_91[] = { 91, 273, 637 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_92[] = { 92, 276, 644 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_93[] = { 93, 279, 651 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_94[] = { 94, 282, 658 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_95[] = { 95, 285, 665 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_96[] = { 96, 288, 672 };
+
+// SPDX-License-Identifier: ISC
+static const int table_97[] = { 97, 291, 679 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_98[] = { 98, 294, 686 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_99[] = { 99, 297, 693 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_100[] = { 100, 300, 700 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_101[] = { 101, 303, 707 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_102[] = { 102, 306, 714 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_103[] = { 103, 309, 721 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_104[] = { 104, 312, 728 };
+
+// SPDX-License-Identifier: MIT
+static const int table_105[] = { 105, 315, 735 };
+
+// SPDX-License-Identifier: Apache-2.0
+static const int table_106[] = { 106, 318, 742 };
+
+// SPDX-License-Identifier: GPL-2.0-only
+static const int table_107[] = { 107, 321, 749 };
+
+// SPDX-License-Identifier: GPL-2.0-or-later
+static const int table_108[] = { 108, 324, 756 };
+
+// SPDX-License-Identifier: BSD-3-Clause
+static const int table_109[] = { 109, 327, 763 };
+
+// SPDX-License-Identifier: LGPL-2.1-or-later
+static const int table_110[] = { 110, 330, 770 };
+
+// SPDX-License-Identifier: MPL-2.0
+static const int table_111[] = { 111, 333, 777 };
+
+// SPDX-License-Identifier: ISC
+static const int table_112[] = { 112, 336, 784 };
+
+// SPDX-License-Identifier: BSD-2-Clause
+static const int table_113[] = { 113, 339, 791 };
+
+// SPDX-License-Identifier: GPL-2.0-only WITH Linux-syscall-note
+static const int table_114[] = { 114, 342, 798 };
+
+// SPDX-License-Identifier: (GPL-2.0-only OR BSD-2-Clause)
+static const int table_115[] = { 115, 345, 805 };
+
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+static const int table_116[] = { 116, 348, 812 };
+
+// SPDX-License-Identifier: EPL-2.0
+static const int table_117[] = { 117, 351, 819 };
+
+// SPDX-License-Identifier: Unlicense
+static const int table_118[] = { 118, 354, 826 };
+
+// SPDX-License-Identifier: Zlib
+static const int table_119[] = { 119, 357, 833 };
+
@@ -0,0 +1,111 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+
+from commoncode.testcase import FileBasedTesting
+
+from licensedcode import benchmark
+from licensedcode import index
+from licensedcode_test_utils import create_rule_from_text_and_expression
+from licensedcode_test_utils import mini_legalese
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+class TestBenchmark(FileBasedTesting):
+    test_data_dir = TEST_DATA_DIR
+
+    def test_get_strata_of_benchmark_corpus(self):
+        corpus_dir = self.get_test_loc('benchmark/corpus')
+        work_dir = self.get_temp_dir()
+        strata = benchmark.get_strata(corpus_dir=corpus_dir, work_dir=work_dir)
+        expected = [
+            'binary_strings',
+            'full_license',
+            'huge_generated',
+            'long_notice',
+            'minified_js',
+            'near_duplicate',
+            'short_header',
+            'spdx_ids',
+        ]
+        assert list(strata) == expected
+        assert all(strata.values())
+
+        generated = strata['huge_generated'][0]
+        assert generated.startswith(work_dir)
+        seed = os.path.join(corpus_dir, 'huge_generated', os.path.basename(generated))
+        assert os.path.getsize(generated) == os.path.getsize(seed) * 5000
+
+    def test_run_benchmark_with_index(self):
+        rule_text = 'Redistribution and use in source and binary forms, with or without modification, are permitted'
+        idx = index.LicenseIndex(
+            [create_rule_from_text_and_expression(text=rule_text, license_expression='bsd')],
+            _legalese=mini_legalese,
+        )
+
+        corpus_dir = self.get_temp_dir()
+        os.mkdir(os.path.join(corpus_dir, 'short'))
+        with open(os.path.join(corpus_dir, 'short', 'header.c'), 'w') as out:
+            out.write(f'/* {rule_text} */\nint main() {{ return 0; }}\n')
+        os.mkdir(os.path.join(corpus_dir, 'none'))
+        with open(os.path.join(corpus_dir, 'none', 'main.c'), 'w') as out:
+            out.write('int main() { return 0; }\n')
+
+        results = benchmark.run_benchmark(corpus_dir=corpus_dir, idx=idx, runs=2, isolate=False)
+        assert results['index'] is None
+        assert list(results['strata']) == ['none', 'short']
+
+        short = results['strata']['short']
+        assert short['files'] == 1
+        assert short['tokens'] == 18
+        assert short['detections'] == {'header.c': ['bsd']}
+        assert 0 < short['p50'] <= short['p95']
+        assert short['tokens_per_sec'] > 0
+        assert results['strata']['none']['detections'] == {'main.c': []}
+
+        assert not benchmark.compare_to_baseline(results, results)
+
+    def test_compare_to_baseline_reports_regressions(self):
+        baseline = dict(
+            index=dict(load_time=2.0, rss=1000 * 1024 * 1024),
+            strata=dict(
+                short=dict(
+                    p50=0.1,
+                    p95=0.2,
+                    tokens_per_sec=1000,
+                    peak_rss=1000 * 1024 * 1024,
+                    detections={'a.c': ['mit']},
+                ),
+                missing=dict(p50=0.1),
+            ),
+        )
+        results = dict(
+            index=dict(load_time=2.4, rss=2000 * 1024 * 1024),
+            strata=dict(
+                short=dict(
+                    # within tolerance
+                    p50=0.12,
+                    p95=0.5,
+                    tokens_per_sec=700,
+                    peak_rss=1010 * 1024 * 1024,
+                    detections={'a.c': ['mit', 'mit']},
+                ),
+            ),
+        )
+        regressions = benchmark.compare_to_baseline(results, baseline, tolerance=0.25)
+        expected = [
+            'index rss: 2.09715e+09 is above 1.31072e+09 (baseline: 1.04858e+09)',
+            'short p95: 0.5 is above 0.25 (baseline: 0.2)',
+            'short tokens_per_sec: 700 is below 800 (baseline: 1000)',
+            "short a.c: detected ['mit', 'mit'] instead of ['mit']",
+            'missing: missing stratum',
+        ]
+        assert regressions == expected
@@ -921,6 +921,42 @@ class TestMatchAccuracyWithFullIndex(FileBasedTesting):
                 results.append((detected, match.lines(), with_span and match.qspan or None))
         assert results == expected
 
+    def test_match_query_windows_has_same_matches_as_whole_query(self):
+        from licensedcode.query import build_query_windows
+        test_location = self.get_test_loc('perf/udll.cxx')
+        idx = cache.get_index()
+        expected = [
+            (m.rule.identifier, m.lines())
+            for m in idx.match(location=test_location)
+        ]
+        windows = build_query_windows(test_location, idx, window_lines=60, overlap_lines=20)
+        matches = idx.match_query_windows(windows)
+        assert [(m.rule.identifier, m.lines()) for m in matches] == expected
+        # each match comes from the query of a different window
+        assert len(set(m.query for m in matches)) > 1
+
+    def test_match_query_windows_stitches_matches_across_windows(self):
+        from licensedcode.query import build_query_windows
+        idx = cache.get_index()
+        license_text = cache.get_licenses_db()['gpl-2.0'].text
+        test_location = self.get_temp_file('txt')
+        with open(test_location, 'w') as tf:
+            tf.write('int some_code(void);\n' * 300)
+            tf.write(license_text)
+            tf.write('\nint some_more_code(void);\n' * 300)
+
+        expected = [
+            (m.rule.identifier, m.lines(), m.coverage())
+            for m in idx.match(location=test_location)
+        ]
+        assert expected == [('gpl-2.0.LICENSE', (301, 639), 100)]
+
+        # the license text starts in the first window, spans more lines than
+        # the overlap of two windows and ends in the second window
+        windows = build_query_windows(test_location, idx, window_lines=400, overlap_lines=50)
+        matches = idx.match_query_windows(windows)
+        assert [(m.rule.identifier, m.lines(), m.coverage()) for m in matches] == expected
+
     def test_match_has_correct_positions_basic(self):
         idx = cache.get_index()
         querys = u'''Licensed under the GNU General Public License (GPL).
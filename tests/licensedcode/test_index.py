@@ -15,6 +15,7 @@ from commoncode import fileutils
 from commoncode.testcase import FileBasedTesting
 from licensedcode import index
 from licensedcode import match_seq
+from licensedcode import match_set
 from licensedcode import models
 from licensedcode.legalese import build_dictionary_from_iterable
 from licensedcode.query import Query
@@ -193,6 +194,76 @@ class TestIndexing(IndexTesting):
 
         assert sorted([sorted(kv.items()) for kv in htmset]) == sorted([sorted(kv.items()) for kv in expected_msets_by_rid])
 
+    def test_index_high_rids_by_tid_is_an_inverted_index_of_approx_matchable_rules(self):
+        idx = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+        assert idx.approx_matchable_rids
+        assert len(idx.high_rids_by_tid) == idx.len_legalese
+        approx_matchable_rids = sorted(idx.approx_matchable_rids)
+        for tid in range(idx.len_legalese):
+            expected = [rid for rid in approx_matchable_rids if tid in idx.sets_by_rid[rid]]
+            assert list(idx.high_rids_by_tid[tid]) == expected
+
+    def test_compute_high_intersections_lengths_of_all_rules(self):
+        idx = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+        querys = self.get_test_loc('index/queryperfect')
+        qry = Query(location=querys, idx=idx)
+        qset, _ = match_set.build_set_and_mset(qry.tokens)
+
+        high_lengths = match_set.compute_high_intersections_lengths(
+            qset=qset,
+            high_rids_by_tid=idx.high_rids_by_tid,
+            len_legalese=idx.len_legalese,
+        )
+
+        assert high_lengths
+        for rid in idx.approx_matchable_rids:
+            intersection = qset & idx.sets_by_rid[rid]
+            high_intersection = match_set.high_tids_set_subset(intersection, idx.len_legalese)
+            assert high_lengths[rid] == len(high_intersection)
+
+    def test_index_prefilter_rids_by_tid_lists_each_regular_rule_once(self):
+        idx = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+        prefiltered_rids = []
+        for tid, rids in idx.prefilter_rids_by_tid.items():
+            for rid in rids:
+                assert tid in idx.sets_by_rid[rid]
+                prefiltered_rids.append(rid)
+        assert sorted(prefiltered_rids) == sorted(idx.regular_rids)
+
+    def test_may_match_query_does_not_lose_matches(self):
+        idx = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+
+        def matched(query_string, **kwargs):
+            return [
+                (m.rule.identifier, m.matcher, m.qspan)
+                for m in idx.match(query_string=query_string, **kwargs)
+            ]
+
+        rules_dir = self.get_test_loc('index/bsd')
+        query_strings = ['int main() { return 0; }', 'this is not licensed']
+        for rule_file in sorted(os.listdir(rules_dir)):
+            with open(os.path.join(rules_dir, rule_file)) as rf:
+                words = rf.read().split()
+            query_strings.extend([
+                ' '.join(words),
+                ' '.join(words[3:-10]) + ' and some other words',
+                ' '.join(words[:10]),
+                ' '.join(words[-5:]),
+            ])
+
+        for query_string in query_strings:
+            for unknown_licenses in (False, True):
+                try:
+                    index.USE_PREFILTER = False
+                    expected = matched(query_string, unknown_licenses=unknown_licenses)
+                finally:
+                    index.USE_PREFILTER = True
+                assert matched(query_string, unknown_licenses=unknown_licenses) == expected
+
+                qry = Query(query_string=query_string, idx=idx)
+                if expected:
+                    assert idx.may_match_query(qry, unknown_licenses=unknown_licenses)
+
     def test_index_fails_on_duplicated_rules(self):
         rule_dir = self.get_test_loc('index/no_duplicated_rule')
         try:
@@ -201,6 +272,72 @@ class TestIndexing(IndexTesting):
         except index.DuplicateRuleError as e:
             assert 'Duplicate rules' in str(e)
 
+    def test_overlay_index_matches_like_a_combined_index(self):
+        rules = self.get_test_rules('index/bsd')
+        base = MiniLicenseIndex(rules[:3])
+        base_dictionary = dict(base.dictionary)
+        overlay = MiniLicenseIndex(rules[3:], _base=base)
+
+        assert overlay.layers() == [base, overlay]
+        assert base.dictionary == base_dictionary
+        assert set(overlay.rules_by_id) == set(r.identifier for r in rules)
+        assert all(overlay.dictionary[t] == tid for t, tid in base_dictionary.items())
+        assert overlay.len_legalese == base.len_legalese
+        assert overlay.get_rule_layer(base.rules_by_rid[0]) is base
+        assert overlay.get_rule_layer(overlay.rules_by_rid[0]) is overlay
+        # the overlay rids follow the base rids and the base rules are not copied
+        assert [r.rid for r in overlay.rules_by_rid] == list(range(3, len(rules)))
+        assert [r.rid for r in base.rules_by_rid] == list(range(3))
+        assert set(overlay.rules_by_id.maps[0]) == set(r.identifier for r in rules[3:])
+
+        combined = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+
+        def matched(idx, **kwargs):
+            return [
+                (m.rule.license_expression, m.matcher, m.qspan)
+                for m in idx.match(**kwargs)
+            ]
+
+        rules_dir = self.get_test_loc('index/bsd')
+        for rule_file in sorted(os.listdir(rules_dir)):
+            with open(os.path.join(rules_dir, rule_file)) as rf:
+                text = rf.read()
+            # exact, then approximate match with some words removed and added
+            modified = ' '.join(text.split()[3:-10]) + ' and some other words'
+            for query_string in (text, 'foo ' + text, modified):
+                expected = matched(combined, query_string=query_string, unknown_licenses=True)
+                assert expected
+                assert matched(overlay, query_string=query_string, unknown_licenses=True) == expected
+
+    def test_overlay_index_fragments_matches_use_both_layers(self):
+        rules = self.get_test_rules('index/bsd')
+        try:
+            index.USE_AHO_FRAGMENTS = True
+            base = MiniLicenseIndex(rules[:3])
+            overlay = MiniLicenseIndex(rules[3:], _base=base)
+            combined = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+        finally:
+            index.USE_AHO_FRAGMENTS = False
+
+        def fragments_matched(idx, query_string):
+            qry = Query(query_string=query_string, idx=idx)
+            matches = idx.get_fragments_matches(qry, matched_qspans=[])
+            return sorted((m.rule.license_expression, m.qstart, m.qend) for m in matches)
+
+        for rule in (rules[0], rules[-1]):
+            query_string = 'some words ' + rule.text + ' and other words'
+            expected = fragments_matched(combined, query_string)
+            assert rule.license_expression in [expression for expression, _qs, _qe in expected]
+            assert fragments_matched(overlay, query_string) == expected
+
+    def test_overlay_index_fails_on_rules_duplicated_in_base(self):
+        base = MiniLicenseIndex(self.get_test_rules('index/bsd'))
+        try:
+            MiniLicenseIndex(self.get_test_rules('index/bsd')[:1], _base=base)
+            self.fail('Exception on dupes not raised')
+        except index.DuplicateRuleError as e:
+            assert 'Duplicate rules' in str(e)
+
     @pytest.mark.scanslow
     def test_index_does_not_fail_on_rules_with_similar_normalized_names(self):
         rules_dir = self.get_test_loc('index/similar_names/rules')
@@ -242,6 +379,77 @@ class TestMatchNoTemplates(IndexTesting):
         assert match.qspan == Span(0, 13)
         assert match.ispan == Span(0, 13)
 
+    def test_match_collects_match_stats(self):
+        from licensedcode.match_stats import MatchStats
+        from licensedcode.match_stats import collecting_stats
+
+        rule_text = 'Redistribution and use in source and binary forms, with or without modification, are permitted'
+        idx = MiniLicenseIndex([create_rule_from_text_and_expression(text=rule_text, license_expression='bsd')])
+        querys = '''
+            The
+            Redistribution and use in source and binary forms, with or without modification, are permitted.
+
+            Always'''
+
+        stats = MatchStats()
+        result = idx.match(query_string=querys, stats=stats)
+        assert len(result) == 1
+        assert stats.queries == 1
+        assert stats.query_runs == 1
+        assert not stats.deadline_reached
+        assert list(stats.matchers) == ['hash']
+        assert stats.matchers['hash'][1] == 1
+
+        other_stats = MatchStats()
+        with collecting_stats(other_stats):
+            idx.match(query_string=querys, _skip_hash_match=True)
+            idx.match(query_string=querys, _skip_hash_match=True, unknown_licenses=True)
+        idx.match(query_string=querys)
+        assert other_stats.queries == 2
+        assert other_stats.matchers['aho'][1] == 2
+        assert 'hash' not in other_stats.matchers
+        assert 'unknown' in other_stats.matchers
+
+        stats.update(other_stats.to_dict())
+        assert stats.queries == 3
+        assert stats.matchers['hash'][1] == 1
+        assert stats.matchers['aho'][1] == 2
+
+    def test_match_collects_fragments_match_stats_apart_from_seq(self):
+        from licensedcode.match_stats import MatchStats
+
+        rule_text = 'Redistribution and use in source and binary forms, with or without modification, are permitted'
+        stats = MatchStats()
+        try:
+            index.USE_AHO_FRAGMENTS = True
+            idx = index.LicenseIndex([create_rule_from_text_and_expression(text=rule_text, license_expression='bsd')])
+            query_string = rule_text.replace('modification', 'changes')
+            idx.match(query_string=query_string, stats=stats)
+        finally:
+            index.USE_AHO_FRAGMENTS = False
+        assert 'aho-frag' in stats.matchers
+        assert 'seq' not in stats.matchers
+
+    def test_match_skips_queries_that_cannot_match(self):
+        from licensedcode.match_stats import MatchStats
+
+        rule_text = 'Redistribution and use in source and binary forms, with or without modification, are permitted'
+        weak_rule_text = 'the rose is a rose'
+        idx = MiniLicenseIndex([
+            create_rule_from_text_and_expression(text=rule_text, license_expression='bsd'),
+            create_rule_from_text_and_expression(text=weak_rule_text, license_expression='rose'),
+        ])
+
+        stats = MatchStats()
+        assert idx.match(query_string='int main() { return 0; } /* a rose */', stats=stats) == []
+        assert stats.prefiltered == 1
+        assert stats.queries == 0
+
+        result = idx.match(query_string='a rose. The rose is a rose.', stats=stats)
+        assert [m.rule.license_expression for m in result] == ['rose']
+        assert stats.prefiltered == 1
+        assert stats.queries == 1
+
     def test_match_exact_from_string_twice_with_repeated_text(self):
         _text = u'licensed under the GPL, licensed under the GPL'
         #                0    1   2   3         4      5   6   7
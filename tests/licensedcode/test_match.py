@@ -1007,6 +1007,26 @@ class TestLicenseMatchFilter(FileBasedTesting):
         assert result == [m1]
         assert discarded == [m2]
 
+    def test_restore_non_overlapping_with_many_sparse_matches(self):
+        import random
+        rnd = random.Random(42)
+        r1 = create_rule_from_text_and_expression(license_expression='apache-1.1')
+
+        def sparse_match(start):
+            positions = [start + rnd.randint(0, 40) for _ in range(rnd.randint(1, 6))]
+            return LicenseMatch(rule=r1, qspan=Span(positions), ispan=Span(positions))
+
+        matches = [sparse_match(rnd.randint(0, 5000)) for _ in range(500)]
+        discarded = [sparse_match(rnd.randint(0, 5000)) for _ in range(500)]
+
+        all_matched_qspans = Span().union(*(m.qspan for m in matches))
+
+        result, discarded = restore_non_overlapping(matches, discarded)
+        assert result
+        assert discarded
+        assert all(not m.qspan & all_matched_qspans for m in result)
+        assert all(m.qspan & all_matched_qspans for m in discarded)
+
     def test_filter_key_phrases_keeps_matches_where_key_phrase_spans_is_fully_container_in_ispan(self):
         idx = index.LicenseIndex()
         query = Query(query_string="Lorum ipsum", idx=idx)
@@ -1684,6 +1704,33 @@ class TestCollectLicenseMatchTexts(FileBasedTesting):
         ]
         assert results == expected
 
+    def test_matched_text_does_not_read_the_query_file_again(self):
+        rules_data_dir = self.get_test_loc('matched_text/index/rules')
+        query_location = self.get_test_loc('matched_text/query.txt', copy=True)
+        rules = models.load_rules(rules_data_dir)
+        idx = LicenseIndex(rules)
+
+        matches = idx.match(location=query_location)
+        expected = [match.matched_text(_usecache=False) for match in matches]
+        os.remove(query_location)
+        results = [match.matched_text() for match in matches]
+        assert results == expected
+
+    def test_query_matched_text_tokens_are_the_same_as_tokenize_matched_text(self):
+        rules_data_dir = self.get_test_loc('matched_text/index/rules')
+        rules = models.load_rules(rules_data_dir)
+        idx = LicenseIndex(rules)
+
+        query_location = self.get_test_loc('matched_text/tokenize_matched_text_query.txt')
+        qry = Query(location=query_location, idx=idx)
+        expected = tokenize_matched_text(query_location, None, idx.dictionary, _cache={})
+        matched_text_tokens = qry.matched_text_tokens()
+        assert list(matched_text_tokens.tokens()) == expected
+
+        start_index = matched_text_tokens.start_index(2)
+        expected_from_line2 = [t for t in expected if t.line_num >= 2]
+        assert list(matched_text_tokens.tokens(start_index)) == expected_from_line2
+
     def check_matched_texts(self, test_loc, expected_texts, whole_lines=True):
         idx = cache.get_index()
         test_loc = self.get_test_loc(test_loc)
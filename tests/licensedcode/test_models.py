@@ -8,6 +8,7 @@
 #
 
 import os
+import pickle
 from unittest import TestCase as TestCaseClass
 
 from commoncode.testcase import FileBasedTesting
@@ -216,6 +217,69 @@ class TestRule(FileBasedTesting):
         expected = self.get_test_loc('models/rules.expected.json')
         check_json(expected, results)
 
+    def test_load_rules_with_multiple_processes_is_the_same_as_serial(self):
+        test_dir = self.get_test_loc('models/rules')
+        expected = [(r, r.tokens()) for r in models.load_rules(test_dir)]
+
+        min_parallel_rule_files = models.MIN_PARALLEL_RULE_FILES
+        try:
+            models.MIN_PARALLEL_RULE_FILES = 1
+            rules = list(models.load_rules(test_dir, with_tokens=True, processes=2))
+        finally:
+            models.MIN_PARALLEL_RULE_FILES = min_parallel_rule_files
+
+        assert all(r.pretokenized for r in rules)
+        assert [(r, r.tokens()) for r in rules] == expected
+        assert not any(r.pretokenized for r in rules)
+
+    def test_load_rules_reuses_rule_cache_for_unmodified_rule_files(self):
+        test_dir = self.get_test_loc('models/rules', copy=True)
+        cache_location = os.path.join(self.get_temp_dir(), 'rules_cache')
+
+        rule_cache = models.RuleFileCache.load(cache_location)
+        expected = [(r, r.tokens()) for r in models.load_rules(test_dir, rule_cache=rule_cache)]
+        rule_cache.save()
+
+        # unchanged and touched files are not loaded again
+        touched_file = os.path.join(test_dir, sorted(os.listdir(test_dir))[0])
+        os.utime(touched_file, ns=(0, 0))
+        rule_cache = models.RuleFileCache.load(cache_location)
+        rules = list(models.load_rules(test_dir, rule_cache=rule_cache))
+        assert [(r, r.tokens()) for r in rules] == expected
+
+        # modified files are loaded again
+        modified = rules[-1]
+        modified_file = os.path.join(test_dir, modified.identifier)
+        with open(modified_file, 'a') as mf:
+            mf.write(' and some more text')
+        rule_cache.save()
+        rule_cache = models.RuleFileCache.load(cache_location)
+        rules = list(models.load_rules(test_dir, rule_cache=rule_cache))
+        assert rules[-1].text == modified.text + ' and some more text'
+        assert rules[-1].tokens()[-4:] == ['and', 'some', 'more', 'text']
+        assert rule_cache.is_modified
+
+    def test_rule_cache_is_discarded_if_stale_or_corrupted(self):
+        test_dir = self.get_test_loc('models/rules', copy=True)
+        cache_location = os.path.join(self.get_temp_dir(), 'rules_cache')
+        rule_cache = models.RuleFileCache.load(cache_location)
+        list(models.load_rules(test_dir, rule_cache=rule_cache))
+        rule_cache.save()
+        assert models.RuleFileCache.load(cache_location).entries
+
+        with open(cache_location, 'rb') as cf:
+            _fingerprint, entries = pickle.load(cf)
+        with open(cache_location, 'wb') as cf:
+            pickle.dump(('other code', entries), cf)
+        assert not models.RuleFileCache.load(cache_location).entries
+
+        with open(cache_location, 'wb') as cf:
+            cf.write(b'not a pickle')
+        rule_cache = models.RuleFileCache.load(cache_location)
+        assert not rule_cache.entries
+        rules = list(models.load_rules(test_dir, rule_cache=rule_cache))
+        assert rules and rule_cache.is_modified
+
     def test_rules_have_only_one_flag_of_bool_type(self):
         rules = list(models.load_rules(rules_data_dir))
         rule_errors = []
@@ -145,6 +145,79 @@ class TestMatchingPerf(FileBasedTesting):
         self.profile_match(idx, locations, stats_file)
 
 
+class TestMatchRefinePerformance(FileBasedTesting):
+    test_data_dir = TEST_DATA_DIR
+
+    def get_many_matches(self, count=12000):
+        """
+        Return a list of ``count`` overlapping, contained and sparse synthetic
+        LicenseMatch to many rules, such as found in license lists and long
+        NOTICE files.
+        """
+        import random
+        from licensedcode.match import LicenseMatch
+        from licensedcode.spans import Span
+        from licensedcode_test_utils import create_rule_from_text_and_expression
+
+        rnd = random.Random(42)
+        rules = []
+        for i in range(60):
+            text = ' '.join(f'word{i}x{k}' for k in range(rnd.randint(4, 60)))
+            rule = create_rule_from_text_and_expression(
+                license_expression=f'license-{i % 20}',
+                text=text,
+            )
+            rule.identifier = f'rule-{i}'
+            rule.length = len(text.split())
+            rules.append(rule)
+
+        matches = []
+        qpos = 0
+        for _ in range(count):
+            rule = rnd.choice(rules)
+            length = rnd.randint(1, rule.length)
+            istart = rnd.randint(0, rule.length - length)
+            qstart = max(qpos + rnd.randint(-30, 5), 0)
+            qspan = list(range(qstart, qstart + length))
+            ispan = list(range(istart, istart + length))
+            if length > 3 and rnd.random() < 0.3:
+                # a gap in the query
+                qspan.pop(rnd.randint(1, length - 2))
+                ispan.pop()
+            matches.append(LicenseMatch(
+                rule=rule,
+                qspan=Span(qspan),
+                ispan=Span(ispan),
+                hispan=Span(ispan[:len(ispan) // 2]),
+            ))
+            qpos += rnd.randint(0, 6)
+        return matches
+
+    @skip('Use only for local profiling')
+    def test_refine_many_matches_performance_timing(self):
+        from time import time
+        from licensedcode.match import filter_contained_matches
+        from licensedcode.match import filter_overlapping_matches
+        from licensedcode.match import merge_matches
+        from licensedcode.match import restore_non_overlapping
+
+        timings = []
+        for name, refiner in [
+            ('merge_matches', lambda m: (merge_matches(m), [])),
+            ('filter_contained_matches', filter_contained_matches),
+            ('filter_overlapping_matches', filter_overlapping_matches),
+        ]:
+            matches = self.get_many_matches()
+            start = time()
+            kept, discarded = refiner(matches)
+            restore_non_overlapping(kept, discarded)
+            timings.append((name, len(matches), len(kept), round(time() - start, 3)))
+
+        for name, matches_count, kept_count, duration in timings:
+            print(name, matches_count, kept_count, duration)
+            assert 0 < kept_count <= matches_count, name
+
+
 class TestIndexingPerformance(FileBasedTesting):
     test_data_dir = TEST_DATA_DIR
 
@@ -18,6 +18,7 @@ from licensedcode import index
 from licensedcode import models
 from licensedcode.legalese import build_dictionary_from_iterable
 from licensedcode.query import Query
+from licensedcode.query import build_query_windows
 
 from licensedcode_test_utils import query_tokens_with_unknowns  # NOQA
 from licensedcode_test_utils import query_run_tokens_with_unknowns  # NOQA
@@ -453,6 +454,42 @@ class TestQueryWithSingleRun(IndexTesting):
         assert q.stopwords_by_pos == {-1: 1, 0: 1, 1: 1, 3: 1}
 
 
+class TestQueryWindows(IndexTesting):
+
+    def test_build_query_windows_overlap_and_line_numbers(self):
+        idx = index.LicenseIndex(self.get_test_rules('index/bsd'))
+        query_loc = self.get_temp_file()
+        with open(query_loc, 'w') as ql:
+            for i in range(1, 26):
+                ql.write(f'redistribution line {i}\n')
+
+        windows = list(build_query_windows(query_loc, idx, window_lines=10, overlap_lines=3))
+        results = [
+            (qry.start_line, min(qry.line_by_pos), max(qry.line_by_pos), last_line)
+            for qry, last_line in windows
+        ]
+        expected = [
+            (1, 1, 10, 8),
+            (8, 8, 17, 15),
+            (15, 15, 24, 22),
+            (22, 22, 25, None),
+        ]
+        assert results == expected
+
+        qry, _ = windows[1]
+        assert qry.query_string.splitlines()[0].strip() == 'redistribution line 8'
+
+    def test_build_query_windows_joins_chunks_of_long_lines(self):
+        idx = index.LicenseIndex(self.get_test_rules('index/bsd'))
+        query_loc = self.get_test_loc('query/long_lines.txt')
+        windows = list(build_query_windows(query_loc, idx, window_lines=10, overlap_lines=3))
+        assert len(windows) > 1
+        whole = Query(location=query_loc, idx=idx)
+        for qry, _ in windows:
+            assert qry.has_long_lines
+            assert set(qry.line_by_pos).issubset(set(whole.line_by_pos))
+
+
 class TestQueryWithMultipleRuns(IndexTesting):
 
     def test_query_runs_from_location(self):
@@ -172,3 +172,62 @@ class TestSeq(TestCase):
             matchables=matchables,
         )
         assert tests == seq.Match(a=357, b=0, size=8)
+
+
+class TestSeqArray(TestCase):
+
+    def get_b2j(self, b, len_good):
+        b2j = {}
+        for j, tid in enumerate(b):
+            if tid < len_good:
+                b2j.setdefault(tid, []).append(j)
+        return b2j
+
+    def test_match_blocks_seq_array_is_the_same_as_seq(self):
+        import random
+        from licensedcode import seq_array
+
+        rnd = random.Random(42)
+        len_good = 6
+        for _ in range(500):
+            # a small alphabet yields many ties and repeated tokens
+            b = [rnd.randrange(10) for _ in range(rnd.randrange(1, 40))]
+            a = [rnd.randrange(10) for _ in range(rnd.randrange(1, 60))]
+            # include some copies of b in a
+            pos = rnd.randrange(len(a))
+            a[pos:pos] = b[rnd.randrange(len(b)):]
+            matchables = set(i for i in range(len(a)) if rnd.random() < 0.9)
+            a_start = rnd.randrange(len(a))
+            b2j = self.get_b2j(b, len_good)
+
+            expected = seq.match_blocks(a, b, a_start, len(a), b2j, len_good, matchables)
+            results = seq_array.match_blocks(a, b, a_start, len(a), b2j, len_good, matchables)
+            assert results == expected
+
+    def test_match_blocks_seq_array_with_RulePostings(self):
+        from array import array
+        from licensedcode import seq_array
+        from licensedcode.mapped_index import MappedArrays
+        from licensedcode.mapped_index import MappedPostings
+
+        b = [1, 2, 7, 3, 1, 2, 3, 9]
+        a = [0, 1, 2, 3, 8, 1, 2, 7, 3]
+        len_good = 5
+        b2j = self.get_b2j(b, len_good)
+        tids = sorted(b2j)
+        postings = MappedPostings(
+            tids=array('h', tids),
+            offsets=array('i', [0, len(tids)]),
+            positions=MappedArrays(
+                values=array('h', [p for t in tids for p in b2j[t]]),
+                offsets=array('i', [0, 2, 4, 6]),
+            ),
+        )
+        rule_postings = postings.get_rule_postings(0)
+        assert list(rule_postings.get(3)) == [3, 6]
+        assert rule_postings.get(4) is None
+
+        matchables = set(range(len(a)))
+        expected = seq.match_blocks(a, b, 0, len(a), b2j, len_good, matchables)
+        results = seq_array.match_blocks(a, b, 0, len(a), rule_postings, len_good, matchables)
+        assert results == expected
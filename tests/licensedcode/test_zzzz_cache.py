@@ -8,6 +8,7 @@
 #
 
 import os
+from functools import partial
 
 import pytest
 
@@ -93,6 +94,136 @@ class LicenseIndexCacheTest(FileBasedTesting):
         )
         assert hash.sha1(cache_file) == idx_checksum_before
 
+    def test_LicenseCache_load_or_build_with_mmap(self):
+        licensedcode_cache_dir = self.get_temp_dir('index_cache')
+        scancode_cache_dir = self.get_temp_dir('index_metafiles')
+        idx_cache_dir = os.path.join(licensedcode_cache_dir, cache.LICENSE_INDEX_DIR)
+        arrays_file = os.path.join(idx_cache_dir, cache.LICENSE_INDEX_ARRAYS_FILENAME)
+
+        licenses_data_dir = self.get_test_loc('cache/data/licenses', copy=True)
+        rules_data_dir = self.get_test_loc('cache/data/rules', copy=True)
+
+        built = cache.LicenseCache.load_or_build(
+            licensedcode_cache_dir=licensedcode_cache_dir,
+            scancode_cache_dir=scancode_cache_dir,
+            force=True,
+            timeout=10,
+            licenses_data_dir=licenses_data_dir,
+            rules_data_dir=rules_data_dir,
+            use_mmap=True,
+        )
+        assert os.path.exists(arrays_file)
+
+        loaded = cache.LicenseCache.load_or_build(
+            licensedcode_cache_dir=licensedcode_cache_dir,
+            scancode_cache_dir=scancode_cache_dir,
+            force=False,
+            timeout=10,
+            licenses_data_dir=licenses_data_dir,
+            rules_data_dir=rules_data_dir,
+        )
+
+        from licensedcode.mapped_index import MappedArrays
+        built_index = built.index
+        loaded_index = loaded.index
+        assert isinstance(loaded_index.tids_by_rid, MappedArrays)
+
+        expected_tids = [list(tids) for tids in built_index.tids_by_rid]
+        assert [list(tids) for tids in loaded_index.tids_by_rid] == expected_tids
+
+        def as_lists(postings_by_rid):
+            return [
+                postings and {tid: list(pos) for tid, pos in postings.items()}
+                for postings in postings_by_rid
+            ]
+
+        expected_postings = as_lists(built_index.high_postings_by_rid)
+        assert as_lists(loaded_index.high_postings_by_rid) == expected_postings
+
+        # rebuilding without mmap removes the stale arrays file
+        cache.LicenseCache.load_or_build(
+            licensedcode_cache_dir=licensedcode_cache_dir,
+            scancode_cache_dir=scancode_cache_dir,
+            force=True,
+            timeout=10,
+            licenses_data_dir=licenses_data_dir,
+            rules_data_dir=rules_data_dir,
+            use_mmap=False,
+        )
+        assert not os.path.exists(arrays_file)
+
+    def test_LicenseCache_load_or_build_with_additional_directory_uses_an_overlay(self):
+        licensedcode_cache_dir = self.get_temp_dir('index_cache')
+        scancode_cache_dir = self.get_temp_dir('index_metafiles')
+        idx_cache_dir = os.path.join(licensedcode_cache_dir, cache.LICENSE_INDEX_DIR)
+        base_file = os.path.join(idx_cache_dir, cache.LICENSE_BASE_INDEX_FILENAME)
+        cache_file = os.path.join(idx_cache_dir, cache.LICENSE_INDEX_FILENAME)
+
+        licenses_data_dir = self.get_test_loc('cache/data/licenses', copy=True)
+        rules_data_dir = self.get_test_loc('cache/data/rules', copy=True)
+        additional_dir = self.get_test_loc('additional_licenses/additional_dir', copy=True)
+
+        load_or_build = partial(
+            cache.LicenseCache.load_or_build,
+            licensedcode_cache_dir=licensedcode_cache_dir,
+            scancode_cache_dir=scancode_cache_dir,
+            timeout=10,
+            licenses_data_dir=licenses_data_dir,
+            rules_data_dir=rules_data_dir,
+        )
+
+        builtin = load_or_build(force=True)
+        assert not builtin.index.base
+        assert not os.path.exists(base_file)
+
+        built = load_or_build(force=True, additional_directory=additional_dir)
+        index = built.index
+        assert index.base
+        assert os.path.exists(base_file)
+        assert len(index.base.rules_by_rid) == len(builtin.index.rules_by_rid)
+        assert all(r.is_builtin for r in index.base.rules_by_rid)
+        assert not any(r.is_builtin for r in index.rules_by_rid)
+        assert set(index.rules_by_id) == (
+            set(builtin.index.rules_by_id) | set(r.identifier for r in index.rules_by_rid))
+
+        # the overlay cache does not contain the base rules
+        arrays_file = os.path.join(idx_cache_dir, cache.LICENSE_INDEX_ARRAYS_FILENAME)
+        loaded = cache.load_cache_file(cache_file, arrays_file=arrays_file)
+        assert set(loaded.index.rules_by_id.maps[0]) == set(r.identifier for r in index.rules_by_rid)
+        base_rule = loaded.index.base.rules_by_rid[0]
+        assert loaded.index.rules_by_id[base_rule.identifier] is base_rule
+
+        # a cached base is reused to rebuild an overlay when there is no cache
+        base_stat = os.stat(base_file).st_mtime_ns
+        os.remove(cache_file)
+        rebuilt = load_or_build(additional_directory=additional_dir)
+        assert os.stat(base_file).st_mtime_ns == base_stat
+
+        # but not when the builtin rules are modified
+        rule_file = os.path.join(rules_data_dir, sorted(os.listdir(rules_data_dir))[0])
+        with open(rule_file, 'a') as rf:
+            rf.write('\nsome more rule text\n')
+        os.remove(cache_file)
+        modified = load_or_build(additional_directory=additional_dir)
+        assert os.stat(base_file).st_mtime_ns != base_stat
+
+        # and a forced rebuild always rebuilds the base
+        base_stat = os.stat(base_file).st_mtime_ns
+        load_or_build(force=True, additional_directory=additional_dir)
+        assert os.stat(base_file).st_mtime_ns != base_stat
+
+        loaded = load_or_build(force=False)
+        assert loaded.index.base
+
+        test_file = self.get_test_loc('additional_licenses/additional_license_directory_test.txt')
+        for license_cache in (built, rebuilt, loaded):
+            matches = license_cache.index.match(location=test_file)
+            assert [m.rule.license_expression for m in matches] == ['example1', 'example2']
+
+        # a builtin-only rebuild removes the stale base
+        load_or_build(force=True)
+        assert not os.path.exists(base_file)
+
     def test_load_index_with_corrupted_index(self):
         test_file = self.get_temp_file('test')
         with open(test_file, 'w') as tf:
@@ -7,8 +7,15 @@
 # See https://aboutcode.org for more information about nexB OSS projects.
 #
 
+import os
+import tempfile
 from unittest import TestCase
 
+from licensedcode.match_stats import MatchStats
+from licensedcode.match_stats import collecting_stats
+from packagedcode import licensing
+from packagedcode.licensing import LicenseStatementsMemo
+from packagedcode.licensing import get_license_matches_for_extracted_license_statement
 from packagedcode.licensing import get_only_expression_from_extracted_license
 
 
@@ -21,3 +28,50 @@ class TestLicensing(TestCase):
         assert get_only_expression_from_extracted_license('mit asasa or Apache-2.0') == 'mit OR apache-2.0'
         assert get_only_expression_from_extracted_license('') is None
         assert get_only_expression_from_extracted_license(None) is None
+
+    def test_LicenseStatementsMemo_is_bounded(self):
+        memo = LicenseStatementsMemo(max_size=2)
+        memo.put('a', [], False)
+        memo.put('b', [], False)
+        assert memo.get('a') == ((), False)
+        memo.put('c', [], True)
+        assert memo.get('b') is None
+        assert memo.get('a') == ((), False)
+        assert memo.get('c') == ((), True)
+        assert (memo.hits, memo.misses) == (3, 1)
+
+    def test_get_license_matches_for_extracted_license_statement_is_memoized(self):
+        memo = licensing.get_license_statements_memo()
+        hits = memo.hits
+        stats = MatchStats()
+        with collecting_stats(stats):
+            matches1, as_expression1 = get_license_matches_for_extracted_license_statement('mit or Apache-2.0')
+            matches2, as_expression2 = get_license_matches_for_extracted_license_statement('mit or Apache-2.0')
+        assert memo.hits == hits + 1
+        assert stats.memo_hits == 1
+        assert as_expression1 == as_expression2
+        assert [m.rule.identifier for m in matches1] == [m.rule.identifier for m in matches2]
+
+    def test_LicenseStatementsMemo_warm_start(self):
+        warm_start_location = os.path.join(tempfile.mkdtemp(), 'statements.jsonl')
+        memo = LicenseStatementsMemo(max_size=10, warm_start_location=warm_start_location)
+        memo.put((0, 'mit', True, True), [], False)
+        memo.put((0, 'bsd', True, True), [], False)
+        memo.put((0, 'mit', True, True), [], False)
+
+        saved_memo = licensing._license_statements_memo
+        licensing._license_statements_memo = memo = LicenseStatementsMemo(
+            max_size=10, warm_start_location=warm_start_location)
+        try:
+            memo.warm_start()
+            assert len(memo.results) == 2
+            assert memo.misses == 2
+            get_license_matches_for_extracted_license_statement('mit')
+            assert memo.hits == 1
+        finally:
+            licensing._license_statements_memo = saved_memo
+
+        with open(warm_start_location) as inp:
+            assert inp.read() == '["bsd", true, true]\n["mit", true, true]\n'
+        # the warm start files of processes are merged
+        assert os.listdir(os.path.dirname(warm_start_location)) == ['statements.jsonl']
@@ -8,10 +8,14 @@
 #
 
 import os
+from fnmatch import fnmatchcase
 
 from commoncode.testcase import FileBasedTesting
 
+from packagedcode import ALL_DATAFILE_HANDLERS
 from packagedcode import models
+from packagedcode.recognize import DatafileHandlersIndex
+from packagedcode.recognize import HANDLERS_INDEXES
 from packagedcode.recognize import recognize_package_data
 
 # TODO: this needs to be updated to use either a full scan of to use parse and assemble
@@ -202,3 +206,31 @@ class TestRecognize(FileBasedTesting):
         packages = recognize_package_data(test_file, system=True)
         assert packages
         assert isinstance(packages[0], models.PackageData)
+
+    def test_DatafileHandlersIndex_candidates_include_all_handlers_matching_path_patterns(self):
+        handlers_index = HANDLERS_INDEXES[id(ALL_DATAFILE_HANDLERS)]
+        for top, _dirs, files in os.walk(self.test_data_dir):
+            for name in files:
+                location = os.path.join(top, name)
+                candidates = handlers_index.get_candidates(location)
+                for handler in ALL_DATAFILE_HANDLERS:
+                    if any(fnmatchcase(location, pat) for pat in handler.path_patterns):
+                        assert handler in candidates, location
+
+    def test_DatafileHandlersIndex_get_candidates_by_name_extension_and_regex(self):
+        handlers_index = DatafileHandlersIndex(ALL_DATAFILE_HANDLERS)
+        candidates = handlers_index.get_candidates('/some/path/package.json')
+        assert 'npm_package_json' in [h.datasource_id for h in candidates]
+
+        candidates = handlers_index.get_candidates('/some/path/foo.gemspec')
+        assert 'gemspec' in [h.datasource_id for h in candidates]
+
+        candidates = handlers_index.get_candidates('/some/path/Podfile')
+        assert 'cocoapods_podfile' in [h.datasource_id for h in candidates]
+
+    def test_DatafileHandlersIndex_get_candidates_of_non_datafile_are_only_overriding_handlers(self):
+        handlers_index = DatafileHandlersIndex(ALL_DATAFILE_HANDLERS)
+        candidates = handlers_index.get_candidates('/some/path/foo.c')
+        base_is_datafile = models.DatafileHandler.is_datafile.__func__
+        assert candidates
+        assert all(h.is_datafile.__func__ is not base_is_datafile for h in candidates)
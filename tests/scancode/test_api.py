@@ -117,6 +117,24 @@ class TestAPI(FileBasedTesting):
         results = api.get_urls(test_file, threshold=0)
         assert results == expected
 
+    def test_get_emails_count(self):
+        test_file = self.get_test_loc('api/email/3w-xxxx.c')
+        results = api.get_emails_count(test_file)
+        assert results == dict(emails_count=3)
+
+    def test_get_urls_count(self):
+        test_file = self.get_test_loc('api/url/IMarkerActionFilter.java')
+        results = api.get_urls_count(test_file)
+        assert results == dict(urls_count=3)
+
+    def test_get_urls_with_threshold_reads_the_file_only_as_far_as_needed(self):
+        from textcode.analysis import extraction_context
+        test_file = self.get_test_loc('api/url/IMarkerActionFilter.java')
+        with extraction_context(test_file) as context:
+            results = api.get_urls(test_file, threshold=1)
+            assert [u['url'] for u in results['urls']] == ['http://www.eclipse.org/legal/epl-v10.html']
+            assert [ln for ln, _line in context._numbered_lines[False]] == [1, 2]
+
     def test_get_urls_with_threshold(self):
         test_file = self.get_test_loc('api/url/IMarkerActionFilter.java')
         expected = dict(urls=[
@@ -125,6 +143,34 @@ class TestAPI(FileBasedTesting):
         results = api.get_urls(test_file, threshold=1)
         assert results == expected
 
+    def test_get_emails_and_get_urls_share_a_single_pass(self):
+        from textcode.analysis import extraction_context
+        test_file = self.get_test_loc('api/url/IMarkerActionFilter.java')
+        expected_emails = api.get_emails(test_file)
+        expected_urls = api.get_urls(test_file, threshold=2)
+
+        with extraction_context(test_file) as context:
+            assert api.get_emails(test_file, with_urls=True, url_threshold=2) == expected_emails
+            assert context.memo == {
+                ('emails_and_urls', 50, 2): (expected_emails['emails'], expected_urls['urls'])
+            }
+            context.memo[('emails_and_urls', 50, 2)] = [], [dict(url='https://nexb.com')]
+            results = api.get_urls(test_file, threshold=2, with_emails=True)
+            assert results == dict(urls=[dict(url='https://nexb.com')])
+
+    def test_get_urls_with_emails_is_not_affected_by_an_interrupted_scan(self):
+        from cluecode import finder
+        from textcode.analysis import extraction_context
+        test_file = self.get_test_loc('api/url/IMarkerActionFilter.java')
+        expected_urls = api.get_urls(test_file)
+
+        with extraction_context(test_file) as context:
+            # a scan interrupted after reading the first lines
+            _emails, urls = finder.find_emails_and_urls(test_file)
+            assert next(urls)
+            assert not context.memo
+            assert api.get_urls(test_file, with_emails=True) == expected_urls
+
     def test_get_license_with_expression(self):
         test_file = self.get_test_loc('api/license/apache-1.0.txt')
         results = api.get_licenses(test_file)
@@ -22,6 +22,7 @@ from commoncode.system import on_windows
 from commoncode.system import py36
 from commoncode.system import py37
 
+from plugincode.scan import ScanPlugin
 from scancode.cli_test_utils import check_json_scan
 from scancode.cli_test_utils import load_json_result
 from scancode.cli_test_utils import load_json_result_from_string
@@ -306,6 +307,62 @@ def test_scan_works_with_multiple_processes():
     assert sorted(res1['files'], key=lambda x: tuple(x.items())) == sorted(res3['files'], key=lambda x: tuple(x.items()))
 
 
+def test_scan_works_with_multiple_processes_and_largest_first():
+    test_dir = test_env.get_test_loc('multiprocessing', copy=True)
+
+    result_file_1 = test_env.get_temp_file('json')
+    args = ['--copyright', '--processes', '1', test_dir, '--json', result_file_1]
+    run_scan_click(args)
+
+    result_file_2 = test_env.get_temp_file('json')
+    args = ['--copyright', '--processes', '2', '--largest-first', test_dir, '--json', result_file_2]
+    run_scan_click(args)
+    res1 = json.loads(open(result_file_1).read())
+    res2 = json.loads(open(result_file_2).read())
+    assert sorted(res1['files'], key=lambda x: tuple(x.items())) == sorted(res2['files'], key=lambda x: tuple(x.items()))
+
+
+def test_scan_with_scan_cache_reuses_cached_results(monkeypatch):
+    import scancode_config
+    cache_dir = test_env.get_temp_dir()
+    monkeypatch.setattr(scancode_config, 'scancode_cache_dir', cache_dir)
+    test_dir = test_env.get_test_loc('multiprocessing', copy=True)
+
+    result_file_1 = test_env.get_temp_file('json')
+    args = ['--copyright', '--info', '--scan-cache', test_dir, '--json', result_file_1]
+    result = run_scan_click(args)
+    assert 'Scan cache:     0 hit(s), 3 miss(es), hit rate: 0.0%' in result.output
+
+    result_file_2 = test_env.get_temp_file('json')
+    args = ['--copyright', '--info', '--scan-cache', test_dir, '--json', result_file_2]
+    result = run_scan_click(args)
+    assert 'Scan cache:     3 hit(s), 0 miss(es), hit rate: 100.0%' in result.output
+
+    res1 = json.loads(open(result_file_1).read())
+    res2 = json.loads(open(result_file_2).read())
+    assert res1['files'] == res2['files']
+
+
+def test_scan_with_dedupe_files_copies_results_to_duplicates():
+    test_dir = test_env.get_test_loc('multiprocessing', copy=True)
+    duplicate_dir = os.path.join(test_dir, 'duplicate')
+    os.makedirs(duplicate_dir)
+    fileutils.copyfile(os.path.join(test_dir, 'apache-1.0.txt'), duplicate_dir)
+
+    result_file_1 = test_env.get_temp_file('json')
+    args = ['--copyright', '--license', '--info', test_dir, '--json', result_file_1]
+    run_scan_click(args)
+
+    result_file_2 = test_env.get_temp_file('json')
+    args = ['--copyright', '--license', '--info', '--dedupe-files', '--processes', '2', test_dir, '--json', result_file_2]
+    result = run_scan_click(args)
+    assert 'Duplicates:     1 file(s) with the scan results of an identical file' in result.output
+
+    res1 = json.loads(open(result_file_1).read())
+    res2 = json.loads(open(result_file_2).read())
+    assert res1['files'] == res2['files']
+
+
 def test_scan_works_with_no_processes_in_threaded_mode():
     test_dir = test_env.get_test_loc('multiprocessing', copy=True)
 
@@ -781,6 +838,10 @@ def check_timings(expected, file_results):
 
         assert scan_timings
 
+        license_matching = scan_timings.pop('license_matching', None)
+        if license_matching and license_matching['queries']:
+            assert license_matching['matchers']
+
         for scanner, timing in scan_timings.items():
             assert scanner in expected
             assert timing
@@ -829,6 +890,69 @@ def test_get_displayable_summary():
     assert results == expected
 
 
+def test_get_displayable_summary_with_workers_startup():
+    from scancode.cli import get_displayable_summary
+    from commoncode.resource import Codebase
+
+    test_codebase = test_env.get_test_loc('summaries/client')
+    codebase = Codebase(test_codebase)
+    codebase.timings['scan'] = 0
+    codebase.counters['scan:workers_startup'] = {12: 0.5, 11: 0.25}
+    _errors, results = get_displayable_summary(codebase, 'foo', 2, [])
+    expected = [
+        '  workers_startup: 2 worker(s), max: 0.50s',
+        '    worker 11: 0.25s',
+        '    worker 12: 0.50s',
+    ]
+    assert results[-3:] == expected
+
+
+class FailingSetupPlugin(ScanPlugin):
+
+    def setup(self, **kwargs):
+        raise Exception('setup failed')
+
+
+def test_init_worker_ignores_failed_plugin_warmups():
+    import pickle
+    from functools import partial
+    from scancode import cli
+
+    warmed = []
+    warmups = [
+        partial(cli.setup_plugin, FailingSetupPlugin, verbose=True),
+        lambda: warmed.append(True),
+    ]
+    # warmups are picklable for spawned workers
+    assert pickle.loads(pickle.dumps(warmups[0])).keywords == {'verbose': True}
+
+    cli.init_worker(warmups=warmups)
+    assert warmed == [True]
+    pid, _startup = cli._worker_startup
+    assert pid == os.getpid()
+
+
+def test_scan_resource_reports_worker_startup_once():
+    import os
+    from scancode.cli import init_worker
+    from scancode.cli import scan_resource
+    from scancode.cli import WORKER_STARTUP
+
+    warmed = []
+    init_worker(warmups=[lambda: warmed.append(True)])
+    assert warmed == [True]
+
+    test_file = test_env.get_test_loc('summaries/client/Images/spinner.gif')
+    location_path = test_file, 'spinner.gif'
+    *_, timings = scan_resource(location_path, scanners=[], with_timing=True)
+    pid, startup = timings[WORKER_STARTUP]
+    assert pid == os.getpid()
+    assert startup >= 0
+
+    *_, timings = scan_resource(location_path, scanners=[], with_timing=True)
+    assert WORKER_STARTUP not in timings
+
+
 def test_display_summary_edge_case_scan_time_zero_should_not_fail():
     from io import StringIO
     import sys
@@ -0,0 +1,61 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+
+from commoncode.testcase import FileBasedTesting
+
+from scancode.duplicates import DuplicateFiles
+
+
+class TestDuplicateFiles(FileBasedTesting):
+    test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def test_DuplicateFiles_group(self):
+        test_dir = self.get_temp_dir()
+        files = [
+            ('a/LICENSE', 'some license'),
+            ('b/LICENSE', 'some license'),
+            ('c/LICENSE', 'other license'),
+            ('d/COPYING', 'some license'),
+            ('e/LICENSE', 'some license'),
+        ]
+        resources = []
+        for path, content in files:
+            location = os.path.join(test_dir, path)
+            os.makedirs(os.path.dirname(location))
+            with open(location, 'w') as out:
+                out.write(content)
+            resources.append((location, path))
+
+        duplicate_files = DuplicateFiles(scanner_names=['copyrights'], attributes=['copyrights'])
+        unique, duplicates = duplicate_files.group(iter(resources))
+
+        assert [p for _, p in unique] == ['a/LICENSE', 'c/LICENSE', 'd/COPYING']
+        assert [p for _, p in duplicates] == ['b/LICENSE', 'e/LICENSE']
+        expected = {'b/LICENSE': 'a/LICENSE', 'e/LICENSE': 'a/LICENSE'}
+        assert duplicate_files.representatives == expected
+
+    def test_DuplicateFiles_group_reuses_known_sha1(self):
+        test_dir = self.get_temp_dir()
+        resources = []
+        for path in ('a/LICENSE', 'b/LICENSE', 'c/LICENSE'):
+            location = os.path.join(test_dir, path)
+            os.makedirs(os.path.dirname(location))
+            with open(location, 'w') as out:
+                out.write('some license')
+            resources.append((location, path, None))
+
+        # a known SHA1 is trusted as-is rather than computed again
+        resources[-1] = resources[-1][0], resources[-1][1], 'not the content sha1'
+        duplicate_files = DuplicateFiles(scanner_names=['copyrights'], attributes=['copyrights'])
+        unique, duplicates = duplicate_files.group(resources)
+
+        assert [r[1] for r in unique] == ['a/LICENSE', 'c/LICENSE']
+        assert [r[1] for r in duplicates] == ['b/LICENSE']
@@ -0,0 +1,110 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+from functools import partial
+
+from commoncode.testcase import FileBasedTesting
+
+from scancode import Scanner
+from scancode.results_cache import ScanResultsCache
+from scancode.results_cache import get_config_key
+
+
+def scan(location, **kwargs):
+    return {}
+
+
+class TestResultsCache(FileBasedTesting):
+    test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def get_cache(self, max_size=1024 * 1024):
+        return ScanResultsCache(
+            cache_dir=self.get_temp_dir(),
+            scanner_names=['copyrights'],
+            config_key='key',
+            max_size=max_size,
+        )
+
+    def create_file(self, name, content):
+        location = os.path.join(self.get_temp_dir(), name)
+        with open(location, 'w') as out:
+            out.write(content)
+        return location
+
+    def test_ScanResultsCache_get_and_put(self):
+        cache = self.get_cache()
+        location = self.create_file('foo.c', 'some content')
+        assert cache.get(location) is None
+
+        results = {'copyrights': [{'copyright': 'Copyright foo', 'start_line': 1}]}
+        cache.put(location, results)
+        assert cache.get(location) == results
+
+    def test_ScanResultsCache_get_by_content_and_name(self):
+        cache = self.get_cache()
+        location = self.create_file('foo.c', 'some content')
+        results = {'copyrights': []}
+        cache.put(location, results)
+
+        same = self.create_file('foo.c', 'some content')
+        assert cache.get(same) == results
+
+        other_name = self.create_file('foo.h', 'some content')
+        assert cache.get(other_name) is None
+
+        other_content = self.create_file('foo.c', 'some other content')
+        assert cache.get(other_content) is None
+
+    def test_ScanResultsCache_uses_known_sha1(self):
+        from commoncode.hash import sha1
+        cache = self.get_cache()
+        location = self.create_file('foo.c', 'some content')
+        results = {'copyrights': []}
+        cache.put(location, results, content_sha1=sha1(location))
+        assert cache.get(location) == results
+
+        # a known SHA1 is used as-is without reading the file
+        missing = os.path.join(os.path.dirname(location), 'missing', 'foo.c')
+        assert cache.get(missing, content_sha1=sha1(location)) == results
+
+    def test_ScanResultsCache_get_missing_file_returns_none(self):
+        cache = self.get_cache()
+        assert cache.get(os.path.join(self.get_temp_dir(), 'missing')) is None
+
+    def test_ScanResultsCache_evict_removes_least_recently_used_entries(self):
+        cache = self.get_cache(max_size=250)
+        locations = []
+        for i in range(4):
+            location = self.create_file('foo.c', f'content {i}')
+            cache.put(location, {'copyrights': ['x' * 80]})
+            entry = cache.get_entry_location(location)
+            os.utime(entry, (i, i))
+            locations.append(location)
+
+        # use the oldest entry such that it is the most recently used
+        assert cache.get(locations[0])
+
+        assert cache.evict() == 2
+        assert cache.get(locations[0])
+        assert cache.get(locations[1]) is None
+        assert cache.get(locations[2]) is None
+        assert cache.get(locations[3])
+
+        assert cache.evict() == 0
+
+    def test_get_config_key_changes_with_scanners_options(self):
+        scanner1 = Scanner('copyrights', partial(scan, foo=1))
+        scanner2 = Scanner('copyrights', partial(scan, foo=2))
+        scanner3 = Scanner('emails', partial(scan, foo=1))
+        key1 = get_config_key([scanner1])
+        assert key1 == get_config_key([scanner1])
+        assert key1 != get_config_key([scanner2])
+        assert key1 != get_config_key([scanner1, scanner3])
+        assert key1 != get_config_key([scanner1], license_index_version='1')
@@ -0,0 +1,183 @@
+#
+# Copyright (c) nexB Inc. and others. All rights reserved.
+# ScanCode is a trademark of nexB Inc.
+# SPDX-License-Identifier: Apache-2.0
+# See http://www.apache.org/licenses/LICENSE-2.0 for the license text.
+# See https://github.com/nexB/scancode-toolkit for support or download.
+# See https://aboutcode.org for more information about nexB OSS projects.
+#
+
+import os
+import time
+
+from commoncode.testcase import FileBasedTesting
+
+from scancode import scheduler
+from scancode.pool import get_pool
+from scancode.scheduler import AdaptiveBatcher
+from scancode.scheduler import BatchedScans
+from scancode.scheduler import get_scan_cost
+from scancode.scheduler import order_by_cost
+
+
+def scan_batch(locations_paths):
+    return [(location, path, [], 0.001, {}, {}) for location, path in locations_paths]
+
+
+def scan_batch_failing_or_stuck(locations_paths):
+    for location, path in locations_paths:
+        if path == 'file0':
+            raise Exception('failed')
+        if path == 'file1':
+            time.sleep(30)
+    return scan_batch(locations_paths)
+
+
+class TestScheduler(FileBasedTesting):
+    test_data_dir = os.path.join(os.path.dirname(__file__), 'data')
+
+    def get_resources(self, sizes):
+        test_dir = self.get_temp_dir()
+        resources = []
+        for i, size in enumerate(sizes):
+            location = os.path.join(test_dir, f'file{i}')
+            with open(location, 'wb') as out:
+                out.write(b'x' * size)
+            resources.append((location, f'file{i}'))
+        return resources
+
+    def get_batches(self, batcher):
+        batches = []
+        while True:
+            next_batch = batcher.next_batch()
+            if not next_batch:
+                return batches
+            batch, is_large = next_batch
+            batches.append(([path for _, path in batch], is_large))
+
+    def test_AdaptiveBatcher_starts_with_single_files(self):
+        resources = self.get_resources([10, 10, 10])
+        batcher = AdaptiveBatcher(resources)
+        expected = [
+            (['file0'], False),
+            (['file1'], False),
+            (['file2'], False),
+        ]
+        assert self.get_batches(batcher) == expected
+
+    def test_AdaptiveBatcher_grows_batches_for_fast_files(self):
+        resources = self.get_resources([10] * 12)
+        batcher = AdaptiveBatcher(resources, max_batch_files=5, target_duration=1)
+        batcher.observe(0.01)
+        assert batcher.batch_files == 5
+        batches = self.get_batches(batcher)
+        assert [len(paths) for paths, _ in batches] == [5, 5, 2]
+
+    def test_AdaptiveBatcher_shrinks_batches_for_slow_files(self):
+        batcher = AdaptiveBatcher([], target_duration=1)
+        batcher.observe(0.01)
+        assert batcher.batch_files == 100
+        for _ in range(20):
+            batcher.observe(2)
+        assert batcher.batch_files == 1
+
+    def test_AdaptiveBatcher_scans_large_files_alone(self):
+        resources = self.get_resources([10, 10, 200, 10, 10])
+        batcher = AdaptiveBatcher(
+            resources,
+            large_file_size=100,
+            max_batch_files=10,
+        )
+        batcher.batch_files = 10
+        expected = [
+            (['file0', 'file1'], False),
+            (['file2'], True),
+            (['file3', 'file4'], False),
+        ]
+        assert self.get_batches(batcher) == expected
+
+    def test_AdaptiveBatcher_caps_batch_cumulative_size(self):
+        resources = self.get_resources([40, 40, 40, 40, 40])
+        batcher = AdaptiveBatcher(
+            resources,
+            large_file_size=100,
+            max_batch_size=100,
+            max_batch_files=10,
+        )
+        batcher.batch_files = 10
+        expected = [
+            (['file0', 'file1'], False),
+            (['file2', 'file3'], False),
+            (['file4'], False),
+        ]
+        assert self.get_batches(batcher) == expected
+
+    def test_get_scan_cost_text_is_costlier_than_binary_of_same_size(self):
+        test_dir = self.get_temp_dir()
+        text = os.path.join(test_dir, 'text')
+        with open(text, 'wb') as out:
+            out.write(b'some line\n' * 100)
+        binary = os.path.join(test_dir, 'binary')
+        with open(binary, 'wb') as out:
+            out.write(b'some\x00line\n' * 100)
+        assert get_scan_cost(text) > get_scan_cost(binary) > 0
+
+    def test_get_scan_cost_of_empty_or_missing_file_is_zero(self):
+        test_dir = self.get_temp_dir()
+        empty = os.path.join(test_dir, 'empty')
+        open(empty, 'wb').close()
+        assert get_scan_cost(empty) == 0
+        assert get_scan_cost(os.path.join(test_dir, 'missing')) == 0
+
+    def test_order_by_cost_returns_costliest_first(self):
+        resources = self.get_resources([10, 1000, 0, 100])
+        results = [path for _, path in order_by_cost(resources)]
+        assert results == ['file1', 'file3', 'file0', 'file2']
+
+    def test_BatchedScans_returns_all_results(self):
+        resources = self.get_resources([10] * 50 + [200] + [10] * 50)
+        batcher = AdaptiveBatcher(resources, large_file_size=100)
+        pool = get_pool(processes=2)
+        try:
+            scans = BatchedScans(
+                pool=pool,
+                func=scan_batch,
+                batcher=batcher,
+                max_pending=4,
+            )
+            results = sorted(path for _, path, _, _, _, _ in scans)
+        finally:
+            pool.terminate()
+
+        assert results == sorted(path for _, path in resources)
+        assert batcher.batch_files > 1
+
+    def test_BatchedScans_returns_errors_for_failed_and_timed_out_batches(self):
+        resources = self.get_resources([10] * 6)
+        batcher = AdaptiveBatcher(resources)
+        pool = get_pool(processes=2)
+        batch_timeout_slack = scheduler.BATCH_TIMEOUT_SLACK
+        try:
+            scheduler.BATCH_TIMEOUT_SLACK = 0
+            scans = BatchedScans(
+                pool=pool,
+                func=scan_batch_failing_or_stuck,
+                batcher=batcher,
+                max_pending=2,
+                file_timeout=2,
+            )
+            assert scans.get_timeout() == 2
+            results = sorted((path, bool(errors)) for _, path, errors, _, _, _ in scans)
+        finally:
+            scheduler.BATCH_TIMEOUT_SLACK = batch_timeout_slack
+            pool.terminate()
+
+        expected = [
+            ('file0', True),
+            ('file1', True),
+            ('file2', False),
+            ('file3', False),
+            ('file4', False),
+            ('file5', False),
+        ]
+        assert results == expected
@@ -17,7 +17,9 @@ from commoncode.fileutils import resource_iter
 from commoncode.testcase import FileBasedTesting
 
 from scancode_config import REGEN_TEST_FIXTURES
+from textcode import analysis
 from textcode.analysis import as_unicode
+from textcode.analysis import extraction_context
 from textcode.analysis import numbered_text_lines
 from textcode.analysis import unicode_text_lines
 
@@ -163,3 +165,95 @@ class TestAnalysis(FileBasedTesting):
         from_string = list(numbered_text_lines(location=text.splitlines(True)))
         assert from_string == from_file
 
+
+    def test_extraction_context_returns_same_lines_as_numbered_text_lines(self):
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        expected = list(numbered_text_lines(location=test_file))
+        with extraction_context(test_file) as context:
+            first = list(numbered_text_lines(location=test_file))
+            second = list(numbered_text_lines(location=test_file, start_line=3))
+            cached = context._numbered_lines[False]
+        assert first == expected
+        assert second == [(ln + 2, l) for ln, l in expected]
+        assert cached == expected
+
+    def test_extraction_context_extracts_lines_only_as_far_as_needed(self):
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        expected = list(numbered_text_lines(location=test_file))
+        with extraction_context(test_file) as context:
+            first = numbered_text_lines(location=test_file)
+            assert [next(first), next(first)] == expected[:2]
+            assert context._numbered_lines[False] == expected[:2]
+            assert list(numbered_text_lines(location=test_file)) == expected
+            assert list(first) == expected[2:]
+            assert context._numbered_lines[False] == expected
+
+    def test_extraction_context_lines_can_be_read_from_several_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        expected = list(numbered_text_lines(location=test_file))
+        with extraction_context(test_file) as context:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(
+                    lambda _: list(context.numbered_text_lines()), range(8)))
+        assert results == [expected] * 8
+
+    def test_extraction_context_extracts_lines_again_after_a_failure(self):
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        expected = list(numbered_text_lines(location=test_file))
+        with extraction_context(test_file) as context:
+            first = numbered_text_lines(location=test_file)
+            assert next(first) == expected[0]
+
+            def failing_lines():
+                raise KeyboardInterrupt
+                yield
+
+            context._unread_numbered_lines[False] = failing_lines()
+            second = numbered_text_lines(location=test_file)
+            assert next(second) == expected[0]
+            try:
+                next(second)
+                raise Exception('KeyboardInterrupt not raised')
+            except KeyboardInterrupt:
+                pass
+            assert not context._numbered_lines
+            assert list(first) == expected[1:]
+
+    def test_extraction_context_returns_same_demarkup_lines_as_numbered_text_lines(self):
+        test_file = self.get_test_loc('markup/Label.html')
+        expected_plain = list(numbered_text_lines(location=test_file))
+        expected_demarkup = list(numbered_text_lines(location=test_file, demarkup=True))
+        assert expected_plain != expected_demarkup
+        with extraction_context(test_file):
+            assert list(numbered_text_lines(location=test_file, demarkup=True)) == expected_demarkup
+            assert list(numbered_text_lines(location=test_file)) == expected_plain
+
+    def test_unicode_text_lines_are_the_same_when_read_in_blocks(self):
+        test_file = self.get_temp_file()
+        with open(test_file, 'wb') as tf:
+            tf.write(b'first\r\nsecond\rthird\n\nfourth line\r\n' * 10 + b'last')
+        expected = [as_unicode(l) for l in open(test_file, 'rb').read().splitlines(True)]
+        for block_size in (1, 2, 3, 7, 1024):
+            result = list(analysis._unicode_text_lines(test_file, block_size=block_size))
+            assert result == expected
+
+    def test_extraction_context_does_not_keep_lines_of_large_files(self):
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        expected = list(numbered_text_lines(location=test_file))
+        max_shared_text_size = analysis.MAX_SHARED_TEXT_SIZE
+        try:
+            analysis.MAX_SHARED_TEXT_SIZE = 10
+            with extraction_context(test_file) as context:
+                assert list(numbered_text_lines(location=test_file)) == expected
+                assert not context._numbered_lines
+        finally:
+            analysis.MAX_SHARED_TEXT_SIZE = max_shared_text_size
+
+    def test_extraction_context_is_not_used_for_other_locations(self):
+        test_file = self.get_test_loc('analysis/gpl-2.0-freertos.RULE')
+        other_file = self.get_test_loc('analysis/bsd-new')
+        expected = list(numbered_text_lines(location=other_file))
+        with extraction_context(test_file) as context:
+            assert list(numbered_text_lines(location=other_file)) == expected
+            assert not context._numbered_lines
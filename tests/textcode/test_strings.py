@@ -180,3 +180,55 @@ class TestStrings(FileBasedTesting):
         test_file = 'strings/with-lf/strings.exe'
         expected_file = 'strings/with-lf/strings.exe.results'
         self.check_file_strings(test_file, expected_file, regen=REGEN_TEST_FIXTURES)
+
+    def test_strings_from_file_extracts_strings_straddling_chunks(self):
+        test_file = self.get_temp_file()
+        with open(test_file, 'wb') as tf:
+            for i in range(50):
+                tf.write(b'\x01\x02' * i + b'Copyright Acme %d' % i)
+                tf.write(b'\x01' + 'Wide Acme Inc.'.encode('utf-16-le'))
+        expected = list(strings.strings_from_file(test_file))
+        assert len(expected) == 100
+        for buff_size in (41, 64, 65, 100):
+            assert list(strings.strings_from_file(test_file, buff_size=buff_size)) == expected
+
+    def test_strings_from_file_with_max_bytes(self):
+        test_file = self.get_temp_file()
+        with open(test_file, 'wb') as tf:
+            tf.write(b'Copyright head\x00')
+            tf.write(b'\x01' * 10000)
+            tf.write(b'\x00Copyright middle\x00')
+            tf.write(b'\x01' * 10000)
+            tf.write(b'\x00Copyright tail')
+        expected = ['Copyright head', 'Copyright middle', 'Copyright tail']
+        assert list(strings.strings_from_file(test_file)) == expected
+        result = list(strings.strings_from_file(test_file, max_bytes=1000))
+        assert result == ['Copyright head', 'Copyright tail']
+
+    def test_strings_from_file_with_empty_file(self):
+        test_file = self.get_temp_file()
+        open(test_file, 'wb').close()
+        assert list(strings.strings_from_file(test_file)) == []
+
+    def test_strings_from_file_can_stop_early(self):
+        test_file = self.get_test_loc('strings/bin/ia32_exec')
+        results = strings.strings_from_file(test_file)
+        assert next(results)
+        results.close()
+
+    def test_strings_from_file_reads_files_that_cannot_be_mapped(self):
+        test_file = self.get_test_loc('strings/bin/ia32_exec')
+        expected = list(strings.strings_from_file(test_file))
+        expected_sampled = list(strings.strings_from_file(test_file, max_bytes=100000))
+
+        def mmap_failure(*args, **kwargs):
+            raise OSError('cannot map')
+
+        mmap = strings.mmap.mmap
+        try:
+            strings.mmap.mmap = mmap_failure
+            assert list(strings.strings_from_file(test_file, buff_size=4096)) == expected
+            result = list(strings.strings_from_file(test_file, max_bytes=100000))
+            assert result == expected_sampled
+        finally:
+            strings.mmap.mmap = mmap